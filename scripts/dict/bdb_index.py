@@ -0,0 +1,214 @@
+"""
+Inverted index over the Brown-Driver-Briggs XML
+
+Built in a single pass over every BDB <entry>. Maps each normalized Hebrew
+form (nikud and marks stripped) to the entries that contain it, recording
+whether the form is a direct headword <w> of the entry or only a nested
+mention, together with the entry's precomputed definition count and type.
+find_entry() then ranks just those candidates with the same rules the
+original linear scan in find_bdb_entry used. Entries are also indexed by
+their BDB id for exact lookups (see lexical_index.py).
+"""
+
+import sys
+import xml.etree.ElementTree as ET
+from typing import Dict, List, NamedTuple, Optional
+
+from config import config
+
+# Shared Hebrew normalization kernel
+if str(config.STRONG_SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(config.STRONG_SCRIPTS_DIR))
+from hebrew_normalize import normalize
+
+NS = {'bdb': 'http://openscriptures.github.com/morphhb/namespace'}
+ENTRY_TAG = f"{{{NS['bdb']}}}entry"
+
+# Score bonus for entries where the word is a direct headword
+MAIN_WORD_BONUS = 1000
+
+
+class BDBCandidate(NamedTuple):
+    """One entry containing a normalized Hebrew form"""
+    position: int        # Document order of the entry
+    entry: ET.Element
+    is_main: bool        # Form is a direct <w> child (headword)
+    def_count: int       # Non-empty <def> elements (direct + inside senses)
+    is_root: bool        # Entry has type="root"
+
+
+def count_definitions(entry: ET.Element) -> int:
+    """
+    Count non-empty definitions of an entry.
+
+    Direct <def> children plus every <def> below each <sense> (so defs in
+    nested senses are counted once per enclosing sense, as find_bdb_entry
+    always did).
+    """
+    def_elements = entry.findall('./bdb:def', NS)
+    def_count = len([d for d in def_elements if d.text and d.text.strip()])
+    for sense in entry.findall('.//bdb:sense', NS):
+        sense_defs = sense.findall('.//bdb:def', NS)
+        def_count += len([d for d in sense_defs if d.text and d.text.strip()])
+    return def_count
+
+
+class BDBIndex:
+    """
+    Normalized lemma -> candidate entries, in document order.
+    """
+
+    def __init__(self, root_element: ET.Element, table: Optional[Dict] = None):
+        """
+        Build the index in one pass over the BDB XML.
+
+        Args:
+            root_element: BDB XML root element
+            table: Previously exported index table (see to_table) to restore
+                instead of rebuilding
+        """
+        self.root_element = root_element
+        self.by_lemma: Dict[str, List[BDBCandidate]] = {}
+        self.by_id: Dict[str, ET.Element] = {}
+        self.entry_count = 0
+
+        if table is not None:
+            self._restore(table)
+            return
+
+        for position, entry in enumerate(root_element.iter(ENTRY_TAG)):
+            self.entry_count += 1
+            self._add_id(entry)
+            direct = {normalize(w.text, 'marks') for w in entry.findall('./bdb:w', NS) if w.text}
+            nested = {normalize(w.text, 'marks') for w in entry.findall('.//bdb:w', NS) if w.text}
+            if not nested:
+                continue
+
+            def_count = count_definitions(entry)
+            is_root = entry.get('type') == 'root'
+            for form in nested:
+                candidate = BDBCandidate(position, entry, form in direct, def_count, is_root)
+                self.by_lemma.setdefault(form, []).append(candidate)
+
+    def to_table(self) -> Dict:
+        """Export the index without element references (picklable, compact)"""
+        return {
+            'entry_count': self.entry_count,
+            'by_lemma': {
+                form: [(c.position, c.is_main, c.def_count, c.is_root) for c in candidates]
+                for form, candidates in self.by_lemma.items()
+            },
+        }
+
+    def _restore(self, table: Dict):
+        """Rebind an exported table to the entries of this tree (by document order)"""
+        entries = list(self.root_element.iter(ENTRY_TAG))
+        if len(entries) != table['entry_count']:
+            raise ValueError("BDB index table does not match the XML tree")
+
+        self.entry_count = len(entries)
+        for entry in entries:
+            self._add_id(entry)
+        self.by_lemma = {
+            form: [BDBCandidate(position, entries[position], is_main, def_count, is_root)
+                   for position, is_main, def_count, is_root in rows]
+            for form, rows in table['by_lemma'].items()
+        }
+
+    def _add_id(self, entry: ET.Element):
+        """Index an entry by its BDB id (first occurrence wins)"""
+        entry_id = entry.get('id')
+        if entry_id and entry_id not in self.by_id:
+            self.by_id[entry_id] = entry
+
+    def candidates(self, hebrew_word: str) -> List[BDBCandidate]:
+        """Entries containing a Hebrew word (any pointing), in document order"""
+        return self.by_lemma.get(normalize(hebrew_word, 'marks'), [])
+
+    def find_entry(self, hebrew_word: str, include_roots: bool = False) -> Optional[ET.Element]:
+        """
+        Find the best BDB entry for a Hebrew word.
+
+        Ranking (identical to the original linear scan):
+        - type="root" entries are skipped unless include_roots is set
+        - headword matches score MAIN_WORD_BONUS + definitions (root entries
+          score their definition count only)
+        - nested mentions score their definition count
+        - the first entry with the strictly highest positive score wins
+
+        Args:
+            hebrew_word: Hebrew word to search for
+            include_roots: Also consider root-type entries
+
+        Returns:
+            Best matching entry element or None
+        """
+        best_entry = None
+        best_score = 0
+
+        for candidate in self.candidates(hebrew_word):
+            if candidate.is_root and not include_roots:
+                continue
+
+            if candidate.is_main and not candidate.is_root:
+                score = MAIN_WORD_BONUS + candidate.def_count
+            else:
+                score = candidate.def_count
+
+            if score > best_score:
+                best_entry = candidate.entry
+                best_score = score
+
+        return best_entry
+
+    def find_by_ids(self, bdb_ids: List[str], hebrew_word: str = '') -> Optional[ET.Element]:
+        """
+        Pick the entry for a Strong's number from its crosswalk BDB ids.
+
+        A single id resolves directly. Augmented Strong's numbers map to
+        several entries; those are ranked like find_entry (headword equal to
+        the Hebrew word gets MAIN_WORD_BONUS, then definition count) without
+        skipping root entries, and the first highest score wins.
+
+        Args:
+            bdb_ids: BDB entry ids from the crosswalk
+            hebrew_word: Strong's lemma, used to break ties between entries
+
+        Returns:
+            Entry element, or None if no id is present in this tree
+        """
+        entries = [self.by_id[bdb_id] for bdb_id in bdb_ids if bdb_id in self.by_id]
+        if len(entries) <= 1:
+            return entries[0] if entries else None
+
+        lemma = normalize(hebrew_word, 'marks') if hebrew_word else ''
+        best_entry = None
+        best_score = -1
+        for entry in entries:
+            score = count_definitions(entry)
+            if lemma and any(w.text and normalize(w.text, 'marks') == lemma
+                             for w in entry.findall('./bdb:w', NS)):
+                score += MAIN_WORD_BONUS
+            if score > best_score:
+                best_entry = entry
+                best_score = score
+
+        return best_entry
+
+
+# Index of the most recently used BDB tree
+_bdb_index: Optional[BDBIndex] = None
+
+
+def get_bdb_index(root_element: ET.Element, table: Optional[Dict] = None) -> BDBIndex:
+    """
+    Get the index for a BDB root element (built once per tree).
+
+    Args:
+        root_element: BDB XML root element
+        table: Optional exported index table to restore instead of rebuilding
+    """
+    global _bdb_index
+    if _bdb_index is None or _bdb_index.root_element is not root_element:
+        _bdb_index = BDBIndex(root_element, table)
+    return _bdb_index
@@ -10,6 +10,7 @@ Supports testing mode with 1% of data for development and validation.
 
 import argparse
 import json
+import multiprocessing
 import re
 import sys
 from pathlib import Path
@@ -21,6 +22,13 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from config import config
 
+# Shared Hebrew normalization kernel
+sys.path.append(str(config.STRONG_SCRIPTS_DIR))
+from hebrew_normalize import normalize
+from bdb_index import get_bdb_index
+from lexicon_sources import get_lexicon_sources
+from lexicon_manifest import LexiconManifest, entry_input_hashes
+
 # Import extraction functions
 sys.path.insert(0, str(config.OE_DIR))
 try:
@@ -37,6 +45,9 @@ NS = {'bdb': 'http://openscriptures.github.com/morphhb/namespace'}
 consolidated_roots = {}
 consolidated_words = {}
 
+# Entries between aggregated progress lines in --jobs mode
+PROGRESS_INTERVAL = 250
+
 
 def save_consolidated_files(testing_mode: bool = False) -> None:
     """Save consolidated lexicon files in the new format."""
@@ -62,6 +73,50 @@ def save_consolidated_files(testing_mode: bool = False) -> None:
         print(f"✅ Saved {len(consolidated_words)} word entries")
 
 
+def patch_consolidated_files(rebuilt: List[str]) -> None:
+    """
+    Patch the consolidated lexicon files in place after an incremental run.
+
+    Only the rebuilt Strong's numbers are replaced; every other entry in
+    words.json / roots.json is kept as is. An entry that moved between words
+    and roots is removed from the file it no longer belongs to, and a number
+    whose rebuild failed keeps its previous entry.
+
+    Args:
+        rebuilt: Strong's numbers rebuilt in this run
+    """
+    lexicon_dir = config.LEXICON_DIR
+
+    for filename, built, other in (('words.json', consolidated_words, consolidated_roots),
+                                   ('roots.json', consolidated_roots, consolidated_words)):
+        path = lexicon_dir / filename
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        elif built:
+            data = {}
+        else:
+            continue
+
+        changed = 0
+        for strong_number in rebuilt:
+            if strong_number in built:
+                data[strong_number] = built[strong_number]
+                changed += 1
+            elif strong_number in data and strong_number in other:
+                # Now saved in the other file
+                del data[strong_number]
+                changed += 1
+
+        if not changed:
+            continue
+
+        print(f"💾 Patching {changed} entries in {path}...")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        print(f"✅ {filename} now holds {len(data)} entries")
+
+
 def create_definition(text_en: str, source: str, order: int, sense: Optional[str] = None) -> Dict:
     """
     Create a definition object
@@ -91,30 +146,18 @@ def create_definition(text_en: str, source: str, order: int, sense: Optional[str
 
 
 def load_strongs_data() -> Dict:
-    """Load Strong's dictionary data"""
-    if config.STRONGS_FILE.exists():
-        with open(config.STRONGS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Load Strong's dictionary data (shared, loaded once per run)"""
+    return get_lexicon_sources().strongs
 
 
 def load_strong_refs() -> Dict:
-    """Load Strong's references data"""
-    if config.STRONG_REFS_FILE.exists():
-        with open(config.STRONG_REFS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Load Strong's references data (shared, loaded once per run)"""
+    return get_lexicon_sources().refs
 
 
 def load_bdb_xml():
-    """Load BDB XML file"""
-    if not config.BDB_XML.exists():
-        return None
-    try:
-        tree = ET.parse(config.BDB_XML)
-        return tree.getroot()
-    except Exception:
-        return None
+    """Load BDB XML file (shared, parsed once per run)"""
+    return get_lexicon_sources().bdb_root
 
 
 def normalize_definition_text(text: str) -> str:
@@ -122,10 +165,15 @@ def normalize_definition_text(text: str) -> str:
     return re.sub(r'\s+', ' ', text.strip().lower())
 
 
-def find_bdb_entry(hebrew_word: str, root_element, include_roots: bool = False) -> Optional[ET.Element]:
+def find_bdb_entry(hebrew_word: str, root_element, include_roots: bool = False,
+                   strong_number: Optional[str] = None) -> Optional[ET.Element]:
     """
     Find BDB entry for a Hebrew word
 
+    When a Strong's number is given and LexicalIndex.xml maps it to BDB ids,
+    the entry is resolved by id (lexical_index.py) and the lemma search below
+    is only the fallback for unmapped numbers.
+
     IMPROVED LOGIC (to avoid etymological errors):
     - Skips entries with type="root" (etymological discussions) by default
     - Prioritizes entries where Hebrew word is a direct child (main word)
@@ -136,70 +184,39 @@ def find_bdb_entry(hebrew_word: str, root_element, include_roots: bool = False)
     This prevents selecting etymological root entries that mention the word
     but don't actually define it (e.g., H430 was incorrectly using a.dl.aa
     etymological entry instead of a.dl.ad actual word entry).
+
+    Candidates come from the inverted BDB index (bdb_index.py), built once
+    per XML tree, instead of a scan over every entry.
     """
     if root_element is None:
         return None
 
-    hebrew_normalized = re.sub(r'[\u0591-\u05C7]', '', hebrew_word)
-    entries = root_element.findall('.//bdb:entry', NS)
+    index = get_bdb_index(root_element)
+    if strong_number:
+        entry = index.find_by_ids(get_lexicon_sources().crosswalk.bdb_ids(strong_number), hebrew_word)
+        if entry is not None:
+            return entry
 
-    best_entry = None
-    best_def_count = 0
+    return index.find_entry(hebrew_word, include_roots)
 
-    for entry in entries:
-        # Skip root entries (etymological discussions) unless explicitly requested
-        if entry.get('type') == 'root' and not include_roots:
-            continue
 
-        # Check direct children first (main word)
-        direct_w_elements = entry.findall('./bdb:w', NS)
-        is_main_word = False
-        for w in direct_w_elements:
-            if w.text:
-                w_normalized = re.sub(r'[\u0591-\u05C7]', '', w.text)
-                if w_normalized == hebrew_normalized:
-                    is_main_word = True
-                    break
-
-        # Also check nested (mentioned in text)
-        if not is_main_word:
-            nested_w_elements = entry.findall('.//bdb:w', NS)
-            for w in nested_w_elements:
-                if w.text:
-                    w_normalized = re.sub(r'[\u0591-\u05C7]', '', w.text)
-                    if w_normalized == hebrew_normalized:
-                        # Count definitions
-                        def_elements = entry.findall('./bdb:def', NS)
-                        def_count = len([d for d in def_elements if d.text and d.text.strip()])
-                        for sense in entry.findall('.//bdb:sense', NS):
-                            sense_defs = sense.findall('.//bdb:def', NS)
-                            def_count += len([d for d in sense_defs if d.text and d.text.strip()])
-
-                        score = def_count
-                        if score > best_def_count:
-                            best_entry = entry
-                            best_def_count = score
-                        break
-
-        if is_main_word:
-            # Count definitions
-            def_elements = entry.findall('./bdb:def', NS)
-            def_count = len([d for d in def_elements if d.text and d.text.strip()])
-            for sense in entry.findall('.//bdb:sense', NS):
-                sense_defs = sense.findall('.//bdb:def', NS)
-                def_count += len([d for d in sense_defs if d.text and d.text.strip()])
-
-            # Main word gets +1000 bonus (unless it's a root entry, then use actual count)
-            if entry.get('type') == 'root':
-                score = def_count
-            else:
-                score = 1000 + def_count
-
-            if score > best_def_count:
-                best_entry = entry
-                best_def_count = score
+def count_bdb_resolution(strong_numbers: List[str]) -> Dict[str, int]:
+    """
+    Count how the BDB entry of each Strong's number is resolved.
 
-    return best_entry
+    Returns:
+        Dictionary with 'exact' (LexicalIndex crosswalk), 'fallback'
+        (lemma search) and 'none' counts
+    """
+    sources = get_lexicon_sources()
+    counts = {'exact': 0, 'fallback': 0, 'none': 0}
+    for strong_number in strong_numbers:
+        lemma = sources.strongs.get(strong_number, {}).get('lemma', '')
+        _, method = sources.resolve_bdb_entry(strong_number, lemma, include_roots=False)
+        if method == 'none':
+            _, method = sources.resolve_bdb_entry(strong_number, lemma, include_roots=True)
+        counts[method] += 1
+    return counts
 
 
 def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb_root) -> List[Dict]:
@@ -228,7 +245,7 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     if not hebrew_word:
         return definitions
 
-    hebrew_normalized = re.sub(r'[\u0591-\u05C7]', '', hebrew_word)
+    hebrew_normalized = normalize(hebrew_word, 'marks')
 
     bdb_data = None
 
@@ -240,19 +257,19 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     if not bdb_data or not bdb_data.get('definitions'):
         if bdb_root is not None:
             # First try without root entries (normal case)
-            bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False)
+            bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False, strong_number=strong_number)
             # If not found, try with root entries (for words like H776)
             if not bdb_entry:
-                bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True)
+                bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True, strong_number=strong_number)
 
             if bdb_entry:
                 # Find the correct Hebrew word element (prefer longer/matching one)
                 w_elements = bdb_entry.findall('.//bdb:w', NS)
                 bdb_hebrew = ''
-                hebrew_normalized = re.sub(r'[\u0591-\u05C7]', '', hebrew_word)
+                hebrew_normalized = normalize(hebrew_word, 'marks')
                 for w_elem in w_elements:
                     if w_elem.text:
-                        w_normalized = re.sub(r'[\u0591-\u05C7]', '', w_elem.text)
+                        w_normalized = normalize(w_elem.text, 'marks')
                         if w_normalized == hebrew_normalized or len(w_normalized) >= len(hebrew_normalized):
                             bdb_hebrew = w_elem.text
                             break
@@ -341,10 +358,11 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     if isinstance(bdb_data, list):
         bdb_entry = bdb_data[0] if bdb_data else {}
 
-    # Verify Hebrew word matches
+    # Verify Hebrew word matches (not needed when resolved by Strong's number)
     bdb_hebrew = bdb_entry.get('hebrew', '')
-    if bdb_hebrew:
-        bdb_normalized = re.sub(r'[\u0591-\u05C7]', '', bdb_hebrew)
+    exact_match = bdb_entry.get('id') in get_lexicon_sources().crosswalk.bdb_ids(strong_number)
+    if bdb_hebrew and not exact_match:
+        bdb_normalized = normalize(bdb_hebrew, 'marks')
         if bdb_normalized != hebrew_normalized:
             if hebrew_normalized not in bdb_normalized or len(bdb_normalized) > len(hebrew_normalized) + 2:
                 return definitions
@@ -352,9 +370,9 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     # Build sense mapping from BDB XML if available
     sense_mapping = {}
     if bdb_root:
-        xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False)
+        xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False, strong_number=strong_number)
         if not xml_entry:
-            xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True)
+            xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True, strong_number=strong_number)
         if xml_entry:
             sense_mapping = build_sense_mapping(xml_entry)
 
@@ -487,8 +505,8 @@ def build_lexicon_entry(strong_number: str, bdb_root, update_existing: bool = Fa
     Returns:
         Complete lexicon entry dictionary
     """
-    strongs_data = load_strongs_data()
-    strong_refs = load_strong_refs()
+    sources = get_lexicon_sources()
+    strongs_data = sources.strongs
 
     # Determine output directories
     if testing_mode:
@@ -514,7 +532,7 @@ def build_lexicon_entry(strong_number: str, bdb_root, update_existing: bool = Fa
     entry = {
         "strong_number": strong_number,
         "lemma": strongs_entry.get('lemma', ''),
-        "normalized": existing_entry.get('normalized', re.sub(r'[\u0591-\u05C7]', '', strongs_entry.get('lemma', ''))),
+        "normalized": existing_entry.get('normalized', normalize(strongs_entry.get('lemma', ''), 'marks')),
         "pronunciation": strongs_entry.get('pron', ''),
         "transliteration": existing_entry.get('transliteration', strongs_entry.get('xlit', '')),
         "definitions": [],
@@ -532,21 +550,8 @@ def build_lexicon_entry(strong_number: str, bdb_root, update_existing: bool = Fa
         entry["sources"]["bdb"] = True
         entry["definitions"].extend(bdb_definitions)
 
-    # Add occurrences
-    refs_data = None
-    if strong_number in strong_refs:
-        refs_data = strong_refs[strong_number]
-    else:
-        num_part = strong_number[1:]
-        padded_formats = [
-            f"H{num_part.zfill(4)}",
-            f"H{num_part.zfill(3)}",
-            f"H{num_part.zfill(2)}",
-        ]
-        for fmt in padded_formats:
-            if fmt in strong_refs:
-                refs_data = strong_refs[fmt]
-                break
+    # Add occurrences (zero-padded ref IDs are resolved when sources load)
+    refs_data = sources.get_refs(strong_number)
 
     if refs_data:
         refs = refs_data.get('references', [])
@@ -584,7 +589,8 @@ def build_lexicon_entry(strong_number: str, bdb_root, update_existing: bool = Fa
     return entry
 
 
-def save_lexicon_entry(entry: Dict, testing_mode: bool = False, consolidate: bool = True) -> Path:
+def save_lexicon_entry(entry: Dict, testing_mode: bool = False, consolidate: bool = True,
+                       consolidate_roots: bool = False) -> Path:
     """
     Save lexicon entry to file
 
@@ -595,6 +601,10 @@ def save_lexicon_entry(entry: Dict, testing_mode: bool = False, consolidate: boo
     Args:
         entry: Lexicon entry dictionary
         testing_mode: If True, save to testing/ directory
+        consolidate: Add the entry to the consolidated data (production mode only)
+        consolidate_roots: Also collect root entries, for patch_consolidated_files;
+            save_consolidated_files would otherwise overwrite roots.json with
+            only the roots built in this run
 
     Returns:
         Path to saved file
@@ -629,6 +639,10 @@ def save_lexicon_entry(entry: Dict, testing_mode: bool = False, consolidate: boo
         if draft_file.exists():
             draft_file.unlink()
 
+        # Add to consolidated data (only in production mode)
+        if consolidate and consolidate_roots and not testing_mode:
+            consolidated_roots[strong_number] = root_entry
+
         return root_file
 
     # If this word is NOT a root, save it to draft/
@@ -651,10 +665,7 @@ def save_lexicon_entry(entry: Dict, testing_mode: bool = False, consolidate: boo
 
     # Add to consolidated data (only in production mode)
     if consolidate and not testing_mode:
-        if entry.get('is_root'):
-            consolidated_roots[strong_number] = root_entry
-        else:
-            consolidated_words[strong_number] = entry
+        consolidated_words[strong_number] = entry
 
     return output_file
 
@@ -744,12 +755,103 @@ def fill_missing_definitions(directories: List[Path] = None, bdb_root = None) ->
     }
 
 
+def parse_jobs_arg(argv: List[str]) -> int:
+    """Read --jobs N / -j N from the command line (default 1)"""
+    for flag in ('--jobs', '-j'):
+        if flag in argv:
+            index = argv.index(flag)
+            try:
+                return max(1, int(argv[index + 1]))
+            except (IndexError, ValueError):
+                print(f"❌ Error: {flag} requires a number")
+                sys.exit(1)
+    return 1
+
+
+def _build_entry_worker(task) -> tuple:
+    """
+    Build one entry in a worker process.
+
+    Sources (Strong's, refs, BDB tree and index) are inherited from the
+    parent through fork(); the entry is returned for the parent to save.
+    """
+    strong_number, update_existing, testing_mode = task
+    try:
+        entry = build_lexicon_entry(strong_number, load_bdb_xml(), update_existing=update_existing,
+                                    testing_mode=testing_mode)
+        return strong_number, entry, None
+    except Exception as e:
+        return strong_number, None, str(e)
+
+
+def record_entry_inputs(manifest: Optional[LexiconManifest], entry: Dict,
+                        inputs_by_number: Optional[Dict] = None) -> None:
+    """Record the inputs of a saved entry in the manifest (no-op without one)"""
+    if manifest is None:
+        return
+    strong_number = entry['strong_number']
+    inputs = (inputs_by_number or {}).get(strong_number)
+    if inputs is None:
+        inputs = entry_input_hashes(strong_number, get_lexicon_sources())
+    manifest.record(entry, inputs)
+
+
+def build_entries_parallel(to_process: List[str], update_existing: bool, testing_mode: bool,
+                           jobs: int, manifest: Optional[LexiconManifest] = None,
+                           inputs_by_number: Optional[Dict] = None, incremental: bool = False) -> tuple:
+    """
+    Build entries in a process pool and save them in list order.
+
+    Workers only build entries; the parent writes each entry file and fills
+    the consolidated words/roots in the same order as a serial run, so the
+    output does not depend on the number of jobs. Saved entries are recorded
+    in the manifest, if given. Roots are only collected for an incremental
+    run, whose consolidated files are patched rather than rewritten.
+
+    Returns:
+        (success count, failed Strong's numbers)
+    """
+    # Load everything before forking so workers share it
+    get_lexicon_sources()
+
+    tasks = [(strong_number, update_existing, testing_mode) for strong_number in to_process]
+    total = len(tasks)
+    success = 0
+    failed = []
+
+    print(f"\n⚙️  Building with {jobs} worker processes...")
+    context = multiprocessing.get_context('fork')
+    with context.Pool(jobs) as pool:
+        results = pool.imap(_build_entry_worker, tasks, chunksize=32)
+        for i, (strong_number, entry, error) in enumerate(results, 1):
+            if entry:
+                save_lexicon_entry(entry, testing_mode=testing_mode, consolidate_roots=incremental)
+                record_entry_inputs(manifest, entry, inputs_by_number)
+                success += 1
+            else:
+                failed.append(strong_number)
+                if error:
+                    print(f"❌ {strong_number}: {error[:50]}")
+
+            if i % PROGRESS_INTERVAL == 0 or i == total:
+                print(f"[{i}/{total}] ({i * 100 / total:.1f}%) built: {success} ok, {len(failed)} failed",
+                      flush=True)
+
+    return success, failed
+
+
 def main():
     """Main function"""
     print("=" * 80)
     print("LEXICON BUILDER - CONSOLIDATED")
     print("=" * 80)
 
+    # Load Strong's, references and BDB once for the whole run
+    print("\n📚 Loading sources...")
+    sources = get_lexicon_sources(rebuild_snapshot='--rebuild-cache' in sys.argv)
+    origin = "snapshot" if sources.loaded_from_snapshot else "source files"
+    print(f"   ✅ {len(sources.strongs)} Strong's entries, {len(sources.refs)} reference lists (from {origin})")
+
     # Check for fill-missing mode
     if '--fill-missing' in sys.argv or '--fill' in sys.argv:
         print("\n🔍 FILL MISSING DEFINITIONS MODE")
@@ -782,13 +884,14 @@ def main():
     if testing_mode:
         print("\n🧪 TESTING MODE: Using 1% of data in testing/ directory")
 
-    # Load BDB XML
-    print("\n📚 Loading BDB XML...")
+    # BDB XML (parsed with the sources)
     bdb_root = load_bdb_xml()
     if bdb_root is None:
         print("   ⚠️  BDB XML not found - sense assignment will be limited")
     else:
-        print("   ✅ BDB XML loaded")
+        bdb_index = get_bdb_index(bdb_root)
+        print(f"   ✅ BDB XML loaded ({bdb_index.entry_count} entries, {len(bdb_index.by_lemma)} indexed forms)")
+        print(f"   ✅ LexicalIndex crosswalk: {len(sources.crosswalk.by_strong)} Strong's numbers mapped to BDB ids")
 
     # Check if processing batch from JSON file
     if len(sys.argv) >= 2 and sys.argv[1].endswith('.json'):
@@ -812,14 +915,27 @@ def main():
             print(f"\n🧪 Testing mode: Limited to {limit_count} entries (1% of {original_count})")
 
         update_existing = '--update' in sys.argv or '-u' in sys.argv
+        incremental = '--incremental' in sys.argv
+        if incremental and testing_mode:
+            print("❌ Error: --incremental is not supported in testing mode")
+            sys.exit(1)
+
+        # Dependency manifest (production builds only)
+        manifest = None
+        inputs_by_number = None
+        if not testing_mode:
+            manifest = LexiconManifest()
+            manifest.load()
 
         # Filter out existing files (unless updating or testing)
         existing = []
         missing = []
+        normalized_numbers = []
         for num in strong_numbers:
             num = num.upper()
             if not num.startswith('H'):
                 num = 'H' + num
+            normalized_numbers.append(num)
 
             if testing_mode:
                 output_file = config.LEXICON_TESTING_DRAFT_DIR / f"{num}.json"
@@ -836,7 +952,19 @@ def main():
         missing_count = len(missing)
 
         print(f"\n📋 Batch Mode: Processing {total} entries")
-        if update_existing:
+        if incremental:
+            to_process, reasons, inputs_by_number = manifest.plan(normalized_numbers, sources)
+            print(f"   🔁 Incremental: {total - len(to_process)} up to date, {len(to_process)} to rebuild")
+            reason_counts = {}
+            for reason in reasons.values():
+                reason = 'root changed' if reason.startswith('root ') else reason
+                reason_counts[reason] = reason_counts.get(reason, 0) + 1
+            for reason, count in sorted(reason_counts.items(), key=lambda item: -item[1]):
+                print(f"      • {reason}: {count}")
+            if '--explain' in sys.argv:
+                for num in to_process:
+                    print(f"      {num}: {reasons[num]}")
+        elif update_existing:
             print(f"   🔄 Update mode: Will update {existing_count} existing entries")
             print(f"   ⏳ To generate: {missing_count} new entries")
             to_process = strong_numbers
@@ -846,7 +974,9 @@ def main():
             to_process = missing
 
         if len(to_process) == 0:
-            if update_existing:
+            if incremental:
+                print("\n✅ All entries are up to date!")
+            elif update_existing:
                 print("\n⚠️  No entries to process!")
             else:
                 print("\n✅ All entries already exist!")
@@ -857,36 +987,47 @@ def main():
         save_lexicon_entry._update_mode = update_existing
 
         # Process entries
-        success = 0
-        failed = []
-
-        for i, strong_number in enumerate(to_process, 1):
-            progress = (i / len(to_process)) * 100
-            print(f"[{i}/{len(to_process)}] ({progress:.1f}%) Processing {strong_number}...", end=' ', flush=True)
+        jobs = parse_jobs_arg(sys.argv)
+        if jobs > 1:
+            success, failed = build_entries_parallel(to_process, update_existing, testing_mode, jobs,
+                                                     manifest, inputs_by_number, incremental)
+        else:
+            success = 0
+            failed = []
+
+            for i, strong_number in enumerate(to_process, 1):
+                progress = (i / len(to_process)) * 100
+                print(f"[{i}/{len(to_process)}] ({progress:.1f}%) Processing {strong_number}...", end=' ', flush=True)
+
+                try:
+                    entry = build_lexicon_entry(strong_number, bdb_root, update_existing=update_existing, testing_mode=testing_mode)
+
+                    if entry:
+                        save_lexicon_entry(entry, testing_mode=testing_mode, consolidate_roots=incremental)
+                        record_entry_inputs(manifest, entry, inputs_by_number)
+                        success += 1
+                        def_count = len(entry.get('definitions', []))
+                        root_info = ""
+                        if entry.get('is_root'):
+                            root_info = ", IS ROOT"
+                        elif entry.get('root_ref'):
+                            root_info = f", root: {entry['root_ref']}"
+                        print(f"✅ ({def_count} defs{root_info})")
+                    else:
+                        failed.append(strong_number)
+                        print("❌ Failed")
 
-            try:
-                entry = build_lexicon_entry(strong_number, bdb_root, update_existing=update_existing, testing_mode=testing_mode)
-
-                if entry:
-                    save_lexicon_entry(entry, testing_mode=testing_mode)
-                    success += 1
-                    def_count = len(entry.get('definitions', []))
-                    root_info = ""
-                    if entry.get('is_root'):
-                        root_info = ", IS ROOT"
-                    elif entry.get('root_ref'):
-                        root_info = f", root: {entry['root_ref']}"
-                    print(f"✅ ({def_count} defs{root_info})")
-                else:
+                except Exception as e:
                     failed.append(strong_number)
-                    print("❌ Failed")
+                    print(f"❌ Error: {str(e)[:50]}")
 
-            except Exception as e:
-                failed.append(strong_number)
-                print(f"❌ Error: {str(e)[:50]}")
-
-        # Save consolidated files
-        save_consolidated_files(testing_mode=testing_mode)
+        # Save consolidated files (patched in place when only stale entries were rebuilt)
+        if incremental:
+            patch_consolidated_files(to_process)
+        else:
+            save_consolidated_files(testing_mode=testing_mode)
+        if manifest is not None:
+            manifest.save()
 
         # Remove batch mode flag
         if hasattr(build_lexicon_entry, '_batch_mode'):
@@ -898,7 +1039,9 @@ def main():
         print("\n" + "=" * 80)
         print("BATCH SUMMARY")
         print("=" * 80)
-        if update_existing:
+        if incremental:
+            print(f"✅ Successfully rebuilt: {success}/{len(to_process)}")
+        elif update_existing:
             updated = sum(1 for num in existing if num in [e for e in to_process[:success]])
             generated = success - updated
             print(f"✅ Successfully generated: {generated}")
@@ -906,6 +1049,9 @@ def main():
         else:
             print(f"✅ Successfully generated: {success}/{missing_count}")
         print(f"❌ Failed: {len(failed)}")
+        resolution = count_bdb_resolution(to_process)
+        print(f"📖 BDB entries: {resolution['exact']} exact (LexicalIndex), "
+              f"{resolution['fallback']} by lemma fallback, {resolution['none']} not found")
         if testing_mode:
             print(f"🧪 Testing mode: Files saved to {config.LEXICON_TESTING_DIR}")
 
@@ -918,9 +1064,13 @@ def main():
     print("  python3 build_lexicon.py list.json                 # Batch process")
     print("  python3 build_lexicon.py list.json --testing       # Testing mode (1% data)")
     print("  python3 build_lexicon.py list.json --update        # Update existing entries")
+    print("  python3 build_lexicon.py list.json --jobs 8        # Batch process with 8 workers")
+    print("  python3 build_lexicon.py list.json --incremental   # Rebuild only entries whose inputs changed")
+    print("  python3 build_lexicon.py list.json --incremental --explain  # ...and list why each is rebuilt")
     print("  python3 build_lexicon.py --fill-missing            # Fill missing definitions")
     print("  python3 build_lexicon.py --fill-missing --draft-only  # Only draft/ directory")
     print("  python3 build_lexicon.py --fill-missing --testing-only  # Only testing/ directory")
+    print("  python3 build_lexicon.py list.json --rebuild-cache  # Re-parse sources, refresh snapshot")
     print()
 
     if len(sys.argv) < 2:
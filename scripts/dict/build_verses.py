@@ -7,11 +7,14 @@ This is the main entry point for the verse generation pipeline.
 """
 
 import argparse
+import itertools
 import json
 import logging
+import multiprocessing
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -19,8 +22,13 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config import config
 from book_mappings import BookMapper
 from strong_processor import StrongProcessor
+from sense_index import SenseIndex
 from morphus_loader import MorphusLoader
 from verse_processor import VerseProcessor
+from verse_manifest import VerseManifest, build_book_record, book_strong_numbers, hash_file
+from json_stream import StreamDict, write_json_atomic
+from packed_book import PackedBookWriter, iter_with_packer, packed_path
+from corpus_store import get_corpus_store
 
 # Configure logging
 logging.basicConfig(
@@ -33,19 +41,143 @@ logger = logging.getLogger(__name__)
 class VerseBuilder:
     """Main application class for building Hebrew Scripture verses."""
 
-    def __init__(self):
-        self.strong_processor = StrongProcessor()
+    def __init__(self, packed: bool = False):
+        """
+        Initialize builder.
+
+        Args:
+            packed: Also write each book in the packed columnar format (packed_book.py)
+        """
+        self.packed = packed
+        self.sense_index = SenseIndex()
+        self.strong_processor = StrongProcessor(self.sense_index)
         self.morphus_loader = MorphusLoader(self.strong_processor)
         self.verse_processor = VerseProcessor(self.strong_processor, self.morphus_loader)
 
-    def run(self, book_key: Optional[str] = None, chapter_num: Optional[int] = None, verbose: bool = False) -> None:
+    def build_book(self, book_key: str, book_dir: Path, chapter_num: Optional[int] = None,
+                   verbose: bool = False) -> Tuple[int, int, Optional[Dict]]:
+        """
+        Process one book and save its consolidated file.
+
+        With chapter_num, the chapter is patched into the existing
+        consolidated book file (other chapters are kept as they are).
+
+        Args:
+            book_key: Book key in BOOK_MAPPING
+            book_dir: Path to the book directory in oe/
+            chapter_num: Specific chapter to process, or None for all chapters
+            verbose: Enable verbose output
+
+        Returns:
+            Tuple (processed verses, errors, manifest update or None)
+        """
+        if chapter_num:
+            return self.patch_chapter(book_key, book_dir, chapter_num, verbose)
+
+        # Stream chapters straight into the book file (one chapter in memory)
+        stats = {'verses': 0, 'errors': 0}
+        strong_numbers = set()
+
+        def chapters():
+            for chapter, chapter_data in self.verse_processor.iter_book_chapters(book_key, book_dir, None,
+                                                                                  verbose, stats):
+                strong_numbers.update(book_strong_numbers({chapter: chapter_data}))
+                yield chapter, chapter_data
+
+        stream = chapters()
+        first = next(stream, None)
+        manifest_update = None
+
+        # Save consolidated book file
+        if first is not None:
+            output_file = self.book_output_file(book_key)
+            config.BOOKS_DIR.mkdir(exist_ok=True)
+            self.write_book(output_file, itertools.chain([first], stream))
+
+            if verbose:
+                print(f"💾 Saved consolidated book: {output_file}")
+
+            if stats['errors'] == 0:
+                manifest_update = build_book_record(book_key, book_dir, strong_numbers, self.sense_index)
+
+        return stats['verses'], stats['errors'], manifest_update
+
+    def patch_chapter(self, book_key: str, book_dir: Path, chapter_num: int,
+                      verbose: bool = False) -> Tuple[int, int, Optional[Dict]]:
+        """
+        Rebuild one chapter and patch it into the existing consolidated book file.
+
+        Returns:
+            Tuple (processed verses, errors, manifest update or None)
+        """
+        verses, errors, book_data = self.verse_processor.process_book(book_key, book_dir, chapter_num, verbose)
+        if not book_data:
+            return verses, errors, None
+
+        output_file = self.book_output_file(book_key)
+        manifest_update = self.chapter_manifest_update(book_dir, chapter_num, book_data)
+        if output_file.exists():
+            with open(output_file, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+            existing.update(book_data)
+            book_data = existing
+            if verbose:
+                print(f"🩹 Patching chapter {chapter_num} into {output_file}")
+
+        # Sort chapters and verses as they are written
+        sorted_chapters = (
+            (chapter, {verse: book_data[chapter][verse] for verse in sorted(book_data[chapter], key=int)})
+            for chapter in sorted(book_data, key=int)
+        )
+        config.BOOKS_DIR.mkdir(exist_ok=True)
+        self.write_book(output_file, sorted_chapters)
+
+        if verbose:
+            print(f"💾 Saved consolidated book: {output_file}")
+
+        return verses, errors, manifest_update
+
+    def write_book(self, output_file: Path, chapters: Iterable[Tuple[str, Dict]]) -> None:
+        """Stream (chapter, verses) pairs into the book file (and its packed copy)"""
+        packer = PackedBookWriter(output_file.stem) if self.packed else None
+        if packer:
+            chapters = iter_with_packer(chapters, packer)
+        write_json_atomic(output_file, StreamDict(chapters), ensure_ascii=False, separators=(',', ':'))
+        if packer:
+            packer.save(packed_path(output_file))
+
+    def book_output_file(self, book_key: str) -> Path:
+        """Consolidated output file of a book"""
+        book_id = BookMapper.get_book_id(BookMapper.get_book_info(book_key))
+        return config.BOOKS_DIR / f"{book_id}.json"
+
+    def chapter_manifest_update(self, book_dir: Path, chapter_num: int, book_data: Dict) -> Optional[Dict]:
+        """Manifest update for a chapter patched into its book"""
+        chapter_file = book_dir / f"{chapter_num:02d}.json"
+        if not chapter_file.exists():
+            chapter_file = book_dir / f"{chapter_num}.json"
+        if not chapter_file.exists():
+            return None
+        return {
+            'chapter': chapter_file.name,
+            'hash': hash_file(chapter_file),
+            'strong_numbers': sorted(book_strong_numbers(book_data)),
+        }
+
+    def run(self, book_key: Optional[str] = None, chapter_num: Optional[int] = None, verbose: bool = False,
+            jobs: int = 1, force: bool = False) -> None:
         """
         Main execution method.
 
+        Only books whose inputs changed since the last build (see
+        verse_manifest.py) are rebuilt, unless force is set.
+
         Args:
             book_key: Specific book to process, or None for all books
             chapter_num: Specific chapter to process, or None for all chapters
             verbose: Enable verbose output
+            jobs: Worker processes for building several books (1 = serial)
+            force: Rebuild every selected book even if it is up to date
         """
         print("=" * 70)
         print("HEBREW SCRIPTURE VERSE BUILDER")
@@ -59,10 +191,6 @@ class VerseBuilder:
             logger.error(f"❌ OE directory not found: {config.OE_DIR}")
             return
 
-        total_verses = 0
-        total_errors = 0
-        books_processed = 0
-
         if book_key:
             # Process only the specified book
             book_key = book_key.lower()
@@ -76,34 +204,10 @@ class VerseBuilder:
                 logger.error(f"❌ Book directory not found: {book_dir}")
                 return
 
-            verses, errors, book_data = self.verse_processor.process_book(book_key, book_dir, chapter_num, verbose)
-            total_verses += verses
-            total_errors += errors
-
-            # Save consolidated book file
-            if book_data:
-                book_id = BookMapper.get_book_id(BookMapper.get_book_info(book_key))
-                output_file = config.BOOKS_DIR / f"{book_id}.json"
-
-                # Sort chapters and verses
-                sorted_book_data = {}
-                for chapter in sorted(book_data.keys(), key=int):
-                    sorted_chapter_data = {}
-                    for verse in sorted(book_data[chapter].keys(), key=int):
-                        sorted_chapter_data[verse] = book_data[chapter][verse]
-                    sorted_book_data[chapter] = sorted_chapter_data
-
-                # Save consolidated file
-                config.BOOKS_DIR.mkdir(exist_ok=True)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(sorted_book_data, f, ensure_ascii=False, separators=(',', ':'))
-
-                if verbose:
-                    print(f"💾 Saved consolidated book: {output_file}")
-
-            books_processed = 1
+            books = [(book_key, book_dir)]
         else:
             # Process each book available in oe/
+            books = []
             for book_dir in sorted(config.OE_DIR.iterdir()):
                 if not book_dir.is_dir():
                     continue
@@ -116,32 +220,56 @@ class VerseBuilder:
                         print(f"⚠️  Unmapped book: {book_key_iter} (skipping...)")
                     continue
 
-                verses, errors, book_data = self.verse_processor.process_book(book_key_iter, book_dir, None, verbose)
-                total_verses += verses
-                total_errors += errors
-
-                # Save consolidated book file
-                if book_data:
-                    book_id = BookMapper.get_book_id(BookMapper.get_book_info(book_key_iter))
-                    output_file = config.BOOKS_DIR / f"{book_id}.json"
-
-                    # Sort chapters and verses
-                    sorted_book_data = {}
-                    for chapter in sorted(book_data.keys(), key=int):
-                        sorted_chapter_data = {}
-                        for verse in sorted(book_data[chapter].keys(), key=int):
-                            sorted_chapter_data[verse] = book_data[chapter][verse]
-                        sorted_book_data[chapter] = sorted_chapter_data
+                books.append((book_key_iter, book_dir))
 
-                    # Save consolidated file
-                    config.BOOKS_DIR.mkdir(exist_ok=True)
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(sorted_book_data, f, ensure_ascii=False, separators=(',', ':'))
+        manifest = VerseManifest()
+        manifest.load()
 
+        # Skip books whose inputs are unchanged (chapter patches always run)
+        if not chapter_num and not force:
+            stale_books = []
+            for book_key_iter, book_dir in books:
+                book_id = BookMapper.get_book_id(BookMapper.get_book_info(book_key_iter))
+                output_file = config.BOOKS_DIR / f"{book_id}.json"
+                reason = manifest.stale_reason(book_key_iter, book_dir, output_file, self.sense_index)
+                if not reason and self.packed and not packed_path(output_file).exists():
+                    reason = "packed output missing"
+                if reason:
+                    stale_books.append((book_key_iter, book_dir))
                     if verbose:
-                        print(f"💾 Saved consolidated book: {output_file}")
+                        print(f"🔁 {book_key_iter}: {reason}")
+            print(f"📋 {len(books) - len(stale_books)} books up to date, {len(stale_books)} to rebuild")
+            books = stale_books
 
-                books_processed += 1
+        if jobs > 1 and len(books) > 1:
+            results = self.build_books_parallel(books, chapter_num, verbose, jobs)
+        else:
+            results = []
+            for book_key_iter, book_dir in books:
+                start = time.perf_counter()
+                verses, errors, manifest_update = self.build_book(book_key_iter, book_dir, chapter_num, verbose)
+                results.append((book_key_iter, verses, errors, time.perf_counter() - start, 0, manifest_update))
+
+        # Record what the rebuilt books (or patched chapters) were built from
+        for result in results:
+            book_key_iter, manifest_update = result[0], result[5]
+            if manifest_update is None:
+                continue
+            if 'chapter' in manifest_update:
+                manifest.record_chapter(book_key_iter, manifest_update['chapter'], manifest_update['hash'],
+                                        manifest_update['strong_numbers'])
+            else:
+                manifest.record_book(book_key_iter, manifest_update)
+        if results:
+            manifest.save()
+
+        total_verses = sum(result[1] for result in results)
+        total_errors = sum(result[2] for result in results)
+        books_processed = len(results)
+        sense_lookups = self.sense_index.lookups + sum(result[4] for result in results)
+
+        if len(results) > 1:
+            print_timing_table(results)
 
         print("\n" + "=" * 70)
         print("SUMMARY")
@@ -149,9 +277,82 @@ class VerseBuilder:
         print(f"📚 Books processed: {books_processed}")
         print(f"✅ Verses generated: {total_verses}")
         print(f"❌ Errors: {total_errors}")
+        print(f"🔎 Sense lookups: {sense_lookups} "
+              f"({self.sense_index.indexed} entries indexed)")
         print(f"📁 Files saved in: {config.BOOKS_DIR}")
         print()
 
+    def build_books_parallel(self, books: List[Tuple[str, Path]], chapter_num: Optional[int], verbose: bool,
+                             jobs: int) -> List[Tuple]:
+        """
+        Build books in a process pool, largest first.
+
+        Each worker builds and saves whole books; the sense index is loaded
+        and the corpus store opened before forking so workers share them.
+        Results are returned in the original book order.
+
+        Returns:
+            List of (book_key, verses, errors, seconds, sense lookups, manifest update)
+        """
+        global _worker_builder
+        if not self.sense_index.loaded:
+            self.sense_index.load()  # Before forking, so workers share it
+        get_corpus_store()  # Likewise: compiled and mapped once
+        _worker_builder = self
+
+        # Largest books first so the slowest ones do not end up in the tail
+        order = sorted(books, key=lambda book: estimate_book_cost(*book), reverse=True)
+        tasks = [(book_key, book_dir, chapter_num, verbose) for book_key, book_dir in order]
+
+        print(f"⚙️  Building {len(tasks)} books with {jobs} worker processes...")
+        results = {}
+        context = multiprocessing.get_context('fork')
+        with context.Pool(min(jobs, len(tasks))) as pool:
+            for result in pool.imap_unordered(_build_book_worker, tasks):
+                book_key, verses, errors, seconds = result[:4]
+                results[book_key] = result
+                print(f"  ✅ {book_key}: {verses} verses, {errors} errors ({seconds:.1f}s)", flush=True)
+
+        return [results[book_key] for book_key, _ in books]
+
+
+# Builder inherited by pool workers (set before forking)
+_worker_builder: Optional[VerseBuilder] = None
+
+
+def _build_book_worker(task) -> Tuple:
+    """Build one book in a worker process (see VerseBuilder.build_books_parallel)"""
+    book_key, book_dir, chapter_num, verbose = task
+    sense_index = _worker_builder.sense_index
+    lookups = sense_index.lookups
+
+    start = time.perf_counter()
+    verses, errors, manifest_update = _worker_builder.build_book(book_key, book_dir, chapter_num, verbose)
+    seconds = time.perf_counter() - start
+
+    return (book_key, verses, errors, seconds,
+            sense_index.lookups - lookups, manifest_update)
+
+
+def estimate_book_cost(book_key: str, book_dir: Path) -> int:
+    """Rough build cost of a book: size of its oe/ chapter files plus its morphus XML"""
+    cost = sum(path.stat().st_size for path in book_dir.iterdir() if path.is_file())
+    morphus_file = BookMapper.MORPHUS_BOOK_MAP.get(book_key)
+    if morphus_file and (config.MORPHUS_DIR / morphus_file).exists():
+        cost += (config.MORPHUS_DIR / morphus_file).stat().st_size
+    return cost
+
+
+def print_timing_table(results: List[Tuple]) -> None:
+    """Print per-book build times, slowest first"""
+    total_seconds = sum(result[3] for result in results) or 1.0
+    print("\n" + "=" * 70)
+    print("BOOK TIMINGS")
+    print("=" * 70)
+    print(f"{'Book':<20} {'Verses':>8} {'Errors':>7} {'Seconds':>9} {'Share':>7}")
+    for book_key, verses, errors, seconds, *_ in sorted(results, key=lambda result: -result[3]):
+        print(f"{book_key:<20} {verses:>8} {errors:>7} {seconds:>9.2f} {seconds * 100 / total_seconds:>6.1f}%")
+
 
 def main():
     """Command-line interface."""
@@ -169,6 +370,15 @@ Examples:
   # Process specific chapter
   python scripts/dict/build_verses.py --book genesis --chapter 1
 
+  # Rebuild every book, even if its inputs are unchanged
+  python scripts/dict/build_verses.py --force
+
+  # Build all books with 8 worker processes
+  python scripts/dict/build_verses.py --jobs 8
+
+  # Also write packed books (books/<book_id>.pack)
+  python scripts/dict/build_verses.py --packed
+
   # Verbose output
   python scripts/dict/build_verses.py --verbose
         """
@@ -183,6 +393,22 @@ Examples:
         type=int,
         help='Chapter number to process. If not specified, processes all chapters of the book.'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Build books in N worker processes (largest books first). Default: 1 (serial).'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild all selected books, even those whose inputs are unchanged'
+    )
+    parser.add_argument(
+        '--packed',
+        action='store_true',
+        help='Also write each book in the packed columnar format (books/<book_id>.pack)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -196,8 +422,8 @@ Examples:
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Run the application
-    builder = VerseBuilder()
-    builder.run(args.book, args.chapter, args.verbose)
+    builder = VerseBuilder(packed=args.packed)
+    builder.run(args.book, args.chapter, args.verbose, max(1, args.jobs), args.force)
 
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@ class Config:
         self.DATA_DIR = self.PROJECT_ROOT / 'data'
         self.DICT_DIR = self.DATA_DIR / 'dict'
         self.OE_DIR = self.DATA_DIR / 'oe'
+        self.DELITZSCH_PARSED_DIR = self.DATA_DIR / 'delitzsch_parsed'
 
         # Raw data sources
         self.RAW_DIR = self.DICT_DIR / 'raw'
@@ -47,12 +48,24 @@ class Config:
         # Scripts directory (for lexicon list file)
         self.SCRIPTS_DIR = self.PROJECT_ROOT / 'scripts' / 'dict'
 
+        # Shared Hebrew normalization kernel (scripts/strong/hebrew_normalize.py)
+        self.STRONG_SCRIPTS_DIR = self.PROJECT_ROOT / 'scripts' / 'strong'
+
         # Source files
         self.STRONGS_FILE = self.RAW_DIR / 'strongs_hebrew_dict_en.json'
         self.STRONG_REFS_FILE = self.RAW_DIR / 'strong_refs.json'
         self.BDB_XML = self.RAW_DIR / 'BrownDriverBriggs.xml'
+        self.LEXICAL_INDEX_XML = self.RAW_DIR / 'LexicalIndex.xml'
         self.LEXICON_LIST_FILE = self.SCRIPTS_DIR / 'lexicon_100_percent_list.json'
 
+        # Build caches (derived data, safe to delete)
+        self.CACHE_DIR = self.SCRIPTS_DIR / '.cache'
+        self.SOURCES_SNAPSHOT = self.CACHE_DIR / 'lexicon_sources.pickle'
+        self.LEXICON_MANIFEST = self.CACHE_DIR / 'lexicon_manifest.json'
+        self.MORPHUS_CACHE_DIR = self.CACHE_DIR / 'morphus'
+        self.VERSE_MANIFEST = self.CACHE_DIR / 'verse_manifest.json'
+        self.CORPUS_STORE = self.CACHE_DIR / 'corpus.store'
+
         # Create output directories if they don't exist
         # self.VERSES_DIR.mkdir(exist_ok=True)  # Legacy - removed to avoid creating unnecessary directories
 
@@ -0,0 +1,545 @@
+"""
+Compiled store of the parsed corpora (OE Tanakh + Delitzsch NT)
+
+Compiles the chapter files under data/oe/<book>/ and
+data/delitzsch_parsed/<book>/ once into scripts/dict/.cache/corpus.store,
+a single memory-mapped file (container layout in packed_file.py):
+
+    strings / constants   every distinct string in one UTF-8 blob, plus a
+                          small JSON table of non-string values (numbers,
+                          prefix lists, booleans, null)
+    word records          each distinct word object (text, text_no_nikud,
+                          lemma, strong, morph, prefixes, ...) stored once
+                          as a key shape plus value ids
+    verses                key shape and value ids of each verse, the record
+                          ids of its words, and its chapter group
+    files                 book / file table with each file's verse range,
+                          size, mtime and SHA-256 (in the metadata)
+
+Opening the store stats the source files; the store is rebuilt only if
+one was added, removed or changed content (size/mtime first, then
+SHA-256), and a rebuild reparses only the changed files - unchanged ones
+are copied from the previous store.
+
+iter_verses() / iter_words() and file_paths() replace the per-tool
+directory walks, and load_chapter() is a drop-in replacement for json.load
+of one chapter file.
+"""
+
+import copy
+import hashlib
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from config import config
+from packed_file import PackedFile, pack_sections, write_bytes_atomic
+
+MAGIC = b'DVCS'
+STORE_VERSION = 1
+
+# While compiling, value ids with this bit set refer to constants; the stored
+# ids index one table of all strings followed by all constants
+CONSTANT_FLAG = 0x80000000
+
+SECTIONS = [
+    'string_offsets',
+    'record_shapes',
+    'record_value_offsets',
+    'record_values',
+    'verse_shapes',
+    'verse_groups',
+    'verse_value_offsets',
+    'verse_values',
+    'verse_word_offsets',
+    'verse_words',
+]
+
+
+class CorpusVerse(NamedTuple):
+    """A verse of the store."""
+    source: str      # 'oe' or 'nt'
+    book: str        # Book directory name
+    file: str        # Chapter file name
+    chapter: Any     # Chapter (OE: the verse's 'chapter'; NT: its chapter group)
+    verse: Any       # The verse's 'verse' value
+    data: Dict       # Verse object as in the file (word dicts are shared: read-only)
+
+
+class CorpusWord(NamedTuple):
+    """A word occurrence of the store."""
+    source: str
+    book: str
+    chapter: Any
+    verse: Any
+    index: int       # 0-based position in the verse
+    word: Dict       # Word object as in the file (shared: read-only)
+
+
+def source_roots() -> Dict[str, Path]:
+    """Corpus directories by source name"""
+    return {'oe': config.OE_DIR, 'nt': config.DELITZSCH_PARSED_DIR}
+
+
+def list_source_files(roots: Dict[str, Path]) -> List[Tuple[str, str, str, Path]]:
+    """(source, book, file name, path) of every chapter file, in store order"""
+    files = []
+    for source, root in roots.items():
+        if not root.exists():
+            continue
+        for book_dir in sorted(root.iterdir()):
+            # oe/raw holds whole-book files with a different structure
+            if not book_dir.is_dir() or (source == 'oe' and book_dir.name == 'raw'):
+                continue
+            for path in sorted(book_dir.glob('*.json')):
+                files.append((source, book_dir.name, path.name, path))
+    return files
+
+
+def file_fingerprint(path: Path, with_hash: bool = True) -> Dict:
+    """Size, mtime and (optionally) SHA-256 of a source file"""
+    stat = path.stat()
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if with_hash:
+        fingerprint['sha256'] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return fingerprint
+
+
+def constant_key(value: Any) -> Tuple:
+    """Hashable key of a non-string JSON value (typed, so True and 1 differ)"""
+    if value.__class__ is list and all(item.__class__ is str for item in value):
+        return ('list', tuple(value))
+    if value.__class__ in (list, dict):
+        return ('json', json.dumps(value, sort_keys=True))
+    return (value.__class__.__name__, value)
+
+
+class _StoreCompiler:
+    """Interns verses and word records and serializes the store."""
+
+    def __init__(self):
+        self.string_ids: Dict[str, int] = {}
+        self.blob = bytearray()
+        self.string_offsets = array('I', [0])
+        self.constant_ids: Dict[str, int] = {}
+        self.constants: List[Any] = []
+        self.shape_ids: Dict[Tuple[str, ...], int] = {}
+        self.shapes: List[List[str]] = []
+        self.record_ids: Dict[Tuple, int] = {}
+        # Record ids of shared word dicts (from a previous store), by identity
+        self.shared_record_ids: Dict[int, int] = {}
+
+        self.record_shapes = array('H')
+        self.record_value_offsets = array('I', [0])
+        self.record_values = array('I')
+        self.verse_shapes = array('H')
+        self.verse_groups = array('I')
+        self.verse_value_offsets = array('I', [0])
+        self.verse_values = array('I')
+        self.verse_word_offsets = array('I', [0])
+        self.verse_words = array('I')
+        self.files: List[Dict] = []
+
+    def value_id(self, value: Any) -> int:
+        """Intern a JSON value"""
+        if isinstance(value, str):
+            value_id = self.string_ids.get(value)
+            if value_id is None:
+                value_id = len(self.string_ids)
+                self.string_ids[value] = value_id
+                self.blob += value.encode('utf-8')
+                self.string_offsets.append(len(self.blob))
+            return value_id
+
+        key = constant_key(value)
+        constant_id = self.constant_ids.get(key)
+        if constant_id is None:
+            constant_id = len(self.constants)
+            self.constant_ids[key] = constant_id
+            self.constants.append(value)
+        return CONSTANT_FLAG | constant_id
+
+    def shape_id(self, keys: Tuple[str, ...]) -> int:
+        """Intern the key order of an object"""
+        shape_id = self.shape_ids.get(keys)
+        if shape_id is None:
+            shape_id = len(self.shapes)
+            self.shape_ids[keys] = shape_id
+            self.shapes.append(list(keys))
+        return shape_id
+
+    def record_id(self, word: Dict) -> int:
+        """Intern a word object"""
+        # Cheap hashable key first; values are interned only for new records
+        key = (tuple(word), tuple([value if value.__class__ is str else constant_key(value)
+                                   for value in word.values()]))
+        record_id = self.record_ids.get(key)
+        if record_id is None:
+            record_id = len(self.record_shapes)
+            self.record_ids[key] = record_id
+            self.record_shapes.append(self.shape_id(key[0]))
+            self.record_values.extend([self.value_id(value) for value in word.values()])
+            self.record_value_offsets.append(len(self.record_values))
+        return record_id
+
+    def shared_record_id(self, word: Dict) -> int:
+        """Intern a word dict that stays alive for the whole compilation"""
+        record_id = self.shared_record_ids.get(id(word))
+        if record_id is None:
+            record_id = self.shared_record_ids[id(word)] = self.record_id(word)
+        return record_id
+
+    def add_verse(self, group: Any, verse: Dict, shared: bool = False):
+        """Append a verse object (its words are interned as records)"""
+        self.verse_shapes.append(self.shape_id(tuple(verse)))
+        self.verse_groups.append(self.value_id(group))
+        intern = self.shared_record_id if shared else self.record_id
+        for key, value in verse.items():
+            if key == 'words':
+                self.verse_words.extend([intern(word) for word in value])
+            else:
+                self.verse_values.append(self.value_id(value))
+        self.verse_value_offsets.append(len(self.verse_values))
+        self.verse_word_offsets.append(len(self.verse_words))
+
+    def add_file(self, source: str, book: str, name: str, fingerprint: Dict,
+                 verses: List[Tuple[Any, Dict]], error: Optional[str] = None, shared: bool = False):
+        """Append a chapter file with its (chapter group, verse object) pairs"""
+        first = len(self.verse_shapes)
+        for group, verse in verses:
+            self.add_verse(group, verse, shared)
+        record = {'source': source, 'book': book, 'name': name, **fingerprint,
+                  'verses': [first, len(self.verse_shapes)]}
+        if error:
+            record['error'] = error
+        self.files.append(record)
+
+    def to_bytes(self, roots: Dict[str, Path]) -> bytes:
+        """Serialize the store"""
+        meta = {
+            'roots': {source: str(root.resolve()) for source, root in roots.items()},
+            'files': self.files,
+            'shapes': self.shapes,
+            'constants': self.constants,
+        }
+        string_count = len(self.string_ids)
+        sections = []
+        for name in SECTIONS:
+            values = getattr(self, name)
+            if name in ('record_values', 'verse_groups', 'verse_values'):
+                values = array('I', [value_id if value_id < CONSTANT_FLAG
+                                     else string_count + (value_id & ~CONSTANT_FLAG)
+                                     for value_id in values])
+            sections.append((name, values))
+        return pack_sections(MAGIC, STORE_VERSION, meta, sections, bytes(self.blob))
+
+
+def parse_source_file(source: str, path: Path) -> List[Tuple[Any, Dict]]:
+    """
+    Read a chapter file as (chapter group, verse object) pairs.
+
+    OE files are a list of verses; Delitzsch files a list of
+    {'chapter', 'verses'} groups.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if source == 'nt':
+        verses = []
+        for group in data:
+            if list(group) != ['chapter', 'verses']:
+                raise ValueError(f"unexpected chapter keys {list(group)}")
+            verses.extend((group['chapter'], verse) for verse in group['verses'])
+        return verses
+    return [(verse.get('chapter'), verse) for verse in data]
+
+
+class CorpusStore:
+    """
+    Read layer over the compiled corpora.
+    """
+
+    def __init__(self, path: Optional[Path] = None, roots: Optional[Dict[str, Path]] = None):
+        """
+        Initialize store (call open() before reading).
+
+        Args:
+            path: Store file (default: config.CORPUS_STORE)
+            roots: Corpus directories by source (default: OE and Delitzsch from config)
+        """
+        self.path = path or config.CORPUS_STORE
+        self.roots = roots or source_roots()
+        self.packed: Optional[PackedFile] = None
+
+        # Build statistics of the last open()
+        self.rebuilt = False
+        self.parsed_files = 0
+        self.reused_files = 0
+
+    # ------------------------------------------------------------------
+    # Opening and compiling
+    # ------------------------------------------------------------------
+
+    def open(self) -> 'CorpusStore':
+        """Map the store, rebuilding it first if the corpora changed."""
+        if self.packed is not None:
+            return self
+
+        current = list_source_files(self.roots)
+        previous = self._map_existing()
+        if previous is None or not self._is_current(previous, current):
+            self._compile(current, previous)
+            if previous is not None:
+                previous.close()
+            previous = PackedFile(self.path, MAGIC, STORE_VERSION)
+
+        self._attach(previous)
+        return self
+
+    def _map_existing(self) -> Optional[PackedFile]:
+        """Map the existing store file, if readable"""
+        try:
+            return PackedFile(self.path, MAGIC, STORE_VERSION)
+        except (OSError, ValueError):
+            return None
+
+    def _is_current(self, packed: PackedFile, current: List[Tuple[str, str, str, Path]]) -> bool:
+        """Check the stored file table against the files on disk"""
+        meta = packed.meta
+        roots = {source: str(root.resolve()) for source, root in self.roots.items()}
+        if meta['roots'] != roots or len(meta['files']) != len(current):
+            return False
+
+        for record, (source, book, name, path) in zip(meta['files'], current):
+            if (record['source'], record['book'], record['name']) != (source, book, name):
+                return False
+            # Size/mtime changes are settled by _compile, which hashes the
+            # files and reparses only those whose content changed
+            fingerprint = file_fingerprint(path, with_hash=False)
+            if fingerprint['size'] != record['size'] or fingerprint['mtime_ns'] != record['mtime_ns']:
+                return False
+        return True
+
+    def _compile(self, current: List[Tuple[str, str, str, Path]], previous: Optional[PackedFile]):
+        """Build the store, copying files with an unchanged SHA-256 from the previous store"""
+        reusable = {}
+        if previous is not None:
+            for index, record in enumerate(previous.meta['files']):
+                if 'error' not in record:
+                    reusable.setdefault(record['sha256'], index)
+            previous_reader = CorpusStore(self.path, self.roots)
+            previous_reader._attach(previous)
+
+        compiler = _StoreCompiler()
+        self.parsed_files = self.reused_files = 0
+        for source, book, name, path in current:
+            fingerprint = file_fingerprint(path)
+            index = reusable.get(fingerprint['sha256'])
+            if index is not None:
+                compiler.add_file(source, book, name, fingerprint, previous_reader._file_verses(index, fresh=False),
+                                  shared=True)
+                self.reused_files += 1
+                continue
+
+            try:
+                verses = parse_source_file(source, path)
+                error = None
+            except Exception as e:
+                print(f"Error reading {path}: {e}")
+                verses, error = [], str(e)
+            compiler.add_file(source, book, name, fingerprint, verses, error)
+            self.parsed_files += 1
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(self.path, compiler.to_bytes(self.roots))
+        self.rebuilt = True
+        print(f"📚 Corpus store compiled: {self.parsed_files} files parsed, "
+              f"{self.reused_files} reused ({self.path})")
+
+    def _attach(self, packed: PackedFile):
+        """Bind the sections of a mapped store"""
+        self.packed = packed
+        meta = packed.meta
+        self.files: List[Dict] = meta['files']
+        self._shapes: List[List[str]] = meta['shapes']
+        self._constants: List[Any] = meta['constants']
+        for name in SECTIONS:
+            setattr(self, f"_{name}", packed.section(name))
+
+        self._values: Optional[List[Any]] = None
+        self._records: List[Optional[Dict]] = [None] * len(self._record_shapes)
+        self._paths = {
+            str((Path(meta['roots'][record['source']]) / record['book'] / record['name'])): index
+            for index, record in enumerate(self.files)
+        }
+
+    def close(self):
+        """Release the memory map"""
+        if self.packed is not None:
+            self.packed.close()
+            self.packed = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def _load_values(self) -> List[Any]:
+        """Decode the value table: all strings (one pass over the blob), then the constants"""
+        blob = bytes(self.packed.section('blob'))
+        offsets = self._string_offsets.tolist()
+        self._values = [blob[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+        self._values.extend(self._constants)
+        return self._values
+
+    def _value(self, value_id: int, fresh: bool = False) -> Any:
+        """Decode an interned value"""
+        value = (self._values if self._values is not None else self._load_values())[value_id]
+        return copy.deepcopy(value) if fresh and isinstance(value, (list, dict)) else value
+
+    def _record(self, record_id: int, fresh: bool = False) -> Dict:
+        """Decode a word record (cached and shared unless fresh)"""
+        if not fresh:
+            record = self._records[record_id]
+            if record is not None:
+                return record
+        shape = self._shapes[self._record_shapes[record_id]]
+        start = self._record_value_offsets[record_id]
+        values = self._record_values[start:start + len(shape)]
+        if fresh:
+            return {key: self._value(value_id, True) for key, value_id in zip(shape, values)}
+
+        table = self._values if self._values is not None else self._load_values()
+        record = dict(zip(shape, map(table.__getitem__, values)))
+        self._records[record_id] = record
+        return record
+
+    def _verse(self, index: int, fresh: bool = False) -> Dict:
+        """Decode the verse object at a global index"""
+        records = self._records
+        word_ids = self._verse_words[self._verse_word_offsets[index]:self._verse_word_offsets[index + 1]]
+        if fresh:
+            words = [self._record(record_id, True) for record_id in word_ids]
+        else:
+            words = [records[record_id] or self._record(record_id) for record_id in word_ids]
+
+        values = iter(self._verse_values[self._verse_value_offsets[index]:self._verse_value_offsets[index + 1]])
+        if fresh:
+            return {key: words if key == 'words' else self._value(next(values), True)
+                    for key in self._shapes[self._verse_shapes[index]]}
+        table = self._values if self._values is not None else self._load_values()
+        return {key: words if key == 'words' else table[next(values)]
+                for key in self._shapes[self._verse_shapes[index]]}
+
+    def _file_verses(self, file_index: int, fresh: bool = True) -> List[Tuple[Any, Dict]]:
+        """(chapter group, verse object) pairs of a file"""
+        first, end = self.files[file_index]['verses']
+        return [(self._value(self._verse_groups[index]), self._verse(index, fresh)) for index in range(first, end)]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def _selected_files(self, source: Optional[str], book: Optional[str]) -> Iterator[int]:
+        """Indexes of the files of a source / book (None = all)"""
+        self.open()
+        for index, record in enumerate(self.files):
+            if (source is None or record['source'] == source) and (book is None or record['book'] == book):
+                yield index
+
+    def books(self, source: str) -> List[str]:
+        """Book names of a source, in store order"""
+        self.open()
+        return list(dict.fromkeys(record['book'] for record in self.files if record['source'] == source))
+
+    def file_paths(self, source: Optional[str] = None, book: Optional[str] = None) -> List[Path]:
+        """Chapter file paths in store order"""
+        indexes = list(self._selected_files(source, book))
+        roots = self.packed.meta['roots']
+        return [Path(roots[self.files[index]['source']]) / self.files[index]['book'] / self.files[index]['name']
+                for index in indexes]
+
+    def iter_verses(self, source: Optional[str] = None, book: Optional[str] = None) -> Iterator[CorpusVerse]:
+        """
+        Iterate verses in store order (books and files sorted by name).
+
+        Word dicts are shared between occurrences; treat them as read-only
+        (read_file returns independent copies).
+        """
+        for file_index in self._selected_files(source, book):
+            record = self.files[file_index]
+            first, end = record['verses']
+            for index in range(first, end):
+                data = self._verse(index)
+                yield CorpusVerse(record['source'], record['book'], record['name'],
+                                  self._value(self._verse_groups[index]), data.get('verse'), data)
+
+    def iter_words(self, source: Optional[str] = None, book: Optional[str] = None) -> Iterator[CorpusWord]:
+        """Iterate word occurrences in store order (word dicts are shared: read-only)"""
+        for verse in self.iter_verses(source, book):
+            for index, word in enumerate(verse.data.get('words', [])):
+                yield CorpusWord(verse.source, verse.book, verse.chapter, verse.verse, index, word)
+
+    def read_file(self, path: Path, copy: bool = True) -> Optional[List[Dict]]:
+        """
+        Contents of a chapter file, as json.load would return them.
+
+        Args:
+            path: Chapter file
+            copy: Return independent objects (False: word dicts are shared, read-only)
+
+        Returns:
+            The file's data, or None if the file is not part of the store (or
+            could not be parsed)
+        """
+        self.open()
+        file_index = self._paths.get(str(Path(path).resolve()))
+        if file_index is None or 'error' in self.files[file_index]:
+            return None
+
+        verses = self._file_verses(file_index, fresh=copy)
+        if self.files[file_index]['source'] != 'nt':
+            return [verse for _, verse in verses]
+
+        groups = []
+        for group, verse in verses:
+            if not groups or groups[-1]['chapter'] != group:
+                groups.append({'chapter': group, 'verses': []})
+            groups[-1]['verses'].append(verse)
+        return groups
+
+
+# Global store instance
+_store_instance: Optional[CorpusStore] = None
+
+
+def get_corpus_store() -> CorpusStore:
+    """Get singleton corpus store (opened, rebuilt first if the corpora changed)."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = CorpusStore().open()
+    return _store_instance
+
+
+def load_chapter(path: Path, copy: bool = False) -> Any:
+    """
+    Contents of a chapter file, from the corpus store when it covers the file.
+
+    Files outside the store (or that it could not parse) are loaded with
+    json.load.
+
+    Args:
+        path: Chapter file
+        copy: Return independent objects (False: word dicts are shared, read-only)
+    """
+    data = get_corpus_store().read_file(path, copy=copy)
+    if data is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    return data
@@ -13,14 +13,16 @@ Supports source restrictions (e.g., NT-only entries) and generates
 both custom_definitions.json and compound_instances.json files.
 """
 
+import copy
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
-from glob import glob
 
 from config import config
+from corpus_store import get_corpus_store
+from strong_automaton import StrongSequenceAutomaton
 
 
 @dataclass
@@ -284,8 +286,7 @@ class BiblicalScanner:
     """Scans OE and Delitzsch data for word matches."""
 
     def __init__(self):
-        self.oe_dir = config.OE_DIR
-        self.delitzsch_dir = config.DATA_DIR / 'delitzsch_parsed'
+        self.corpus = get_corpus_store()
 
     def extract_base_strong(self, strong_field) -> Optional[str]:
         """Extract base Strong number from 'Hc/Hd/H776' -> 'H776'."""
@@ -295,46 +296,30 @@ class BiblicalScanner:
             return strong_field.split('/')[-1]
         return strong_field
 
+    def iter_oe_verses(self) -> Iterator[Tuple[str, int, int, List[Dict]]]:
+        """Stream OE (Tanakh) verses as (book, chapter, verse, words)."""
+        for verse in self.corpus.iter_verses('oe'):
+            yield verse.book.lower(), verse.chapter, verse.verse, verse.data['words']
+
+    def iter_delitzsch_verses(self) -> Iterator[Tuple[str, int, int, List[Dict]]]:
+        """Stream Delitzsch (NT) verses as (book, chapter, verse, words)."""
+        for verse in self.corpus.iter_verses('nt'):
+            yield verse.book.lower(), verse.chapter, verse.verse, verse.data['words']
+
     def scan_oe_data(self, compound_strongs: List[str]) -> List[Dict]:
         """Scan OE (Tanakh) data for compound matches."""
         matches = []
 
-        # Scan all book directories
-        for book_dir in sorted(self.oe_dir.glob('*')):
-            if not book_dir.is_dir():
-                continue
-
-            # Skip the raw directory which has different structure
-            if book_dir.name == 'raw':
-                continue
-
-            book_name = book_dir.name.lower()
-
-            # Scan all chapter files in this book
-            for chapter_file in sorted(book_dir.glob('*.json')):
-                try:
-                    with open(chapter_file, 'r', encoding='utf-8') as f:
-                        chapter_data = json.load(f)
-
-                    for verse_data in chapter_data:
-                        chapter = verse_data['chapter']
-                        verse = verse_data['verse']
-                        words = verse_data['words']
-
-                        # Find consecutive matches
-                        word_positions = self.find_consecutive_matches(words, compound_strongs)
-                        if word_positions:
-                            for start_pos in word_positions:
-                                matches.append({
-                                    'book': book_name,
-                                    'chapter': chapter,
-                                    'verse': verse,
-                                    'word_positions': list(range(start_pos, start_pos + len(compound_strongs)))
-                                })
-
-                except Exception as e:
-                    print(f"Error scanning {chapter_file}: {e}")
-                    continue
+        for book_name, chapter, verse, words in self.iter_oe_verses():
+            # Find consecutive matches
+            word_positions = self.find_consecutive_matches(words, compound_strongs)
+            for start_pos in word_positions:
+                matches.append({
+                    'book': book_name,
+                    'chapter': chapter,
+                    'verse': verse,
+                    'word_positions': list(range(start_pos, start_pos + len(compound_strongs)))
+                })
 
         return matches
 
@@ -347,58 +332,33 @@ class BiblicalScanner:
         """
         matches = []
 
-        # Scan all book directories
-        for book_dir in sorted(self.delitzsch_dir.glob('*')):
-            if not book_dir.is_dir():
-                continue
-
-            book_name = book_dir.name.lower()
-
-            # Scan all chapter files in this book
-            for chapter_file in sorted(book_dir.glob('*.json')):
-                try:
-                    with open(chapter_file, 'r', encoding='utf-8') as f:
-                        chapter_data = json.load(f)
-
-                    for verse_data in chapter_data:
-                        chapter = verse_data['chapter']
-                        verses = verse_data['verses']
-
-                        for verse_obj in verses:
-                            verse = verse_obj['verse']
-                            words = verse_obj['words']
-
-                            # Check for compound matches first
-                            if compound_strongs:
-                                word_positions = self.find_consecutive_matches(words, compound_strongs)
-                                if word_positions:
-                                    for start_pos in word_positions:
-                                        matches.append({
-                                            'book': book_name,
-                                            'chapter': chapter,
-                                            'verse': verse,
-                                            'word_positions': list(range(start_pos, start_pos + len(compound_strongs))),
-                                            'match_type': 'compound',
-                                            'strongs': compound_strongs.copy()
-                                        })
-
-                            # Check for single/alternative matches
-                            if single_strongs:
-                                for word_idx, word in enumerate(words):
-                                    word_strong = self.extract_base_strong(word.get('strong'))
-                                    if word_strong and word_strong in single_strongs:
-                                        matches.append({
-                                            'book': book_name,
-                                            'chapter': chapter,
-                                            'verse': verse,
-                                            'word_positions': [word_idx],
-                                            'match_type': 'single',
-                                            'strong': word_strong
-                                        })
-
-                except Exception as e:
-                    print(f"Error scanning {chapter_file}: {e}")
-                    continue
+        for book_name, chapter, verse, words in self.iter_delitzsch_verses():
+            # Check for compound matches first
+            if compound_strongs:
+                word_positions = self.find_consecutive_matches(words, compound_strongs)
+                for start_pos in word_positions:
+                    matches.append({
+                        'book': book_name,
+                        'chapter': chapter,
+                        'verse': verse,
+                        'word_positions': list(range(start_pos, start_pos + len(compound_strongs))),
+                        'match_type': 'compound',
+                        'strongs': compound_strongs.copy()
+                    })
+
+            # Check for single/alternative matches
+            if single_strongs:
+                for word_idx, word in enumerate(words):
+                    word_strong = self.extract_base_strong(word.get('strong'))
+                    if word_strong and word_strong in single_strongs:
+                        matches.append({
+                            'book': book_name,
+                            'chapter': chapter,
+                            'verse': verse,
+                            'word_positions': [word_idx],
+                            'match_type': 'single',
+                            'strong': word_strong
+                        })
 
         return matches
 
@@ -418,11 +378,137 @@ class BiblicalScanner:
         return matches
 
 
+class MultiPatternScanner(BiblicalScanner):
+    """
+    Answers every scan of a run from a single pass over each corpus.
+
+    Works in two phases. While collecting, scan_oe_data / scan_delitzsch_data
+    only record the requested patterns and return no matches. scan() then
+    compiles all of them into one Aho-Corasick automaton per corpus over base
+    Strong's numbers, streams OE and Delitzsch once and routes each match to
+    every request that wants it; afterwards the same calls return their
+    matches (identical to BiblicalScanner's). The cost no longer grows with
+    the number of entries.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Request key -> matches
+        self.oe_requests: Dict[Tuple[str, ...], List[Dict]] = {}
+        self.nt_requests: Dict[Tuple[Optional[Tuple[str, ...]], Optional[Tuple[str, ...]]], List[Dict]] = {}
+        self.scanned = False
+        self.verses_scanned = 0
+
+    def scan_oe_data(self, compound_strongs: List[str]) -> List[Dict]:
+        """Record (collecting) or return (after scan) OE sequence matches."""
+        key = tuple(compound_strongs)
+        if not self.scanned:
+            self.oe_requests.setdefault(key, [])
+            return []
+        return copy.deepcopy(self.oe_requests[key])
+
+    def scan_delitzsch_data(self, compound_strongs: List[str], single_strongs: Optional[List[str]] = None) -> List[Dict]:
+        """Record (collecting) or return (after scan) Delitzsch compound/single matches."""
+        key = (tuple(compound_strongs) if compound_strongs else None,
+               tuple(single_strongs) if single_strongs else None)
+        if not self.scanned:
+            self.nt_requests.setdefault(key, [])
+            return []
+        return copy.deepcopy(self.nt_requests[key])
+
+    def scan(self):
+        """Stream each corpus once and collect the matches of every recorded request."""
+        if self.oe_requests:
+            automaton = StrongSequenceAutomaton()
+            for key in self.oe_requests:
+                automaton.add(key, key)
+
+            for book_name, chapter, verse, words in self.iter_oe_verses():
+                self.verses_scanned += 1
+                strongs = [self.extract_base_strong(word.get('strong')) for word in words]
+                for start_pos, length, key in automaton.iter_matches(strongs):
+                    self.oe_requests[key].append({
+                        'book': book_name,
+                        'chapter': chapter,
+                        'verse': verse,
+                        'word_positions': list(range(start_pos, start_pos + length))
+                    })
+
+        if self.nt_requests:
+            automaton = StrongSequenceAutomaton()
+            for key in self.nt_requests:
+                compound_strongs, single_strongs = key
+                if compound_strongs:
+                    automaton.add(compound_strongs, (key, 'compound'))
+                for strong in dict.fromkeys(single_strongs or ()):
+                    automaton.add((strong,), (key, 'single'))
+
+            for book_name, chapter, verse, words in self.iter_delitzsch_verses():
+                self.verses_scanned += 1
+                strongs = [self.extract_base_strong(word.get('strong')) for word in words]
+
+                # Per request: compound matches first, then single ones (as BiblicalScanner)
+                verse_hits: Dict[Tuple, Tuple[List[int], List[int]]] = {}
+                for start_pos, _, (key, match_type) in automaton.iter_matches(strongs):
+                    hits = verse_hits.setdefault(key, ([], []))
+                    hits[match_type == 'single'].append(start_pos)
+
+                for key, (compound_starts, single_starts) in verse_hits.items():
+                    compound_strongs = key[0]
+                    for start_pos in compound_starts:
+                        self.nt_requests[key].append({
+                            'book': book_name,
+                            'chapter': chapter,
+                            'verse': verse,
+                            'word_positions': list(range(start_pos, start_pos + len(compound_strongs))),
+                            'match_type': 'compound',
+                            'strongs': list(compound_strongs)
+                        })
+                    for word_idx in single_starts:
+                        self.nt_requests[key].append({
+                            'book': book_name,
+                            'chapter': chapter,
+                            'verse': verse,
+                            'word_positions': [word_idx],
+                            'match_type': 'single',
+                            'strong': strongs[word_idx]
+                        })
+
+        self.scanned = True
+
+
 class InstanceMapper:
     """Maps detected instances to lexicon entries."""
 
-    def __init__(self):
-        self.scanner = BiblicalScanner()
+    def __init__(self, scanner: Optional[BiblicalScanner] = None):
+        """
+        Initialize mapper.
+
+        Args:
+            scanner: Corpus scanner (default: MultiPatternScanner, one pass per corpus)
+        """
+        self.scanner = scanner or MultiPatternScanner()
+
+    def map_all_instances(self, entries: Dict[str, Tuple[Dict, StrongPattern]]) -> Dict[str, Dict]:
+        """
+        Map instances for every entry.
+
+        With a MultiPatternScanner, the entries are first mapped to collect
+        their patterns, the corpora are scanned once, and the entries are
+        mapped again against the collected matches.
+
+        Args:
+            entries: Entry key -> (lexicon entry, pattern)
+
+        Returns:
+            Entry key -> updated entry
+        """
+        if isinstance(self.scanner, MultiPatternScanner) and not self.scanner.scanned:
+            for entry, pattern in entries.values():
+                self.map_instances_for_entry(entry, pattern)
+            self.scanner.scan()
+
+        return {key: self.map_instances_for_entry(entry, pattern) for key, (entry, pattern) in entries.items()}
 
     def map_instances_for_entry(self, entry: Dict, pattern: StrongPattern) -> Dict:
         """
@@ -592,7 +678,7 @@ def main():
     # Map instances
     print("\n🔍 Scanning biblical texts for instances...")
     mapper = InstanceMapper()
-    updated_entries = {}
+    entry_patterns = {}
 
     for entry_key, entry in lexicon_entries.items():
         # Reconstruct pattern from entry
@@ -612,10 +698,13 @@ def main():
         else:
             pattern = StrongPattern('single', [entry['strong_number']], entry_key)
 
-        updated_entry = mapper.map_instances_for_entry(entry, pattern)
-        updated_entries[entry_key] = updated_entry
+        entry_patterns[entry_key] = (entry, pattern)
 
-    print(f"   ✅ Mapped instances for {len(updated_entries)} entries")
+    updated_entries = mapper.map_all_instances(entry_patterns)
+    scanner = mapper.scanner
+    print(f"   ✅ Mapped instances for {len(updated_entries)} entries "
+          f"({len(scanner.oe_requests) + len(scanner.nt_requests)} patterns, "
+          f"{scanner.verses_scanned} verses scanned once)")
 
     # Generate output files
     print("\n💾 Generating output files...")
@@ -0,0 +1,140 @@
+"""
+Streaming JSON writer for consolidated book files.
+
+Writes a JSON document whose large parts come from generators, so a book
+can be serialized one chapter at a time instead of being assembled (and
+sorted) in memory first. Wrap a lazily produced object in StreamDict (an
+iterable of key/value pairs) or a lazily produced array in StreamList; any
+other value is encoded with the json module. Streamed parts may appear as
+items of other streamed parts or as direct values of a plain dict (e.g.
+{'book_info': {...}, 'chapters': StreamList(...)}).
+
+The bytes written are the same as json.dump of the equivalent fully built
+structure, for both compact (separators=(',', ':')) and pretty (indent=N)
+output.
+
+Used by scripts/dict/build_verses.py and scripts/tth/processor.py.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple, Union
+
+
+class StreamDict:
+    """JSON object produced lazily from (key, value) pairs, written in order."""
+
+    def __init__(self, items: Iterable[Tuple[Any, Any]]):
+        self.items = items
+
+
+class StreamList:
+    """JSON array produced lazily from an iterable, written in order."""
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = items
+
+
+def _encode_key(key: Any) -> str:
+    """Encode an object key the way json.dump does for str/int keys."""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, bool) or key is None:
+        return json.dumps(key)
+    if isinstance(key, int):
+        return str(key)
+    raise TypeError(f"keys must be str or int, not {type(key).__name__}")
+
+
+class _StreamEncoder:
+    """Writes values to a file, streaming StreamDict / StreamList contents."""
+
+    def __init__(self, fp, indent: Optional[int], separators: Optional[Tuple[str, str]], ensure_ascii: bool):
+        self.fp = fp
+        self.indent = indent
+        if separators is None:
+            separators = (',', ': ') if indent is not None else (', ', ': ')
+        self.item_separator, self.key_separator = separators
+        self.ensure_ascii = ensure_ascii
+
+    def dumps(self, value: Any, level: int) -> str:
+        """Encode a plain value nested at the given indentation level."""
+        text = json.dumps(value, ensure_ascii=self.ensure_ascii, indent=self.indent,
+                          separators=(self.item_separator, self.key_separator))
+        if self.indent is not None and level:
+            # Raw newlines only occur between tokens (strings escape them)
+            text = text.replace('\n', '\n' + ' ' * (self.indent * level))
+        return text
+
+    def write(self, value: Any, level: int = 0):
+        """Write a value (streamed containers are written item by item)."""
+        if isinstance(value, StreamDict):
+            self._write_container('{', '}', value.items, level, is_dict=True)
+        elif isinstance(value, StreamList):
+            self._write_container('[', ']', value.items, level, is_dict=False)
+        elif isinstance(value, dict) and any(isinstance(v, (StreamDict, StreamList)) for v in value.values()):
+            self._write_container('{', '}', value.items(), level, is_dict=True)
+        else:
+            self.fp.write(self.dumps(value, level))
+
+    def _write_container(self, opening: str, closing: str, items: Iterable, level: int, is_dict: bool):
+        """Write an object or array, one item at a time."""
+        self.fp.write(opening)
+        if self.indent is not None:
+            newline_indent = '\n' + ' ' * (self.indent * (level + 1))
+            separator = self.item_separator + newline_indent
+        else:
+            newline_indent = ''
+            separator = self.item_separator
+
+        first = True
+        for item in items:
+            self.fp.write(newline_indent if first else separator)
+            first = False
+            if is_dict:
+                key, item = item
+                self.fp.write(json.dumps(_encode_key(key), ensure_ascii=self.ensure_ascii))
+                self.fp.write(self.key_separator)
+            self.write(item, level + 1)
+
+        if not first and self.indent is not None:
+            self.fp.write('\n' + ' ' * (self.indent * level))
+        self.fp.write(closing)
+
+
+def dump_stream(value: Any, fp, indent: Optional[int] = None, separators: Optional[Tuple[str, str]] = None,
+                ensure_ascii: bool = True):
+    """
+    Serialize a value that may contain StreamDict / StreamList parts.
+
+    Args:
+        value: Value to write
+        fp: Text file object
+        indent, separators, ensure_ascii: As for json.dump
+    """
+    _StreamEncoder(fp, indent, separators, ensure_ascii).write(value)
+
+
+def write_json_atomic(path: Union[str, Path], value: Any, **kwargs):
+    """
+    Stream a value to a temp file next to path, then rename it into place.
+
+    Readers never see a partially written file, and a failure while
+    producing the data leaves the previous file untouched.
+
+    Args:
+        path: Output file
+        value: Value to write (may contain StreamDict / StreamList parts)
+        **kwargs: indent, separators, ensure_ascii (as for json.dump)
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            dump_stream(value, f, **kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
@@ -0,0 +1,66 @@
+"""
+Strong's -> BDB crosswalk from the OpenScriptures LexicalIndex.xml
+
+Every <entry> of the lexical index carries an <xref> whose ``bdb``
+attribute is the id of a BDB entry and whose ``strong`` attribute (when
+present) is the plain Strong's number. Augmented numbers (aug="a", "b", ...)
+map one Strong's number to several BDB entries; those ids are kept in
+document order (Hebrew part first, then Aramaic).
+
+The file is streamed with iterparse and each entry is cleared once read, so
+loading does not keep the index tree in memory.
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional
+
+NS = {'li': 'http://openscriptures.github.com/morphhb/namespace'}
+ENTRY_TAG = f"{{{NS['li']}}}entry"
+XREF_TAG = f"{{{NS['li']}}}xref"
+
+
+class StrongBDBCrosswalk:
+    """
+    Strong's number -> BDB entry ids.
+    """
+
+    def __init__(self, table: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize crosswalk.
+
+        Args:
+            table: Previously exported mapping (see to_table) to restore
+        """
+        self.by_strong: Dict[str, List[str]] = dict(table) if table else {}
+
+    def load(self, path: Path):
+        """
+        Stream the lexical index and collect Strong's -> BDB id pairs.
+
+        Args:
+            path: LexicalIndex.xml path
+        """
+        self.by_strong = {}
+        for _, elem in ET.iterparse(path, events=('end',)):
+            if elem.tag != ENTRY_TAG:
+                continue
+
+            xref = elem.find(XREF_TAG)
+            if xref is not None:
+                strong = xref.get('strong', '')
+                bdb_id = xref.get('bdb')
+                # Non-numeric values (e.g. "b", "k") are prefixes without a Strong's number
+                if bdb_id and strong.isdigit():
+                    ids = self.by_strong.setdefault(f"H{int(strong)}", [])
+                    if bdb_id not in ids:
+                        ids.append(bdb_id)
+            elem.clear()
+
+    def bdb_ids(self, strong_number: str) -> List[str]:
+        """BDB entry ids for a Strong's number (empty if unmapped)"""
+        return self.by_strong.get(strong_number, [])
+
+    def to_table(self) -> Dict[str, List[str]]:
+        """Export the mapping (picklable)"""
+        return self.by_strong
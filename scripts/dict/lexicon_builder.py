@@ -19,6 +19,13 @@ LEXICON_DRAFT = LEXICON_DIR / 'draft'
 LEXICON_ROOTS = LEXICON_DIR / 'roots'
 LEXICON_TESTING = LEXICON_DIR / 'testing'
 OSB_DIR = DICT_DIR / 'oe'
+STRONG_SCRIPTS_DIR = DICT_DIR / 'strong'
+
+# Shared Hebrew normalization kernel
+sys.path.append(str(STRONG_SCRIPTS_DIR))
+from hebrew_normalize import normalize
+from bdb_index import get_bdb_index
+from lexicon_sources import get_lexicon_sources
 
 # Import extraction functions
 sys.path.insert(0, str(OSB_DIR))
@@ -30,10 +37,7 @@ except ImportError:
     extract_from_strongs = None
     extract_from_bdb = None
 
-# Load Strong's dictionary
-STRONGS_FILE = DICT_DIR / 'strongs_hebrew_dict_en.json'
-STRONG_REFS_FILE = DICT_DIR / 'strong_refs.json'
-BDB_XML = DICT_DIR / 'BrownDriverBriggs.xml'
+# Strong's, references and BDB XML are loaded through lexicon_sources
 LIST_FILE = LEXICON_DIR / 'lexicon_100_percent_list.json'
 
 NS = {'bdb': 'http://openscriptures.github.com/morphhb/namespace'}
@@ -68,30 +72,18 @@ def create_definition(text_en: str, source: str, order: int, sense: Optional[str
 
 
 def load_strongs_data() -> Dict:
-    """Load Strong's dictionary data"""
-    if STRONGS_FILE.exists():
-        with open(STRONGS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Load Strong's dictionary data (shared, loaded once per run)"""
+    return get_lexicon_sources().strongs
 
 
 def load_strong_refs() -> Dict:
-    """Load Strong's references data"""
-    if STRONG_REFS_FILE.exists():
-        with open(STRONG_REFS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Load Strong's references data (shared, loaded once per run)"""
+    return get_lexicon_sources().refs
 
 
 def load_bdb_xml():
-    """Load BDB XML file"""
-    if not BDB_XML.exists():
-        return None
-    try:
-        tree = ET.parse(BDB_XML)
-        return tree.getroot()
-    except Exception:
-        return None
+    """Load BDB XML file (shared, parsed once per run)"""
+    return get_lexicon_sources().bdb_root
 
 
 def normalize_definition_text(text: str) -> str:
@@ -99,9 +91,14 @@ def normalize_definition_text(text: str) -> str:
     return re.sub(r'\s+', ' ', text.strip().lower())
 
 
-def find_bdb_entry(hebrew_word: str, root_element, include_roots: bool = False) -> Optional[ET.Element]:
+def find_bdb_entry(hebrew_word: str, root_element, include_roots: bool = False,
+                   strong_number: Optional[str] = None) -> Optional[ET.Element]:
     """
     Find BDB entry for a Hebrew word
+
+    When a Strong's number is given and LexicalIndex.xml maps it to BDB ids,
+    the entry is resolved by id (lexical_index.py) and the lemma search below
+    is only the fallback for unmapped numbers.
     
     IMPROVED LOGIC (to avoid etymological errors):
     - Skips entries with type="root" (etymological discussions) by default
@@ -113,76 +110,26 @@ def find_bdb_entry(hebrew_word: str, root_element, include_roots: bool = False)
     This prevents selecting etymological root entries that mention the word
     but don't actually define it (e.g., H430 was incorrectly using a.dl.aa
     etymological entry instead of a.dl.ad actual word entry).
+
+    Candidates come from the inverted BDB index (bdb_index.py), built once
+    per XML tree, instead of a scan over every entry.
     
     Args:
         hebrew_word: Hebrew word to search for
         root_element: BDB XML root element
         include_roots: If True, also search in root-type entries (default: False)
+        strong_number: Strong's number to resolve through the crosswalk first
     """
     if root_element is None:
         return None
-    
-    hebrew_normalized = re.sub(r'[\u0591-\u05C7]', '', hebrew_word)
-    entries = root_element.findall('.//bdb:entry', NS)
-    
-    best_entry = None
-    best_def_count = 0
-    
-    for entry in entries:
-        # Skip root entries (etymological discussions) unless explicitly requested
-        # This prevents selecting etymological entries like "a.dl.aa" for אֱלֹהִים
-        if entry.get('type') == 'root' and not include_roots:
-            continue
-        
-        # Check direct children first (main word)
-        direct_w_elements = entry.findall('./bdb:w', NS)
-        is_main_word = False
-        for w in direct_w_elements:
-            if w.text:
-                w_normalized = re.sub(r'[\u0591-\u05C7]', '', w.text)
-                if w_normalized == hebrew_normalized:
-                    is_main_word = True
-                    break
-        
-        # Also check nested (mentioned in text)
-        if not is_main_word:
-            nested_w_elements = entry.findall('.//bdb:w', NS)
-            for w in nested_w_elements:
-                if w.text:
-                    w_normalized = re.sub(r'[\u0591-\u05C7]', '', w.text)
-                    if w_normalized == hebrew_normalized:
-                        # Count definitions
-                        def_elements = entry.findall('./bdb:def', NS)
-                        def_count = len([d for d in def_elements if d.text and d.text.strip()])
-                        for sense in entry.findall('.//bdb:sense', NS):
-                            sense_defs = sense.findall('.//bdb:def', NS)
-                            def_count += len([d for d in sense_defs if d.text and d.text.strip()])
-                        
-                        score = def_count
-                        if score > best_def_count:
-                            best_entry = entry
-                            best_def_count = score
-                        break
-        
-        if is_main_word:
-            # Count definitions
-            def_elements = entry.findall('./bdb:def', NS)
-            def_count = len([d for d in def_elements if d.text and d.text.strip()])
-            for sense in entry.findall('.//bdb:sense', NS):
-                sense_defs = sense.findall('.//bdb:def', NS)
-                def_count += len([d for d in sense_defs if d.text and d.text.strip()])
-            
-            # Main word gets +1000 bonus (unless it's a root entry, then use actual count)
-            if entry.get('type') == 'root':
-                score = def_count
-            else:
-                score = 1000 + def_count
-            
-            if score > best_def_count:
-                best_entry = entry
-                best_def_count = score
-    
-    return best_entry
+
+    index = get_bdb_index(root_element)
+    if strong_number:
+        entry = index.find_by_ids(get_lexicon_sources().crosswalk.bdb_ids(strong_number), hebrew_word)
+        if entry is not None:
+            return entry
+
+    return index.find_entry(hebrew_word, include_roots)
 
 
 def build_sense_path(sense_elem: ET.Element, parent_path: str = "") -> str:
@@ -289,7 +236,7 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     if not hebrew_word:
         return definitions
     
-    hebrew_normalized = re.sub(r'[\u0591-\u05C7]', '', hebrew_word)
+    hebrew_normalized = normalize(hebrew_word, 'marks')
     
     bdb_data = None
     
@@ -301,19 +248,19 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     if not bdb_data or not bdb_data.get('definitions'):
         if bdb_root is not None:
             # First try without root entries (normal case)
-            bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False)
+            bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False, strong_number=strong_number)
             # If not found, try with root entries (for words like H776 that are roots)
             if not bdb_entry:
-                bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True)
+                bdb_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True, strong_number=strong_number)
             
             if bdb_entry:
                 # Find the correct Hebrew word element (prefer longer/matching one)
                 w_elements = bdb_entry.findall('.//bdb:w', NS)
                 bdb_hebrew = ''
-                hebrew_normalized = re.sub(r'[\u0591-\u05C7]', '', hebrew_word)
+                hebrew_normalized = normalize(hebrew_word, 'marks')
                 for w_elem in w_elements:
                     if w_elem.text:
-                        w_normalized = re.sub(r'[\u0591-\u05C7]', '', w_elem.text)
+                        w_normalized = normalize(w_elem.text, 'marks')
                         if w_normalized == hebrew_normalized or len(w_normalized) >= len(hebrew_normalized):
                             bdb_hebrew = w_elem.text
                             break
@@ -399,10 +346,11 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     if isinstance(bdb_data, list):
         bdb_entry = bdb_data[0] if bdb_data else {}
     
-    # Verify Hebrew word matches
+    # Verify Hebrew word matches (not needed when resolved by Strong's number)
     bdb_hebrew = bdb_entry.get('hebrew', '')
-    if bdb_hebrew:
-        bdb_normalized = re.sub(r'[\u0591-\u05C7]', '', bdb_hebrew)
+    exact_match = bdb_entry.get('id') in get_lexicon_sources().crosswalk.bdb_ids(strong_number)
+    if bdb_hebrew and not exact_match:
+        bdb_normalized = normalize(bdb_hebrew, 'marks')
         if bdb_normalized != hebrew_normalized:
             if hebrew_normalized not in bdb_normalized or len(bdb_normalized) > len(hebrew_normalized) + 2:
                 return definitions
@@ -410,9 +358,9 @@ def extract_bdb_definitions_with_sense(strong_number: str, hebrew_word: str, bdb
     # Build sense mapping from BDB XML if available
     sense_mapping = {}
     if bdb_root:
-        xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False)
+        xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=False, strong_number=strong_number)
         if not xml_entry:
-            xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True)
+            xml_entry = find_bdb_entry(hebrew_word, bdb_root, include_roots=True, strong_number=strong_number)
         if xml_entry:
             sense_mapping = build_sense_mapping(xml_entry)
     
@@ -504,8 +452,8 @@ def build_lexicon_entry(strong_number: str, bdb_root, update_existing: bool = Fa
     Returns:
         Complete lexicon entry dictionary
     """
-    strongs_data = load_strongs_data()
-    strong_refs = load_strong_refs()
+    sources = get_lexicon_sources()
+    strongs_data = sources.strongs
     
     # Determine output directories
     if testing_mode:
@@ -531,7 +479,7 @@ def build_lexicon_entry(strong_number: str, bdb_root, update_existing: bool = Fa
     entry = {
         "strong_number": strong_number,
         "lemma": strongs_entry.get('lemma', ''),
-        "normalized": existing_entry.get('normalized', re.sub(r'[\u0591-\u05C7]', '', strongs_entry.get('lemma', ''))),
+        "normalized": existing_entry.get('normalized', normalize(strongs_entry.get('lemma', ''), 'marks')),
         "pronunciation": strongs_entry.get('pron', ''),
         "transliteration": strongs_entry.get('xlit', ''),
         "definitions": [],
@@ -558,21 +506,8 @@ def build_lexicon_entry(strong_number: str, bdb_root, update_existing: bool = Fa
         if verbose:
             print(f"   ⚠️  No BDB definitions found")
     
-    # Add occurrences
-    refs_data = None
-    if strong_number in strong_refs:
-        refs_data = strong_refs[strong_number]
-    else:
-        num_part = strong_number[1:]
-        padded_formats = [
-            f"H{num_part.zfill(4)}",
-            f"H{num_part.zfill(3)}",
-            f"H{num_part.zfill(2)}",
-        ]
-        for fmt in padded_formats:
-            if fmt in strong_refs:
-                refs_data = strong_refs[fmt]
-                break
+    # Add occurrences (zero-padded ref IDs are resolved when sources load)
+    refs_data = sources.get_refs(strong_number)
     
     if refs_data:
         refs = refs_data.get('references', [])
@@ -857,7 +792,8 @@ def main():
     if bdb_root is None:
         print("   ⚠️  BDB XML not found - sense assignment will be limited")
     else:
-        print("   ✅ BDB XML loaded")
+        bdb_index = get_bdb_index(bdb_root)
+        print(f"   ✅ BDB XML loaded ({bdb_index.entry_count} entries, {len(bdb_index.by_lemma)} indexed forms)")
     
     # Check if processing batch from JSON file
     if len(sys.argv) >= 2 and sys.argv[1].endswith('.json'):
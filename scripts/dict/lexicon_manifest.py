@@ -0,0 +1,184 @@
+"""
+Dependency manifest for incremental lexicon rebuilds
+
+Records, for every built entry, hashes of the exact inputs
+build_lexicon_entry used: the Strong's record, the BDB entry subtree it
+selected (plus the candidate rows that decided the selection), the resolved
+references list and the builder version. An incremental run recomputes
+those hashes from the current sources and rebuilds only entries whose
+inputs changed, whose output file is missing, or whose root_ref points at
+a root that is being rebuilt.
+"""
+
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import config
+
+# Bump when build_lexicon_entry changes in a way that alters its output
+LEXICON_BUILD_VERSION = 2
+
+MANIFEST_VERSION = 1
+
+# Human-readable names of the recorded inputs
+INPUT_NAMES = {
+    'builder': "builder version",
+    'strongs': "Strong's record",
+    'bdb': "BDB entry",
+    'refs': "references",
+}
+
+
+def _hash_text(text: str) -> str:
+    """Short SHA-256 of a string"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _hash_json(data) -> str:
+    """Hash JSON-serializable data independent of key order"""
+    return _hash_text(json.dumps(data, ensure_ascii=False, sort_keys=True))
+
+
+def hash_bdb_inputs(strong_number: str, lemma: str, sources) -> str:
+    """
+    Hash the BDB data that decides an entry's definitions.
+
+    Covers the crosswalk ids of the Strong's number, the subtree of the
+    entry find_bdb_entry selects (with and without root entries) and the
+    lemma-search candidate rows it ranked, so edits to a competing entry
+    that would change the selection are also detected.
+    """
+    index = sources.bdb_index
+    if index is None:
+        return _hash_text('')
+
+    parts = [','.join(sources.crosswalk.bdb_ids(strong_number))]
+    for candidate in index.candidates(lemma) if lemma else []:
+        parts.append(f"{candidate.entry.get('id', '')}:{candidate.is_main}:"
+                     f"{candidate.def_count}:{candidate.is_root}")
+    for include_roots in (False, True):
+        entry = sources.find_bdb_entry(strong_number, lemma, include_roots)
+        if entry is not None:
+            parts.append(ET.tostring(entry, encoding='unicode'))
+    return _hash_text('\n'.join(parts))
+
+
+def entry_input_hashes(strong_number: str, sources) -> Dict[str, str]:
+    """
+    Hash every input build_lexicon_entry reads for a Strong's number.
+
+    Args:
+        strong_number: Strong's number (e.g., "H7965")
+        sources: Loaded LexiconSources
+
+    Returns:
+        Dictionary of input name -> hash
+    """
+    strongs_entry = sources.strongs.get(strong_number)
+    lemma = strongs_entry.get('lemma', '') if strongs_entry else ''
+    return {
+        'builder': str(LEXICON_BUILD_VERSION),
+        'strongs': _hash_json(strongs_entry),
+        'bdb': hash_bdb_inputs(strong_number, lemma, sources),
+        'refs': _hash_json(sources.get_refs(strong_number)),
+    }
+
+
+class LexiconManifest:
+    """
+    Per-entry input hashes keyed by Strong's number.
+    """
+
+    def __init__(self, path: Path = config.LEXICON_MANIFEST):
+        """
+        Initialize manifest.
+
+        Args:
+            path: Manifest JSON file
+        """
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+
+    def load(self):
+        """Load records from disk (missing or unreadable manifests start empty)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == MANIFEST_VERSION:
+            self.entries = data.get('entries', {})
+
+    def save(self):
+        """Write records atomically (temp file + rename)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def record(self, entry: Dict, inputs: Dict[str, str]):
+        """Record the inputs a freshly saved entry was built from"""
+        self.entries[entry['strong_number']] = {
+            'inputs': inputs,
+            'is_root': bool(entry.get('is_root')),
+            'root_ref': entry.get('root_ref'),
+        }
+
+    def stale_reason(self, strong_number: str, inputs: Dict[str, str]) -> Optional[str]:
+        """
+        Explain why an entry must be rebuilt.
+
+        Returns:
+            Reason string, or None if the entry is up to date
+        """
+        record = self.entries.get(strong_number)
+        if record is None:
+            return "not in manifest"
+
+        for name, value in inputs.items():
+            if record['inputs'].get(name) != value:
+                return f"{INPUT_NAMES.get(name, name)} changed"
+
+        output_dir = config.LEXICON_ROOTS_DIR if record['is_root'] else config.LEXICON_WORDS_DIR
+        if not (output_dir / f"{strong_number}.json").exists():
+            return "output missing"
+
+        return None
+
+    def plan(self, strong_numbers: List[str], sources) -> Tuple[List[str], Dict[str, str], Dict[str, Dict]]:
+        """
+        Select the entries an incremental run must rebuild.
+
+        Args:
+            strong_numbers: Candidate Strong's numbers (in build order)
+            sources: Loaded LexiconSources
+
+        Returns:
+            (numbers to rebuild in build order, reasons by number,
+             current input hashes by number)
+        """
+        inputs_by_number = {number: entry_input_hashes(number, sources) for number in strong_numbers}
+
+        reasons = {}
+        for number in strong_numbers:
+            reason = self.stale_reason(number, inputs_by_number[number])
+            if reason:
+                reasons[number] = reason
+
+        # Entries whose root's own inputs changed are rebuilt with it
+        changed = set(reasons)
+        for number in strong_numbers:
+            if number in reasons:
+                continue
+            root_ref = self.entries[number].get('root_ref')
+            if root_ref in changed:
+                reasons[number] = f"root {root_ref} changed"
+
+        to_rebuild = [number for number in strong_numbers if number in reasons]
+        return to_rebuild, reasons, inputs_by_number
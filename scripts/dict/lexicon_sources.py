@@ -0,0 +1,305 @@
+"""
+Shared lexicon sources, loaded once per run
+
+Holds the Strong's dictionary, the Strong's references (with zero-padded
+ID aliases such as H0001 already resolved), the parsed BDB XML tree, its
+inverted index and the Strong's -> BDB crosswalk from LexicalIndex.xml. Everything derived from JSON is cached in a snapshot
+(pickle) validated against the source files' size/mtime and, when those
+differ, their SHA-256 hashes, so build_lexicon.py, lexicon_builder.py,
+qa.py and --fill-missing all start from the same pre-parsed data.
+
+The BDB tree itself is re-parsed each run (faster than unpickling
+ElementTree objects); only its index table is restored from the snapshot.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import config
+from bdb_index import BDBIndex, get_bdb_index
+from lexical_index import StrongBDBCrosswalk
+
+# Bump when the snapshot layout or the derivation of its tables changes
+SNAPSHOT_VERSION = 2
+
+
+def resolve_refs(strong_refs: Dict, strong_number: str) -> Optional[Dict]:
+    """
+    Find the references record for a Strong's number.
+
+    Tries the number as given, then zero-padded aliases (H0001, H001, H01).
+
+    Args:
+        strong_refs: Raw references data keyed by Strong's number
+        strong_number: Strong's number (e.g., "H1")
+
+    Returns:
+        References record or None
+    """
+    if strong_number in strong_refs:
+        return strong_refs[strong_number]
+
+    num_part = strong_number[1:]
+    padded_formats = [
+        f"H{num_part.zfill(4)}",
+        f"H{num_part.zfill(3)}",
+        f"H{num_part.zfill(2)}",
+    ]
+    for fmt in padded_formats:
+        if fmt in strong_refs:
+            return strong_refs[fmt]
+    return None
+
+
+class LexiconSources:
+    """
+    Strong's entries, references and BDB data for one lexicon build.
+    """
+
+    def __init__(self, snapshot_path: Optional[Path] = config.SOURCES_SNAPSHOT):
+        """
+        Initialize sources.
+
+        Args:
+            snapshot_path: Snapshot location, or None to always parse the sources
+        """
+        self.strongs: Dict[str, Dict] = {}
+        self.refs: Dict[str, Dict] = {}
+        self.refs_by_number: Dict[str, Optional[Dict]] = {}  # Strong's number -> resolved refs
+        self.bdb_root: Optional[ET.Element] = None
+        self.bdb_index: Optional[BDBIndex] = None
+        self.crosswalk = StrongBDBCrosswalk()
+
+        self.snapshot_path = snapshot_path
+        self.loaded_from_snapshot = False
+        self._loaded = False
+
+    def load(self, rebuild_snapshot: bool = False):
+        """
+        Load all sources.
+
+        Args:
+            rebuild_snapshot: Ignore any existing snapshot and rebuild it
+        """
+        if self._loaded:
+            return
+
+        self._load_bdb()
+
+        if self.snapshot_path and not rebuild_snapshot and self._load_snapshot():
+            self._loaded = True
+            self.loaded_from_snapshot = True
+            return
+
+        self.strongs = self._load_json(config.STRONGS_FILE)
+        self.refs = self._load_json(config.STRONG_REFS_FILE)
+        self.refs_by_number = {number: resolve_refs(self.refs, number) for number in self.strongs}
+        if self.bdb_root is not None:
+            self.bdb_index = get_bdb_index(self.bdb_root)
+        if config.LEXICAL_INDEX_XML.exists():
+            self.crosswalk.load(config.LEXICAL_INDEX_XML)
+
+        self._loaded = True
+        if self.snapshot_path:
+            self._save_snapshot()
+
+    def get_refs(self, strong_number: str) -> Optional[Dict]:
+        """References record for a Strong's number (zero-padded aliases resolved)"""
+        if strong_number in self.refs_by_number:
+            return self.refs_by_number[strong_number]
+        return resolve_refs(self.refs, strong_number)
+
+    def find_bdb_entry(self, strong_number: str, hebrew_word: str,
+                       include_roots: bool = False) -> Optional[ET.Element]:
+        """
+        Find the BDB entry for a Strong's number.
+
+        Resolved by id through the LexicalIndex crosswalk when the number is
+        mapped; otherwise falls back to the lemma search of the BDB index.
+
+        Args:
+            strong_number: Strong's number (e.g., "H7965")
+            hebrew_word: Strong's lemma (used by the fallback and to rank
+                augmented numbers)
+            include_roots: Let the fallback consider root-type entries
+
+        Returns:
+            BDB entry element or None
+        """
+        entry, _ = self.resolve_bdb_entry(strong_number, hebrew_word, include_roots)
+        return entry
+
+    def resolve_bdb_entry(self, strong_number: str, hebrew_word: str,
+                          include_roots: bool = False) -> Tuple[Optional[ET.Element], str]:
+        """
+        Find the BDB entry for a Strong's number and how it was resolved.
+
+        Returns:
+            (entry element or None, 'exact' | 'fallback' | 'none')
+        """
+        if self.bdb_index is None:
+            return None, 'none'
+
+        bdb_ids = self.crosswalk.bdb_ids(strong_number) if strong_number else []
+        if bdb_ids:
+            entry = self.bdb_index.find_by_ids(bdb_ids, hebrew_word)
+            if entry is not None:
+                return entry, 'exact'
+
+        entry = self.bdb_index.find_entry(hebrew_word, include_roots) if hebrew_word else None
+        return entry, 'fallback' if entry is not None else 'none'
+
+    def _load_json(self, path: Path) -> Dict:
+        """Load a JSON source file (missing files load as empty)"""
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _load_bdb(self):
+        """Parse the BDB XML (left as None if missing or invalid)"""
+        if not config.BDB_XML.exists():
+            return
+        try:
+            self.bdb_root = ET.parse(config.BDB_XML).getroot()
+        except Exception:
+            self.bdb_root = None
+
+    def _source_files(self) -> List[Path]:
+        """Source files the snapshot is derived from"""
+        return [config.STRONGS_FILE, config.STRONG_REFS_FILE, config.BDB_XML, config.LEXICAL_INDEX_XML]
+
+    def _source_fingerprint(self, path: Path, with_hash: bool = True) -> Dict:
+        """
+        Fingerprint a source file.
+
+        Args:
+            path: Source file path
+            with_hash: Also compute the SHA-256 of the file contents
+
+        Returns:
+            Dictionary with size, mtime_ns and (optionally) sha256
+        """
+        if not path.exists():
+            return {'missing': True}
+
+        stat = path.stat()
+        fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        if with_hash:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            fingerprint['sha256'] = digest.hexdigest()
+        return fingerprint
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load parsed sources from the snapshot if it is still valid.
+
+        Returns:
+            True if the snapshot was valid and loaded
+        """
+        if not self.snapshot_path.exists():
+            return False
+
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return False
+
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            return False
+
+        stale_stats = False
+        for path in self._source_files():
+            stored = snapshot['sources'].get(str(path))
+            if stored is None:
+                return False
+
+            current = self._source_fingerprint(path, with_hash=False)
+            if stored.get('missing') or current.get('missing'):
+                if stored.get('missing') != current.get('missing'):
+                    return False
+                continue
+
+            # Fast path: unchanged size and mtime
+            if current['size'] == stored['size'] and current['mtime_ns'] == stored['mtime_ns']:
+                continue
+
+            # Touched but possibly identical content: compare hashes
+            current = self._source_fingerprint(path)
+            if current['sha256'] != stored['sha256']:
+                return False
+            stored.update(current)
+            stale_stats = True
+
+        tables = snapshot['tables']
+        if self.bdb_root is not None:
+            if tables['bdb_index'] is None:
+                return False
+            try:
+                self.bdb_index = get_bdb_index(self.bdb_root, tables['bdb_index'])
+            except ValueError:
+                return False
+
+        self.strongs = tables['strongs']
+        self.refs = tables['refs']
+        self.refs_by_number = tables['refs_by_number']
+        self.crosswalk = StrongBDBCrosswalk(tables['crosswalk'])
+
+        if stale_stats:
+            # Refresh stored mtimes so the next load takes the fast path
+            self._write_snapshot(snapshot)
+
+        return True
+
+    def _save_snapshot(self):
+        """Write the parsed sources to the snapshot file"""
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'sources': {str(path): self._source_fingerprint(path) for path in self._source_files()},
+            'tables': {
+                'strongs': self.strongs,
+                'refs': self.refs,
+                'refs_by_number': self.refs_by_number,
+                'bdb_index': self.bdb_index.to_table() if self.bdb_index else None,
+                'crosswalk': self.crosswalk.to_table(),
+            },
+        }
+        self._write_snapshot(snapshot)
+
+    def _write_snapshot(self, snapshot: Dict):
+        """Atomically write a snapshot (temp file + rename)"""
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"Warning: could not write lexicon sources snapshot: {e}")
+
+
+# Global sources instance
+_sources_instance: Optional[LexiconSources] = None
+
+
+def get_lexicon_sources(rebuild_snapshot: bool = False) -> LexiconSources:
+    """
+    Get singleton lexicon sources instance.
+
+    Args:
+        rebuild_snapshot: Rebuild the sources snapshot on first load
+    """
+    global _sources_instance
+    if _sources_instance is None:
+        _sources_instance = LexiconSources()
+        _sources_instance.load(rebuild_snapshot=rebuild_snapshot)
+    return _sources_instance
@@ -2,9 +2,13 @@
 Morphus XML data loader.
 
 Handles loading and processing of morphological analysis data from
-Open Scriptures MorphHB XML files.
+Open Scriptures MorphHB XML files. Sense maps are extracted by streaming
+the XML and cached per book (scripts/dict/.cache/morphus/).
 """
 
+import hashlib
+import os
+import pickle
 import xml.etree.ElementTree as ET
 from typing import Dict, Optional
 import sys
@@ -15,16 +19,35 @@ from book_mappings import BookMapper
 from strong_processor import StrongProcessor
 
 
+# Bump when the extracted sense map changes shape or normalization
+MORPHUS_CACHE_VERSION = 1
+
+OSIS_NS = 'http://www.bibletechnologies.net/2003/OSIS/namespace'
+VERSE_TAG = f"{{{OSIS_NS}}}verse"
+WORD_TAG = f"{{{OSIS_NS}}}w"
+CHAPTER_TAG = f"{{{OSIS_NS}}}chapter"
+
+
 class MorphusLoader:
     """Handles loading and processing of morphus XML data."""
 
-    def __init__(self, strong_processor: StrongProcessor):
+    def __init__(self, strong_processor: StrongProcessor, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            strong_processor: Strong's processor (sense normalization)
+            cache_dir: Directory for per-book sense map caches (default: config.MORPHUS_CACHE_DIR)
+        """
         self.strong_processor = strong_processor
+        self.cache_dir = cache_dir or config.MORPHUS_CACHE_DIR
 
     def load_morphus_senses(self, book_key: str) -> Optional[Dict[str, Dict[str, str]]]:
         """
         Load BDB senses from the morphus XML file.
 
+        The sense map is cached per book and reused while the XML is
+        unchanged (size/mtime, then SHA-256), so repeated runs do not read
+        the XML at all.
+
         Returns:
             Dict with structure: {verse_ref: {position: sense}}
             Example: {"genesis.1.1": {"1": "1", "2": None, ...}}
@@ -38,45 +61,109 @@ class MorphusLoader:
         if not xml_path.exists():
             return None
 
+        # Get book name (full English book_id)
+        book_info = BookMapper.get_book_info(book_key)
+        if not book_info:
+            return None
+        book_id = BookMapper.get_book_id(book_info)
+
+        cache_file = self.cache_dir / f"{book_key}.pickle"
+        cached = self._load_cache(cache_file, xml_path)
+        if cached is not None:
+            return cached
+
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            senses = self._extract_senses(xml_path, book_id)
+        except Exception as e:
+            print(f"Warning: Error loading morphus {xml_path}: {e}")
+            return None
 
-            # Namespace
-            ns = {'osis': 'http://www.bibletechnologies.net/2003/OSIS/namespace'}
+        self._save_cache(cache_file, xml_path, senses)
+        return senses
 
-            senses = {}
+    def _extract_senses(self, xml_path: Path, book_id: str) -> Dict[str, Dict[str, str]]:
+        """
+        Stream the OSIS XML and collect the sense of every word by verse.
 
-            # Get book name (full English book_id)
-            book_info = BookMapper.get_book_info(book_key)
-            if not book_info:
-                return None
-            book_id = BookMapper.get_book_id(book_info)
+        Each verse is cleared as soon as its words are read (and each chapter
+        at its end), so at most one verse is held in memory.
+        """
+        senses = {}
 
-            # Iterate over all verses
-            for verse in root.findall('.//osis:verse', ns):
-                verse_id = verse.get('osisID', '')
+        for _, elem in ET.iterparse(xml_path, events=('end',)):
+            if elem.tag == VERSE_TAG:
+                verse_id = elem.get('osisID', '')
                 # Extract chapter and verse (e.g., "Gen.1.1" -> chapter=1, verse=1)
                 parts = verse_id.split('.')
                 if len(parts) >= 3:
-                    chapter = parts[1]
-                    verse_num = parts[2]
-                    verse_ref = f"{book_id}.{chapter}.{verse_num}"
+                    verse_ref = f"{book_id}.{parts[1]}.{parts[2]}"
 
-                    # Get all words in the verse
-                    words = verse.findall('.//osis:w', ns)
                     verse_senses = {}
-
-                    for pos, word in enumerate(words, start=1):
-                        sense_raw = word.get('n')  # The 'n' attribute contains the BDB sense
-                        # Normalize sense to simple format (without decimals)
-                        sense = self.strong_processor.normalize_sense(sense_raw)
-                        verse_senses[str(pos)] = sense
+                    for pos, word in enumerate(elem.iter(WORD_TAG), start=1):
+                        # The 'n' attribute contains the BDB sense (normalized without decimals)
+                        verse_senses[str(pos)] = self.strong_processor.normalize_sense(word.get('n'))
 
                     if verse_senses:
                         senses[verse_ref] = verse_senses
+                elem.clear()
+            elif elem.tag == CHAPTER_TAG:
+                elem.clear()
+
+        return senses
+
+    def _xml_fingerprint(self, xml_path: Path, with_hash: bool = True) -> Dict:
+        """Size, mtime and (optionally) SHA-256 of a morphus XML file"""
+        stat = xml_path.stat()
+        fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        if with_hash:
+            digest = hashlib.sha256()
+            with open(xml_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            fingerprint['sha256'] = digest.hexdigest()
+        return fingerprint
+
+    def _load_cache(self, cache_file: Path, xml_path: Path) -> Optional[Dict[str, Dict[str, str]]]:
+        """Return the cached sense map if it was extracted from this exact XML"""
+        if not cache_file.exists():
+            return None
 
-            return senses
-        except Exception as e:
-            print(f"Warning: Error loading morphus {xml_path}: {e}")
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get('version') != MORPHUS_CACHE_VERSION:
             return None
+
+        stored = cached['source']
+        current = self._xml_fingerprint(xml_path, with_hash=False)
+        if current['size'] != stored['size'] or current['mtime_ns'] != stored['mtime_ns']:
+            # Touched but possibly identical content: compare hashes
+            current = self._xml_fingerprint(xml_path)
+            if current['sha256'] != stored['sha256']:
+                return None
+            cached['source'] = current
+            self._write_cache(cache_file, cached)
+
+        return cached['senses']
+
+    def _save_cache(self, cache_file: Path, xml_path: Path, senses: Dict[str, Dict[str, str]]):
+        """Cache an extracted sense map with the fingerprint of its XML"""
+        self._write_cache(cache_file, {
+            'version': MORPHUS_CACHE_VERSION,
+            'source': self._xml_fingerprint(xml_path),
+            'senses': senses,
+        })
+
+    def _write_cache(self, cache_file: Path, cached: Dict):
+        """Atomically write a cache file (temp file + rename)"""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            print(f"Warning: could not write morphus cache {cache_file}: {e}")
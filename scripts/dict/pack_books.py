@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Pack consolidated book files into the packed columnar format
+
+Converts data/dict/books/<book_id>.json into <book_id>.pack (see
+packed_book.py), checks that every packed book reproduces its JSON file
+byte for byte, and reports the size, load time and memory gains.
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from packed_book import PackedBook, pack_book_file, packed_path
+
+# RSS growth of a child process that loads the given books one way or the other
+RSS_PROBE = """
+import json, os, random, resource, sys
+sys.path.insert(0, {scripts_dir!r})
+from packed_book import PackedBook
+
+def rss_kb():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+before = rss_kb()
+books = []
+for path in {paths!r}:
+    if {packed!r}:
+        book = PackedBook(path)
+        chapters = book.chapters()
+        rng = random.Random(0)
+        for _ in range(100):
+            book.verse(rng.choice(chapters), rng.randint(1, 20))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            book = json.load(f)
+    books.append(book)
+print(rss_kb() - before)
+"""
+
+
+def book_json_files(book_id: Optional[str] = None) -> List[Path]:
+    """Consolidated book files (pretty-printed copies are skipped)"""
+    if book_id:
+        path = config.BOOKS_DIR / f"{book_id}.json"
+        return [path] if path.exists() else []
+    return [path for path in sorted(config.BOOKS_DIR.glob("*.json")) if not path.name.endswith('.pretty.json')]
+
+
+def verify_book(json_path: Path) -> bool:
+    """Check that the packed book serializes back to the JSON file byte for byte"""
+    with PackedBook(packed_path(json_path)) as book:
+        text = json.dumps(book.to_dict(), ensure_ascii=False, separators=(',', ':'))
+    return text.encode('utf-8') == json_path.read_bytes()
+
+
+def rss_growth_kb(paths: List[Path], packed: bool) -> int:
+    """RSS growth (KB) of a child process that loads and keeps the books"""
+    code = RSS_PROBE.format(scripts_dir=str(Path(__file__).parent), paths=[str(path) for path in paths],
+                            packed=packed)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return int(output.strip())
+
+
+def benchmark(json_files: List[Path], lookups: int) -> None:
+    """Print size, load time and memory of JSON versus packed books"""
+    print(f"{'Book':<16} {'JSON KB':>9} {'Pack KB':>9} {'Ratio':>6} "
+          f"{'json.load ms':>13} {'open ms':>8} {'lookup us':>10} {'to_dict ms':>11}")
+    totals = [0, 0, 0.0, 0.0, 0.0]
+    rng = random.Random(0)
+    for json_path in json_files:
+        pack_path = packed_path(json_path)
+        json_size = json_path.stat().st_size
+        pack_size = pack_path.stat().st_size
+
+        start = time.perf_counter()
+        with open(json_path, 'r', encoding='utf-8') as f:
+            book_data = json.load(f)
+        json_seconds = time.perf_counter() - start
+
+        # Open plus the first verse, then the average cost of a random lookup
+        references = [verse['reference'] for chapter in book_data.values() for verse in chapter.values()]
+        sample = [rng.choice(references) for _ in range(lookups)]
+        start = time.perf_counter()
+        with PackedBook(pack_path) as book:
+            book.get(references[0])
+            open_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            for reference in sample:
+                book.get(reference)
+            lookup_seconds = (time.perf_counter() - start) / lookups
+
+            start = time.perf_counter()
+            book.to_dict()
+            full_seconds = time.perf_counter() - start
+
+        print(f"{json_path.stem:<16} {json_size / 1024:>9.0f} {pack_size / 1024:>9.0f} "
+              f"{json_size / pack_size:>5.1f}x {json_seconds * 1000:>13.1f} {open_seconds * 1000:>8.2f} "
+              f"{lookup_seconds * 1e6:>10.1f} {full_seconds * 1000:>11.1f}")
+        for index, value in enumerate((json_size, pack_size, json_seconds, open_seconds, full_seconds)):
+            totals[index] += value
+
+    json_size, pack_size, json_seconds, open_seconds, full_seconds = totals
+    print(f"{'TOTAL':<16} {json_size / 1024:>9.0f} {pack_size / 1024:>9.0f} "
+          f"{json_size / max(pack_size, 1):>5.1f}x {json_seconds * 1000:>13.1f} {open_seconds * 1000:>8.2f} "
+          f"{'':>10} {full_seconds * 1000:>11.1f}")
+
+    json_rss = rss_growth_kb(json_files, packed=False)
+    pack_rss = rss_growth_kb([packed_path(path) for path in json_files], packed=True)
+    print(f"\n🧠 RSS growth holding all books open: JSON {json_rss / 1024:.1f} MB, "
+          f"packed {pack_rss / 1024:.1f} MB (100 random lookups per book)")
+
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description='Pack consolidated book JSON files into the packed columnar format',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Pack every book next to its JSON file
+  python scripts/dict/pack_books.py
+
+  # Pack one book and check it round-trips to the JSON
+  python scripts/dict/pack_books.py --book genesis --verify
+
+  # Report size, load time and RSS of JSON versus packed books
+  python scripts/dict/pack_books.py --benchmark
+        """
+    )
+    parser.add_argument('--book', type=str, help='Book id to pack (e.g., genesis). Default: all books.')
+    parser.add_argument('--verify', action='store_true',
+                        help='Check that each packed book reproduces its JSON file byte for byte')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Report size, load time and RSS of JSON versus packed books')
+    parser.add_argument('--lookups', type=int, default=1000,
+                        help='Random verse lookups per book in the benchmark (default: 1000)')
+    args = parser.parse_args()
+
+    json_files = book_json_files(args.book)
+    if not json_files:
+        print(f"❌ No book files found in {config.BOOKS_DIR}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    for json_path in json_files:
+        pack_book_file(json_path)
+    print(f"📦 Packed {len(json_files)} books in {time.perf_counter() - start:.1f}s ({config.BOOKS_DIR})")
+
+    if args.verify:
+        failed = [path.stem for path in json_files if not verify_book(path)]
+        if failed:
+            print(f"❌ Round trip differs for: {', '.join(failed)}")
+            sys.exit(1)
+        print(f"✅ All {len(json_files)} packed books round-trip to their JSON files")
+
+    if args.benchmark:
+        print()
+        benchmark(json_files, max(1, args.lookups))
+
+
+if __name__ == "__main__":
+    main()
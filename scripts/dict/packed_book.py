@@ -0,0 +1,353 @@
+"""
+Packed columnar book format
+
+An optional compact alternative to the consolidated books/<book_id>.json
+files, written next to them as books/<book_id>.pack. Instead of repeating
+every word's keys, a book is stored as typed arrays (container layout in
+packed_file.py):
+
+    header      b'DVPK', format version (u16), reserved (u16),
+                metadata length (u32), metadata JSON (padded to 8 bytes):
+                book_id, Strong's table, sense table, counts and the
+                offset / typecode / length of every section
+    sections    little-endian arrays, each aligned to 8 bytes
+        chapter_numbers        H  chapter number of each chapter
+        chapter_verse_offsets  I  first verse index of each chapter (+ end)
+        verse_numbers          H  verse number of each verse
+        verse_word_offsets     I  first word index of each verse (+ end)
+        verse_text_offsets     I  hebrew_text of each verse in the blob (+ end)
+        word_strong_ids        H  index into the Strong's table (0xFFFF = null)
+        word_sense_ids         B/H index into the sense table (max = null)
+        word_text_offsets      I  hebrew of each word in the blob (+ end)
+        blob                   all Hebrew strings, UTF-8, back to back
+
+reference, book_id, chapter, verse and position are derived on read, so a
+packed book round-trips to exactly the JSON verse objects. PackedBook
+memory-maps the file and decodes only the verses that are asked for.
+"""
+
+import json
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from packed_file import PackedFile, pack_sections, write_bytes_atomic
+
+MAGIC = b'DVPK'
+FORMAT_VERSION = 1
+PACKED_SUFFIX = '.pack'
+
+NULL_ID = 0xFFFF
+
+VERSE_KEYS = ['reference', 'book_id', 'chapter', 'verse', 'hebrew_text', 'words']
+WORD_KEYS = ['position', 'hebrew', 'strong_number', 'sense']
+
+# Array sections in file order (the blob follows them)
+SECTIONS = [
+    'chapter_numbers',
+    'chapter_verse_offsets',
+    'verse_numbers',
+    'verse_word_offsets',
+    'verse_text_offsets',
+    'word_strong_ids',
+    'word_sense_ids',
+    'word_text_offsets',
+]
+
+
+def packed_path(json_path: Path) -> Path:
+    """Packed file that sits next to a consolidated book JSON file"""
+    return json_path.with_suffix(PACKED_SUFFIX)
+
+
+class PackedBookWriter:
+    """
+    Accumulates a book chapter by chapter and writes it in packed form.
+
+    Chapters must be added in ascending order with their verses sorted, as
+    build_verses.py writes them; anything that would not round-trip exactly
+    (unexpected keys, inconsistent references, non-sequential positions)
+    raises ValueError.
+    """
+
+    def __init__(self, book_id: str):
+        """
+        Initialize writer.
+
+        Args:
+            book_id: Book id used in references (e.g., "genesis")
+        """
+        self.book_id = book_id
+        self.strongs: List[str] = []
+        self.strong_ids: Dict[str, int] = {}
+        self.senses: List[str] = []
+        self.sense_ids: Dict[str, int] = {}
+
+        self.chapter_numbers = array('H')
+        self.chapter_verse_offsets = array('I', [0])
+        self.verse_numbers = array('H')
+        self.verse_word_offsets = array('I', [0])
+        self.verse_text_offsets = array('I', [0])
+        self.word_strong_ids = array('H')
+        self.word_sense_ids = array('H')
+        self.word_text_offsets = array('I', [0])
+        self.blob = bytearray()
+        self.verse_texts = bytearray()
+
+    def add_chapter(self, chapter: Union[str, int], verses: Dict[str, Dict]):
+        """
+        Append one chapter.
+
+        Args:
+            chapter: Chapter number (JSON key)
+            verses: Verse number (JSON key) -> verse object
+        """
+        chapter_num = int(chapter)
+        if self.chapter_numbers and chapter_num <= self.chapter_numbers[-1]:
+            raise ValueError(f"{self.book_id}: chapter {chapter_num} is out of order")
+
+        previous_verse = 0
+        for verse_key, verse in verses.items():
+            verse_num = int(verse_key)
+            if verse_num <= previous_verse:
+                raise ValueError(f"{self.book_id}.{chapter_num}: verse {verse_num} is out of order")
+            previous_verse = verse_num
+            self._check_verse(chapter_num, verse_num, verse)
+
+            self.verse_numbers.append(verse_num)
+            self.verse_texts += verse['hebrew_text'].encode('utf-8')
+            self.verse_text_offsets.append(len(self.verse_texts))
+
+            for word in verse['words']:
+                self.word_strong_ids.append(self._strong_id(word['strong_number']))
+                self.word_sense_ids.append(self._sense_id(word['sense']))
+                self.blob += word['hebrew'].encode('utf-8')
+                self.word_text_offsets.append(len(self.blob))
+            self.verse_word_offsets.append(len(self.word_strong_ids))
+
+        self.chapter_numbers.append(chapter_num)
+        self.chapter_verse_offsets.append(len(self.verse_numbers))
+
+    def add_book(self, book_data: Dict[str, Dict]):
+        """Append every chapter of a consolidated book (chapter -> verses)"""
+        for chapter, verses in book_data.items():
+            self.add_chapter(chapter, verses)
+
+    def _check_verse(self, chapter_num: int, verse_num: int, verse: Dict):
+        """Reject verse objects the packed format would not reproduce exactly"""
+        where = f"{self.book_id}.{chapter_num}.{verse_num}"
+        if list(verse.keys()) != VERSE_KEYS:
+            raise ValueError(f"{where}: unexpected verse keys {list(verse.keys())}")
+        if (verse['reference'] != where or verse['book_id'] != self.book_id
+                or verse['chapter'] != chapter_num or verse['verse'] != verse_num):
+            raise ValueError(f"{where}: reference fields do not match the verse position")
+        for position, word in enumerate(verse['words'], start=1):
+            if list(word.keys()) != WORD_KEYS or word['position'] != position:
+                raise ValueError(f"{where}: word {position} cannot be packed")
+            if word['sense'] is not None and not isinstance(word['sense'], str):
+                raise ValueError(f"{where}: word {position} has a non-string sense")
+
+    def _strong_id(self, strong_number: Optional[str]) -> int:
+        """Intern a Strong's number"""
+        if strong_number is None:
+            return NULL_ID
+        strong_id = self.strong_ids.get(strong_number)
+        if strong_id is None:
+            strong_id = len(self.strongs)
+            if strong_id >= NULL_ID:
+                raise ValueError(f"{self.book_id}: too many distinct Strong's numbers")
+            self.strong_ids[strong_number] = strong_id
+            self.strongs.append(strong_number)
+        return strong_id
+
+    def _sense_id(self, sense: Optional[str]) -> int:
+        """Intern a sense (null is NULL_ID until the table is complete)"""
+        if sense is None:
+            return NULL_ID
+        sense_id = self.sense_ids.get(sense)
+        if sense_id is None:
+            sense_id = len(self.senses)
+            if sense_id >= NULL_ID:
+                raise ValueError(f"{self.book_id}: too many distinct senses")
+            self.sense_ids[sense] = sense_id
+            self.senses.append(sense)
+        return sense_id
+
+    def _sense_array(self) -> array:
+        """Sense ids of all words, narrowed to bytes when the table is small (null = table size)"""
+        null_sense = len(self.senses)
+        typecode = 'B' if null_sense <= 0xFF else 'H'
+        return array(typecode, (null_sense if sense_id == NULL_ID else sense_id
+                                for sense_id in self.word_sense_ids))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the accumulated book"""
+        # Verse texts come first in the blob, then word texts
+        text_size = len(self.verse_texts)
+        word_text_offsets = array('I', (offset + text_size for offset in self.word_text_offsets))
+        arrays = {
+            'chapter_numbers': self.chapter_numbers,
+            'chapter_verse_offsets': self.chapter_verse_offsets,
+            'verse_numbers': self.verse_numbers,
+            'verse_word_offsets': self.verse_word_offsets,
+            'verse_text_offsets': self.verse_text_offsets,
+            'word_strong_ids': self.word_strong_ids,
+            'word_sense_ids': self._sense_array(),
+            'word_text_offsets': word_text_offsets,
+        }
+        blob = bytes(self.verse_texts) + bytes(self.blob)
+
+        meta = {
+            'book_id': self.book_id,
+            'strongs': self.strongs,
+            'senses': self.senses,
+            'chapters': len(self.chapter_numbers),
+            'verses': len(self.verse_numbers),
+            'words': len(self.word_strong_ids),
+        }
+        return pack_sections(MAGIC, FORMAT_VERSION, meta, [(name, arrays[name]) for name in SECTIONS], blob)
+
+    def save(self, path: Path):
+        """Write the packed book atomically (temp file + rename)"""
+        write_bytes_atomic(path, self.to_bytes())
+
+
+class PackedBook:
+    """
+    Read-only view of a packed book with random access by reference.
+
+    The file is memory-mapped; opening it reads only the header, and each
+    lookup decodes just the requested verse.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a packed book.
+
+        Args:
+            path: .pack file
+        """
+        self.path = Path(path)
+        self._packed = PackedFile(self.path, MAGIC, FORMAT_VERSION)
+        meta = self._packed.meta
+
+        self.book_id: str = meta['book_id']
+        self.strongs: List[str] = meta['strongs']
+        self.senses: List[Optional[str]] = meta['senses'] + [None]
+        self.verse_count: int = meta['verses']
+        self.word_count: int = meta['words']
+
+        for name in SECTIONS:
+            setattr(self, f"_{name}", self._packed.section(name))
+        self._text = self._packed.text
+
+        self._chapter_index = {number: index for index, number in enumerate(self._chapter_numbers)}
+
+    def close(self):
+        """Release the memory map"""
+        self._packed.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.verse_count
+
+    def chapters(self) -> List[int]:
+        """Chapter numbers in the book"""
+        return list(self._chapter_numbers)
+
+    def _verse_index(self, chapter: int, verse: int) -> Optional[int]:
+        """Global index of a verse, or None if absent"""
+        chapter_index = self._chapter_index.get(chapter)
+        if chapter_index is None:
+            return None
+        low = self._chapter_verse_offsets[chapter_index]
+        high = self._chapter_verse_offsets[chapter_index + 1]
+        index = bisect_left(self._verse_numbers, verse, low, high)
+        if index < high and self._verse_numbers[index] == verse:
+            return index
+        return None
+
+    def _build_verse(self, chapter: int, index: int) -> Dict:
+        """Decode the verse object at a global index"""
+        verse = self._verse_numbers[index]
+        words = []
+        first_word = self._verse_word_offsets[index]
+        for word_index in range(first_word, self._verse_word_offsets[index + 1]):
+            strong_id = self._word_strong_ids[word_index]
+            words.append({
+                'position': word_index - first_word + 1,
+                'hebrew': self._text(self._word_text_offsets[word_index], self._word_text_offsets[word_index + 1]),
+                'strong_number': None if strong_id == NULL_ID else self.strongs[strong_id],
+                'sense': self.senses[self._word_sense_ids[word_index]],
+            })
+        return {
+            'reference': f"{self.book_id}.{chapter}.{verse}",
+            'book_id': self.book_id,
+            'chapter': chapter,
+            'verse': verse,
+            'hebrew_text': self._text(self._verse_text_offsets[index], self._verse_text_offsets[index + 1]),
+            'words': words,
+        }
+
+    def verse(self, chapter: int, verse: int) -> Optional[Dict]:
+        """
+        Verse object by chapter and verse number.
+
+        Returns:
+            The verse exactly as in the JSON book, or None if absent
+        """
+        index = self._verse_index(int(chapter), int(verse))
+        return None if index is None else self._build_verse(int(chapter), index)
+
+    def get(self, reference: str) -> Optional[Dict]:
+        """Verse object by reference (e.g., "ruth.2.4"), or None if absent"""
+        book_id, _, location = reference.partition('.')
+        chapter, _, verse = location.partition('.')
+        if book_id != self.book_id or not chapter.isdigit() or not verse.isdigit():
+            return None
+        return self.verse(int(chapter), int(verse))
+
+    def iter_chapters(self) -> Iterator[Tuple[str, Dict[str, Dict]]]:
+        """Yield (chapter, {verse: verse object}) in order, like the JSON book"""
+        for chapter_index, chapter in enumerate(self._chapter_numbers):
+            low = self._chapter_verse_offsets[chapter_index]
+            high = self._chapter_verse_offsets[chapter_index + 1]
+            yield str(chapter), {str(self._verse_numbers[index]): self._build_verse(chapter, index)
+                                 for index in range(low, high)}
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Whole book in the consolidated JSON structure"""
+        return dict(self.iter_chapters())
+
+
+def pack_book_file(json_path: Path, output_path: Optional[Path] = None) -> Path:
+    """
+    Pack a consolidated book JSON file.
+
+    Args:
+        json_path: books/<book_id>.json
+        output_path: Packed file (default: next to the JSON file)
+
+    Returns:
+        Path of the packed file
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        book_data = json.load(f)
+    writer = PackedBookWriter(Path(json_path).stem)
+    writer.add_book(book_data)
+    output_path = output_path or packed_path(Path(json_path))
+    writer.save(output_path)
+    return output_path
+
+
+def iter_with_packer(chapters: Iterable[Tuple[str, Dict]], writer: PackedBookWriter) -> Iterator[Tuple[str, Dict]]:
+    """Pass (chapter, verses) pairs through while also adding them to a writer"""
+    for chapter, verses in chapters:
+        writer.add_chapter(chapter, verses)
+        yield chapter, verses
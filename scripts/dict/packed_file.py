@@ -0,0 +1,160 @@
+"""
+Container for memory-mapped packed files
+
+Shared by packed_book.py and corpus_store.py. A packed file is:
+
+    magic (4 bytes), format version (u16), reserved (u16),
+    metadata length (u32), metadata JSON (padded to 8 bytes),
+    typed little-endian array sections (each aligned to 8 bytes),
+    one UTF-8 blob
+
+The metadata records the offset / typecode / length of every section
+(relative to the end of the padded metadata) under 'sections'. PackedFile
+maps the file once and exposes the sections as zero-copy array views.
+"""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+HEADER_SIZE = 12
+ALIGNMENT = 8
+
+
+def _padding(size: int) -> int:
+    """Bytes needed to align size to ALIGNMENT"""
+    return -size % ALIGNMENT
+
+
+def pack_sections(magic: bytes, version: int, meta: Dict, sections: List[Tuple[str, array]], blob: bytes) -> bytes:
+    """
+    Serialize metadata, array sections and a blob into a packed file.
+
+    Args:
+        magic: 4-byte file signature
+        version: Format version
+        meta: Metadata (the section layout is added under 'sections')
+        sections: (name, array) pairs in file order
+        blob: Trailing bytes (stored as the 'blob' section)
+
+    Returns:
+        File contents
+    """
+    layout = {}
+    offset = 0
+    for name, values in sections:
+        layout[name] = [offset, values.typecode, len(values)]
+        offset += values.itemsize * len(values)
+        offset += _padding(offset)
+    layout['blob'] = [offset, 'B', len(blob)]
+
+    meta_bytes = json.dumps({**meta, 'sections': layout}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    parts = [magic, version.to_bytes(2, 'little'), bytes(2), len(meta_bytes).to_bytes(4, 'little'),
+             meta_bytes, b' ' * _padding(HEADER_SIZE + len(meta_bytes))]
+    for _, values in sections:
+        if sys.byteorder != 'little':
+            values = array(values.typecode, values)
+            values.byteswap()
+        data = values.tobytes()
+        parts.append(data)
+        parts.append(b'\0' * _padding(len(data)))
+    parts.append(blob)
+    return b''.join(parts)
+
+
+def write_bytes_atomic(path: Union[str, Path], data: bytes):
+    """Write a file through a temp file next to it, then rename it into place"""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
+class PackedFile:
+    """
+    Read-only memory map of a packed file.
+    """
+
+    def __init__(self, path: Union[str, Path], magic: bytes, version: int):
+        """
+        Map a packed file and parse its metadata.
+
+        Args:
+            path: File to open
+            magic: Expected signature
+            version: Expected format version
+
+        Raises:
+            ValueError: If the file has another signature or version
+        """
+        self.path = Path(path)
+        self._views: List[memoryview] = []
+        self._view = None
+        self._file = open(self.path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+
+        header = self._mm[:HEADER_SIZE]
+        if header[:4] != magic:
+            self.close()
+            raise ValueError(f"{self.path}: unexpected file signature")
+        found_version = int.from_bytes(header[4:6], 'little')
+        if found_version != version:
+            self.close()
+            raise ValueError(f"{self.path}: unsupported format version {found_version}")
+
+        meta_size = int.from_bytes(header[8:12], 'little')
+        self.meta: Dict = json.loads(self._mm[HEADER_SIZE:HEADER_SIZE + meta_size].decode('utf-8'))
+        self._data_start = HEADER_SIZE + meta_size + _padding(HEADER_SIZE + meta_size)
+        self._blob_start = self._data_start + self.meta['sections']['blob'][0]
+        self._view = memoryview(self._mm)
+
+    def section(self, name: str):
+        """Array view of a section (zero-copy on little-endian hosts)"""
+        offset, typecode, count = self.meta['sections'][name]
+        start = self._data_start + offset
+        raw = self._view[start:start + array(typecode).itemsize * count]
+        if sys.byteorder == 'little':
+            values = raw.cast(typecode)
+            self._views.extend([values, raw])
+            return values
+        values = array(typecode)
+        values.frombytes(raw)
+        values.byteswap()
+        raw.release()
+        return values
+
+    def text(self, start: int, end: int) -> str:
+        """Decode a UTF-8 string from the blob"""
+        return self._mm[self._blob_start + start:self._blob_start + end].decode('utf-8')
+
+    def close(self):
+        """Release the memory map"""
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
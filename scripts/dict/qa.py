@@ -9,7 +9,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Set, Optional
 from collections import defaultdict
-import xml.etree.ElementTree as ET
+
+from lexicon_sources import get_lexicon_sources
 
 # Project paths
 SCRIPTS_DIR = Path(__file__).parent
@@ -19,38 +20,23 @@ LEXICON_DIR = DATA_DIR / 'lexicon'
 LEXICON_DRAFT = LEXICON_DIR / 'words'  # Now called 'words' instead of 'draft'
 LEXICON_ROOTS = LEXICON_DIR / 'roots'
 RAW_DIR = DATA_DIR / 'raw'
-STRONGS_FILE = RAW_DIR / 'strongs_hebrew_dict_en.json'
-STRONG_REFS_FILE = RAW_DIR / 'strong_refs.json'
-BDB_XML = RAW_DIR / 'BrownDriverBriggs.xml'
 
 NS = {'bdb': 'http://openscriptures.github.com/morphhb/namespace'}
 
 
 def load_strongs_data() -> Dict:
-    """Load Strong's dictionary data"""
-    if STRONGS_FILE.exists():
-        with open(STRONGS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Load Strong's dictionary data (shared lexicon sources snapshot)"""
+    return get_lexicon_sources().strongs
 
 
 def load_strong_refs() -> Dict:
-    """Load Strong's references data"""
-    if STRONG_REFS_FILE.exists():
-        with open(STRONG_REFS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Load Strong's references data (shared lexicon sources snapshot)"""
+    return get_lexicon_sources().refs
 
 
 def load_bdb_xml():
-    """Load BDB XML file"""
-    if not BDB_XML.exists():
-        return None
-    try:
-        tree = ET.parse(BDB_XML)
-        return tree.getroot()
-    except Exception:
-        return None
+    """Load BDB XML file (shared lexicon sources)"""
+    return get_lexicon_sources().bdb_root
 
 
 def validate_file_structure(filepath: Path, is_root: bool) -> Dict:
@@ -408,7 +394,7 @@ def check_etymological_definitions(bdb_root) -> Dict:
                 from pathlib import Path
                 sys.path.insert(0, str(Path(__file__).parent))
                 from lexicon_builder import find_bdb_entry
-                bdb_entry = find_bdb_entry(hebrew_word, bdb_root)
+                bdb_entry = find_bdb_entry(hebrew_word, bdb_root, strong_number=data.get('strong_number'))
                 if bdb_entry:
                     main_defs = bdb_entry.findall('./bdb:def', NS)
                     if len(main_defs) == 0:
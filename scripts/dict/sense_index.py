@@ -0,0 +1,91 @@
+"""
+In-memory sense index for verse building.
+
+Maps each Strong's number to the sorted tuple of senses its lexicon entry
+defines. The per-entry files lexicon/words/H####.json and roots/H####.json
+are read once when the index is built, instead of being opened again for
+every word; lookups then give the same senses as reading the files.
+"""
+
+import json
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import sys
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+
+
+def _entry_senses(entry: Dict) -> Tuple[str, ...]:
+    """Sorted distinct senses of a lexicon entry's definitions"""
+    return tuple(sorted({defn['sense'] for defn in entry.get('definitions', []) if defn.get('sense')}))
+
+
+class SenseIndex:
+    """Strong's number -> sorted senses, with exact / sub-sense lookups."""
+
+    def __init__(self, words_dir: Optional[Path] = None, roots_dir: Optional[Path] = None):
+        """
+        Initialize the index (loaded lazily on first lookup).
+
+        Args:
+            words_dir: Per-entry word files (default: config.LEXICON_DRAFT_DIR)
+            roots_dir: Per-entry root files (default: config.LEXICON_ROOTS_DIR)
+        """
+        self.words_dir = words_dir or config.LEXICON_DRAFT_DIR
+        self.roots_dir = roots_dir or config.LEXICON_ROOTS_DIR
+        self.senses: Dict[str, Tuple[str, ...]] = {}
+        self.loaded = False
+        self.indexed = 0
+
+        # Lookup statistics
+        self.lookups = 0
+
+    def load(self) -> None:
+        """Build the index from words/, then roots/ for entries without senses."""
+        self.senses = {}
+        for directory in (self.words_dir, self.roots_dir):
+            if not directory.is_dir():
+                continue
+            for entry_file in sorted(directory.glob('*.json')):
+                # words/ takes precedence over roots/ unless it defines no senses
+                if self.senses.get(entry_file.stem):
+                    continue
+                try:
+                    with open(entry_file, 'r', encoding='utf-8') as f:
+                        self.senses[entry_file.stem] = _entry_senses(json.load(f))
+                except Exception:
+                    continue
+
+        self.indexed = len(self.senses)
+        self.loaded = True
+
+    def get_senses(self, strong_number: str, count: bool = True) -> Tuple[str, ...]:
+        """
+        Sorted senses available in the lexicon for a Strong's number.
+
+        Args:
+            strong_number: Strong's number (e.g., "H1254")
+            count: Count this call in the lookup statistics
+
+        Returns:
+            Sorted tuple of senses, empty if the entry is unknown
+        """
+        if not self.loaded:
+            self.load()
+
+        if count:
+            self.lookups += 1
+        return self.senses.get(strong_number, ())
+
+    def has_sense(self, strong_number: str, sense: str) -> bool:
+        """
+        Check whether a sense exists exactly or as a parent of sub-senses.
+
+        "1" is valid if the lexicon has "1" itself or e.g. "1a", "1b"; both
+        cases are found with one bisect over the sorted senses, since every
+        sense starting with "1" sorts right after it.
+        """
+        senses = self.get_senses(strong_number)
+        position = bisect_left(senses, sense)
+        return position < len(senses) and senses[position].startswith(sense)
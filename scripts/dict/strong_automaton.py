@@ -0,0 +1,89 @@
+"""
+Aho-Corasick automaton over Strong's number sequences
+
+Compiles any number of Strong's sequences (single numbers, compounds such
+as H1121+H430, alternatives expanded to one sequence per number) into one
+automaton, so a verse's words are matched against all of them in a single
+left-to-right pass instead of once per pattern. Symbols are base Strong's
+numbers; words without one (None) never match.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class StrongSequenceAutomaton:
+    """
+    Multi-pattern matcher for consecutive Strong's numbers.
+    """
+
+    def __init__(self):
+        """Initialize an empty automaton (add patterns, then build)."""
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # Patterns ending at each state: (pattern length, payload)
+        self.outputs: List[List[Tuple[int, Any]]] = [[]]
+        self.patterns = 0
+        self.built = False
+
+    def add(self, sequence: Sequence[str], payload: Any):
+        """
+        Add a pattern.
+
+        Args:
+            sequence: Consecutive base Strong's numbers (e.g., ['H1121', 'H430'])
+            payload: Value reported with every match of this pattern
+        """
+        if not sequence:
+            raise ValueError("empty Strong's sequence")
+        state = 0
+        for symbol in sequence:
+            next_state = self.goto[state].get(symbol)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][symbol] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state].append((len(sequence), payload))
+        self.patterns += 1
+        self.built = False
+
+    def build(self):
+        """Compute failure links (breadth first) and merge suffix outputs."""
+        queue = deque(self.goto[0].values())
+        for state in queue:
+            self.fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for symbol, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and symbol not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(symbol, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+        self.built = True
+
+    def iter_matches(self, symbols: Sequence[Optional[str]]) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Find every (possibly overlapping) occurrence of every pattern.
+
+        Args:
+            symbols: Base Strong's number of each word (None for none)
+
+        Yields:
+            (start index, pattern length, payload), ordered by end index
+        """
+        if not self.built:
+            self.build()
+
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for index, symbol in enumerate(symbols):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for length, payload in outputs[state]:
+                yield index - length + 1, length, payload
@@ -6,11 +6,11 @@ including morphological analysis and lexicon validation.
 """
 
 import re
-from typing import Dict, List, Optional, Set
+from typing import Optional, Set
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
-from config import config
+from sense_index import SenseIndex
 
 
 class StrongProcessor:
@@ -28,8 +28,12 @@ class StrongProcessor:
         'm': 'H4480',   # מִן (min) - from
     }
 
-    def __init__(self):
-        pass
+    def __init__(self, sense_index: Optional[SenseIndex] = None):
+        """
+        Args:
+            sense_index: Lexicon sense index (a lazily loaded one is created if omitted)
+        """
+        self.sense_index = sense_index or SenseIndex()
 
     def extract_strong_number(self, lemma: str) -> Optional[str]:
         """
@@ -94,43 +98,7 @@ class StrongProcessor:
         if not strong_number:
             return set()
 
-        available_senses = set()
-
-        # Try draft/ directory first
-        draft_file = config.LEXICON_DRAFT_DIR / f"{strong_number}.json"
-        if draft_file.exists():
-            try:
-                with open(draft_file, 'r', encoding='utf-8') as f:
-                    lexicon_data = f.read()
-                    # Simple JSON parsing to avoid import issues
-                    import json
-                    lexicon_data = json.loads(lexicon_data)
-                    definitions = lexicon_data.get('definitions', [])
-                    for defn in definitions:
-                        sense = defn.get('sense')
-                        if sense:
-                            available_senses.add(sense)
-            except Exception:
-                pass
-
-        # Try roots/ directory
-        if not available_senses:
-            roots_file = config.LEXICON_ROOTS_DIR / f"{strong_number}.json"
-            if roots_file.exists():
-                try:
-                    with open(roots_file, 'r', encoding='utf-8') as f:
-                        lexicon_data = f.read()
-                        import json
-                        lexicon_data = json.loads(lexicon_data)
-                        definitions = lexicon_data.get('definitions', [])
-                        for defn in definitions:
-                            sense = defn.get('sense')
-                            if sense:
-                                available_senses.add(sense)
-                except Exception:
-                    pass
-
-        return available_senses
+        return set(self.sense_index.get_senses(strong_number))
 
     def validate_sense(self, strong_number: str, sense: Optional[str]) -> Optional[str]:
         """
@@ -149,19 +117,9 @@ class StrongProcessor:
         if not sense or not strong_number:
             return None
 
-        available_senses = self.get_lexicon_available_senses(strong_number)
-
-        # If sense exists exactly in lexicon, return it
-        if sense in available_senses:
-            return sense
-
-        # If sense doesn't exist, check if there are sub-senses
-        # (e.g., sense="1" but lexicon has "1a", "1b")
-        # If there are sub-senses, the parent sense "1" is valid
-        has_sub_senses = any(s.startswith(sense) and len(s) > len(sense) for s in available_senses)
-
-        if has_sub_senses:
-            # The sense is a parent category (e.g., "1" is parent of "1a", "1b")
+        # Exact sense, or a parent category with sub-senses
+        # (e.g., sense="1" and the lexicon has "1a", "1b")
+        if self.sense_index.has_sense(strong_number, sense):
             return sense
 
         # Sense doesn't exist and no sub-senses found - invalid
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for saving lexicon entries into the consolidated words.json / roots.json
+Checks that building a few entries never drops the other consolidated entries
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add the scripts directory to Python path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+import build_lexicon
+from config import config
+
+
+def make_entry(strong_number, is_root):
+    """Minimal built lexicon entry"""
+    return {
+        'strong_number': strong_number,
+        'lemma': 'אב',
+        'definitions': [{'text_en': 'father', 'source': 'bdb', 'order': 1, 'sense': '0'}],
+        'is_root': is_root,
+    }
+
+
+class TempLexicon:
+    """Point the lexicon directories at a temp dir holding a committed roots.json"""
+
+    ROOTS = {
+        'H1': {'strong_number': 'H1', 'definitions': [{'text_en': 'father', 'text_es': 'padre', 'order': 1}]},
+        'H6': {'strong_number': 'H6', 'definitions': [{'text_en': 'perish', 'text_es': 'perecer', 'order': 1}]},
+    }
+
+    def __enter__(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.tmp_dir.name)
+        self.saved = (config.LEXICON_DIR, config.LEXICON_DRAFT_DIR, config.LEXICON_ROOTS_DIR)
+        config.LEXICON_DIR = root
+        config.LEXICON_DRAFT_DIR = root / 'words'
+        config.LEXICON_ROOTS_DIR = root / 'roots'
+        with open(root / 'roots.json', 'w', encoding='utf-8') as f:
+            json.dump(self.ROOTS, f, ensure_ascii=False)
+        build_lexicon.consolidated_roots.clear()
+        build_lexicon.consolidated_words.clear()
+        return root
+
+    def __exit__(self, *exc):
+        config.LEXICON_DIR, config.LEXICON_DRAFT_DIR, config.LEXICON_ROOTS_DIR = self.saved
+        build_lexicon.consolidated_roots.clear()
+        build_lexicon.consolidated_words.clear()
+        self.tmp_dir.cleanup()
+
+
+def test_full_run_keeps_roots():
+    """Test that a run building one missing root leaves roots.json intact"""
+    print("Testing consolidated roots after a default run...")
+
+    with TempLexicon() as root:
+        build_lexicon.save_lexicon_entry(make_entry('H3', is_root=True))
+        build_lexicon.save_lexicon_entry(make_entry('H2', is_root=False))
+        build_lexicon.save_consolidated_files()
+
+        with open(root / 'roots.json', 'r', encoding='utf-8') as f:
+            assert json.load(f) == TempLexicon.ROOTS
+        assert (root / 'roots' / 'H3.json').exists()
+        with open(root / 'words.json', 'r', encoding='utf-8') as f:
+            assert list(json.load(f)) == ['H2']
+
+    print("✓ Default run tests passed\n")
+
+
+def test_incremental_run_patches_roots():
+    """Test that an incremental run adds a rebuilt root and keeps the others"""
+    print("Testing consolidated roots after an incremental run...")
+
+    with TempLexicon() as root:
+        build_lexicon.save_lexicon_entry(make_entry('H3', is_root=True), consolidate_roots=True)
+        # H6 failed to rebuild: its old entry stays
+        build_lexicon.patch_consolidated_files(['H3', 'H6'])
+
+        with open(root / 'roots.json', 'r', encoding='utf-8') as f:
+            roots = json.load(f)
+        assert roots['H1'] == TempLexicon.ROOTS['H1']
+        assert roots['H6'] == TempLexicon.ROOTS['H6']
+        assert roots['H3']['strong_number'] == 'H3' and 'root_ref' not in roots['H3']
+
+    print("✓ Incremental run tests passed\n")
+
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing consolidated lexicon files\n")
+
+    try:
+        test_full_run_keeps_roots()
+        test_incremental_run_patches_roots()
+
+        print("🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
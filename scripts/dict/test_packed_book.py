@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for the packed columnar book format
+Packs a small synthetic book and checks it reads back as the exact JSON
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add the scripts directory to Python path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+from json_stream import StreamDict, write_json_atomic
+from packed_book import PackedBook, PackedBookWriter, pack_book_file, packed_path
+
+
+def make_verse(chapter, verse, words):
+    """Verse object as build_verses.py writes it"""
+    return {
+        'reference': f"ruth.{chapter}.{verse}",
+        'book_id': 'ruth',
+        'chapter': chapter,
+        'verse': verse,
+        'hebrew_text': ' '.join(hebrew for hebrew, _, _ in words),
+        'words': [
+            {'position': position, 'hebrew': hebrew, 'strong_number': strong_number, 'sense': sense}
+            for position, (hebrew, strong_number, sense) in enumerate(words, start=1)
+        ],
+    }
+
+
+def make_book():
+    """Synthetic two-chapter book with null senses and null Strong's numbers"""
+    return {
+        '1': {
+            '1': make_verse(1, 1, [('וַיְהִ֗י', 'H1961', '1'), ('בִּימֵי֙', 'H3117', '0'),
+                                   ('שְׁפֹ֣ט', 'H8199', None)]),
+            '2': make_verse(1, 2, [('וְשֵׁ֣ם', None, None), ('הָאִ֣ישׁ', 'H376', '2a'),
+                                   ('אֱלִימֶ֡לֶךְ', None, '1')]),
+            '10': make_verse(1, 10, []),
+        },
+        '3': {
+            '4': make_verse(3, 4, [('וִיהִ֣י', 'H1961', '1'), ('בְשָׁכְב֗וֹ', 'H7901', None)]),
+        },
+    }
+
+
+def write_book(path, book_data):
+    """Write a consolidated book JSON file the way build_verses.py does"""
+    write_json_atomic(path, StreamDict(book_data.items()), ensure_ascii=False, separators=(',', ':'))
+
+
+def test_round_trip():
+    """Test that a packed book reproduces the JSON book byte for byte"""
+    print("Testing packed book round trip...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = Path(tmp_dir) / "ruth.json"
+        write_book(json_path, make_book())
+        original = json_path.read_bytes()
+
+        with open(json_path, 'r', encoding='utf-8') as f:
+            book_data = json.load(f)
+        writer = PackedBookWriter('ruth')
+        writer.add_book(book_data)
+        writer.save(packed_path(json_path))
+
+        with PackedBook(packed_path(json_path)) as book:
+            assert book.chapters() == [1, 3]
+            assert len(book) == 4
+
+            # iter_chapters() rewrites the identical file
+            copy_path = Path(tmp_dir) / "ruth.copy.json"
+            write_book(copy_path, dict(book.iter_chapters()))
+            assert copy_path.read_bytes() == original
+
+            # get() returns each verse exactly, including null senses / Strong's numbers
+            for chapter, verses in book_data.items():
+                for verse_num, verse in verses.items():
+                    reference = f"ruth.{chapter}.{verse_num}"
+                    assert book.get(reference) == verse, reference
+                    assert json.dumps(book.get(reference), ensure_ascii=False) == \
+                        json.dumps(verse, ensure_ascii=False)
+
+            words = book.get('ruth.1.2')['words']
+            assert words[0]['strong_number'] is None and words[0]['sense'] is None
+            assert words[2]['strong_number'] is None and words[2]['sense'] == '1'
+            assert book.get('ruth.1.3') is None
+            assert book.get('ruth.2.1') is None
+            assert book.get('genesis.1.1') is None
+
+    print("✓ Packed book round trip tests passed\n")
+
+
+def test_pack_book_file():
+    """Test packing an existing JSON book file"""
+    print("Testing pack_book_file...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = Path(tmp_dir) / "ruth.json"
+        write_book(json_path, make_book())
+
+        output_path = pack_book_file(json_path)
+        assert output_path == Path(tmp_dir) / "ruth.pack"
+        with PackedBook(output_path) as book:
+            assert book.to_dict() == make_book()
+
+    print("✓ pack_book_file tests passed\n")
+
+
+def test_wide_sense_table():
+    """Test that more than 255 distinct senses switch to 16-bit sense ids"""
+    print("Testing wide sense table...")
+
+    words = [(f"מ{index}", f"H{index}", str(index)) for index in range(300)] + [('ה', 'H1', None)]
+    book_data = {'1': {'1': make_verse(1, 1, words)}}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "ruth.pack"
+        writer = PackedBookWriter('ruth')
+        writer.add_book(book_data)
+        writer.save(path)
+        with PackedBook(path) as book:
+            assert book.to_dict() == book_data
+
+    print("✓ Wide sense table tests passed\n")
+
+
+def test_rejects_unpackable():
+    """Test that data which would not round-trip is rejected"""
+    print("Testing unpackable books...")
+
+    book_data = make_book()
+    writer = PackedBookWriter('ruth')
+    writer.add_chapter('3', book_data['3'])
+    try:
+        writer.add_chapter('1', book_data['1'])
+        assert False, "out-of-order chapter was accepted"
+    except ValueError:
+        pass
+
+    verse = make_verse(1, 1, [('וַיְהִ֗י', 'H1961', '1')])
+    verse['words'][0]['position'] = 2
+    try:
+        PackedBookWriter('ruth').add_chapter('1', {'1': verse})
+        assert False, "non-sequential position was accepted"
+    except ValueError:
+        pass
+
+    print("✓ Unpackable book tests passed\n")
+
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing packed book format\n")
+
+    try:
+        test_round_trip()
+        test_pack_book_file()
+        test_wide_sense_table()
+        test_rejects_unpackable()
+
+        print("🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
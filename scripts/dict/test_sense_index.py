@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory sense index
+Checks that lookups match reading the per-entry lexicon files
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add the scripts directory to Python path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sense_index import SenseIndex
+
+
+def write_entry(directory, strong_number, senses):
+    """Write a per-entry lexicon file with one definition per sense (None = no sense)"""
+    directory.mkdir(parents=True, exist_ok=True)
+    definitions = [{'text_en': 'text', 'source': 'bdb', 'order': order, 'sense': sense}
+                   for order, sense in enumerate(senses, start=1)]
+    with open(directory / f"{strong_number}.json", 'w', encoding='utf-8') as f:
+        json.dump({'strong_number': strong_number, 'definitions': definitions}, f)
+
+
+def test_per_entry_precedence():
+    """Test words/ before roots/, and roots/ only for entries without senses"""
+    print("Testing sense index precedence...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lexicon_dir = Path(tmp_dir)
+        words_dir = lexicon_dir / 'words'
+        roots_dir = lexicon_dir / 'roots'
+
+        write_entry(words_dir, 'H1', ['1b', '0', '1a', '0'])
+        write_entry(roots_dir, 'H1', ['2'])
+        write_entry(words_dir, 'H2', [None])
+        write_entry(roots_dir, 'H2', ['3'])
+        write_entry(roots_dir, 'H3', ['1'])
+        (words_dir / 'H4.json').write_text('{not json', encoding='utf-8')
+        write_entry(roots_dir, 'H4', ['5'])
+
+        # Consolidated files are not a sense source
+        with open(lexicon_dir / 'words.json', 'w', encoding='utf-8') as f:
+            json.dump({'H9': {'definitions': [{'sense': '1'}]}}, f)
+
+        index = SenseIndex(words_dir, roots_dir)
+        assert index.get_senses('H1') == ('0', '1a', '1b')
+        assert index.get_senses('H2') == ('3',)
+        assert index.get_senses('H3') == ('1',)
+        assert index.get_senses('H4') == ('5',)
+        assert index.get_senses('H9') == ()
+        assert index.indexed == 4 and index.lookups == 5
+
+        assert index.has_sense('H1', '1') and index.has_sense('H1', '1a')
+        assert not index.has_sense('H1', '2') and not index.has_sense('H9', '1')
+
+    print("✓ Sense index precedence tests passed\n")
+
+
+def test_missing_directories():
+    """Test that a lexicon without per-entry files has no senses"""
+    print("Testing sense index without entry files...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index = SenseIndex(Path(tmp_dir) / 'words', Path(tmp_dir) / 'roots')
+        assert index.get_senses('H1') == ()
+        assert index.indexed == 0
+
+    print("✓ Missing directory tests passed\n")
+
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing sense index\n")
+
+    try:
+        test_per_entry_precedence()
+        test_missing_directories()
+
+        print("🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,6 +18,7 @@ from .config import (
 )
 from .translator import GrokTranslator
 from .processor import LexiconProcessor
+from .fanout import MultiLanguageProcessor
 
 __all__ = [
     'SUPPORTED_LANGUAGES',
@@ -32,5 +33,6 @@ __all__ = [
     'GROK_MODEL',
     'GrokTranslator',
     'LexiconProcessor',
+    'MultiLanguageProcessor',
 ]
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark against the local stub server.
+
+Starts stub_server.py in-process, translates the same synthetic batches at
+each concurrency level, checks that every batch comes back complete and in
+input order, and reports batches per second, 429s, retries and batches
+that failed after exhausting their retries. No API key or network access
+is needed.
+
+    python -m scripts.dict.translation.benchmark --batches 40 --latency 0.5 --error-rate 0.1
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import List
+
+from .config import REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE, get_language_name
+from .stub_server import StubServer, stub_translation
+from .translator import GrokTranslator
+
+
+def synthetic_batches(batches: int, batch_size: int) -> List[List[str]]:
+    """Distinct definition-like texts, grouped into batches."""
+    return [
+        [f"definition {batch}.{index}: to go, to walk" for index in range(batch_size)]
+        for batch in range(batches)
+    ]
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark concurrent translation against the stub server')
+    parser.add_argument('--batches', type=int, default=40, help='Number of batches (default: 40)')
+    parser.add_argument('--batch-size', type=int, default=50, help='Definitions per batch (default: 50)')
+    parser.add_argument('--concurrency', type=str, default='1,4,8',
+                        help='Comma-separated concurrency levels (default: 1,4,8)')
+    parser.add_argument('--latency', type=float, default=0.5, help='Stub latency per request (default: 0.5)')
+    parser.add_argument('--jitter', type=float, default=0.2, help='Stub extra random latency (default: 0.2)')
+    parser.add_argument('--error-rate', type=float, default=0.1, help='Share of 429 responses (default: 0.1)')
+    parser.add_argument('--retry-after', type=float, default=0.5, help='Retry-After of 429s (default: 0.5)')
+    parser.add_argument('--rpm', type=float, default=REQUESTS_PER_MINUTE * 100,
+                        help='Requests per minute for the limiter (default: effectively unlimited)')
+    parser.add_argument('--tpm', type=float, default=TOKENS_PER_MINUTE * 100,
+                        help='Tokens per minute for the limiter (default: effectively unlimited)')
+    parser.add_argument('--language', default='es', help='Target language code (default: es)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show translator logging')
+    return parser.parse_args()
+
+
+def main():
+    """Run the benchmark."""
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    batches = synthetic_batches(args.batches, args.batch_size)
+    language = get_language_name(args.language) or args.language
+    levels = [int(level) for level in args.concurrency.split(',') if level.strip()]
+
+    print(f"{'Concurrency':>11} {'Seconds':>8} {'Batches/s':>10} {'Requests':>9} {'429s':>5} "
+          f"{'Retries':>8} {'Failed':>7} {'Max in flight':>14} {'Order':>6}")
+    ok = True
+    for level in levels:
+        server = StubServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                            retry_after=args.retry_after).start()
+        try:
+            translator = GrokTranslator(concurrency=level, requests_per_minute=args.rpm,
+                                        tokens_per_minute=args.tpm, base_url=server.base_url, api_key='stub')
+            start = time.perf_counter()
+            results = {}
+            order = []
+            for index, translations, error in translator.translate_batches(batches, args.language):
+                order.append(index)
+                results[index] = translations if error is None else None
+            seconds = time.perf_counter() - start
+        finally:
+            server.stop()
+
+        # Batches that ran out of retries are reported as failed, not as out of order
+        failed = sum(1 for translations in results.values() if translations is None)
+        in_order = order == list(range(len(batches))) and all(
+            results[index] is None or results[index] == [stub_translation(text, language) for text in batch]
+            for index, batch in enumerate(batches)
+        )
+        ok = ok and in_order
+        usage = translator.get_usage_stats()
+        print(f"{level:>11} {seconds:>8.2f} {len(batches) / seconds:>10.1f} {server.stats['requests']:>9} "
+              f"{server.stats['rate_limited']:>5} {usage['retries']:>8} {failed:>7} "
+              f"{server.stats['max_in_flight']:>14} {'ok' if in_order else 'FAIL':>6}")
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -40,6 +40,12 @@ DEFAULT_LANGUAGE = 'es'
 XAI_API_KEY = os.getenv('XAI_API_KEY')
 GROK_MODEL = 'grok-4'  # Fastest model: $0.10/1M input, $0.30/1M output
 
+# Models that accept a JSON schema for the response (structured outputs).
+# With these, --langs asks for several languages per prompt; other models
+# get one language per prompt.
+STRUCTURED_OUTPUT_MODELS = ('grok-3', 'grok-3-mini', 'grok-4')
+MAX_LANGUAGES_PER_PROMPT = 4
+
 # Paths
 LEXICON_DIR = PROJECT_ROOT / 'data' / 'dict' / 'lexicon'
 ROOTS_FILE = LEXICON_DIR / 'roots.json'
@@ -47,6 +53,15 @@ WORDS_FILE = LEXICON_DIR / 'words.json'
 ROOTS_PRETTY_FILE = LEXICON_DIR / 'roots.pretty.json'
 WORDS_PRETTY_FILE = LEXICON_DIR / 'words.pretty.json'
 
+# Translation memory (SQLite): translations keyed by normalized English text,
+# language, model and prompt version. Bump PROMPT_VERSION when the prompt
+# changes so earlier translations are not reused.
+TRANSLATION_MEMORY_FILE = PROJECT_ROOT / 'scripts' / 'dict' / '.cache' / 'translation_memory.sqlite3'
+PROMPT_VERSION = '1'
+
+# Checkpoint journals of in-progress runs (one NDJSON file per file and language)
+JOURNAL_DIR = PROJECT_ROOT / 'scripts' / 'dict' / '.cache' / 'translation_journal'
+
 # Translation settings (reuse from parent config)
 DEFAULT_BATCH_SIZE = 50  # Number of definitions per API call
 MAX_BATCH_SIZE = 100
@@ -56,7 +71,12 @@ MIN_BATCH_SIZE = 1
 # Grok has higher rate limits than Gemini free tier
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 2  # Exponential backoff: 2^retry seconds
-RATE_LIMIT_DELAY = 1.0  # Seconds to wait between API calls (Grok has higher limits)
+RATE_LIMIT_RETRY_DEFAULT = 60.0  # Seconds to wait on a 429 without a retry-after hint
+
+# Concurrency: batches in flight at once, sharing one token-bucket limiter
+DEFAULT_CONCURRENCY = 4
+REQUESTS_PER_MINUTE = 60  # Request budget per minute
+TOKENS_PER_MINUTE = 1_000_000  # Estimated input + output token budget per minute
 
 # Batch API settings (Grok doesn't use batch API, but kept for compatibility)
 USE_BATCH_API = False  # Grok doesn't support batch API
@@ -66,7 +86,8 @@ BATCH_POLL_INTERVAL = 60
 BATCH_MAX_WAIT_HOURS = 24
 
 # API Configuration
-GROK_BASE_URL = "https://api.x.ai/v1"
+# Override with an OpenAI-compatible endpoint (e.g. the local stub_server.py)
+GROK_BASE_URL = os.getenv('GROK_BASE_URL', "https://api.x.ai/v1")
 GROK_TIMEOUT = 3600  # 1 hour timeout (recommended for reasoning models, though grok-4 is fast)
 
 
@@ -96,6 +117,19 @@ def get_language_name(lang_code: str) -> Optional[str]:
     return SUPPORTED_LANGUAGES.get(lang_code.lower())
 
 
+def supports_structured_output(model: str) -> bool:
+    """
+    Check if a model accepts a JSON schema for its response.
+
+    Args:
+        model: Model name (e.g., 'grok-4')
+
+    Returns:
+        True if structured outputs are supported, False otherwise
+    """
+    return model in STRUCTURED_OUTPUT_MODELS
+
+
 def validate_grok_api_key() -> bool:
     """
     Validate that the xAI API key is set.
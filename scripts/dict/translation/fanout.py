@@ -0,0 +1,390 @@
+"""
+Multi-language fan-out module.
+
+Translates lexicon files into several languages in one pass: each file is
+loaded and saved once, the untranslated definitions of every language are
+collected in a single walk, and each unique English text is sent once for
+all the languages that still need it (several languages per prompt when the
+model supports structured outputs).
+"""
+
+import logging
+import math
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .processor import DefinitionRef, load_lexicon_file, save_lexicon_file, select_entries
+
+logger = logging.getLogger(__name__)
+
+
+class MultiLanguageProcessor:
+    """Processes lexicon JSON files for translation into several languages."""
+
+    def __init__(
+        self,
+        target_langs: List[str],
+        batch_size: int = 50,
+        concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        use_memory: bool = True,
+        languages_per_prompt: Optional[int] = None,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None
+    ):
+        """
+        Initialize the processor.
+
+        Args:
+            target_langs: Target language codes (e.g., ['es', 'pt'])
+            batch_size: Number of definitions to translate per API call
+            concurrency: Batches in flight at once (default: DEFAULT_CONCURRENCY)
+            requests_per_minute: Request budget (default: REQUESTS_PER_MINUTE)
+            tokens_per_minute: Token budget (default: TOKENS_PER_MINUTE)
+            use_memory: Reuse and store translations in the translation memory
+            languages_per_prompt: Languages requested per API call (default:
+                MAX_LANGUAGES_PER_PROMPT with structured outputs, otherwise 1)
+            base_url: API endpoint (default: GROK_BASE_URL)
+            api_key: API key (default: XAI_API_KEY)
+        """
+        from .config import (
+            DEFAULT_CONCURRENCY,
+            REQUESTS_PER_MINUTE,
+            TOKENS_PER_MINUTE,
+            MAX_LANGUAGES_PER_PROMPT,
+            TRANSLATION_MEMORY_FILE,
+            PROMPT_VERSION,
+            supports_structured_output,
+            validate_language
+        )
+
+        for lang in target_langs:
+            if not validate_language(lang):
+                raise ValueError(f"Unsupported language: {lang}")
+        if not target_langs:
+            raise ValueError("No target languages given")
+
+        self.target_langs = list(dict.fromkeys(lang.lower() for lang in target_langs))
+        self.batch_size = batch_size
+
+        # Initialize Grok translator
+        from .translator import GrokTranslator
+        self.translator = GrokTranslator(
+            concurrency=concurrency or DEFAULT_CONCURRENCY,
+            requests_per_minute=requests_per_minute or REQUESTS_PER_MINUTE,
+            tokens_per_minute=tokens_per_minute or TOKENS_PER_MINUTE,
+            base_url=base_url,
+            api_key=api_key
+        )
+
+        if languages_per_prompt is None:
+            languages_per_prompt = (
+                MAX_LANGUAGES_PER_PROMPT if supports_structured_output(self.translator.model_name) else 1
+            )
+        self.languages_per_prompt = max(1, languages_per_prompt)
+
+        # Translation memory shared across entries, files and runs
+        self.memory = None
+        if use_memory:
+            from .translation_memory import TranslationMemory
+            self.memory = TranslationMemory(TRANSLATION_MEMORY_FILE, self.translator.model_name, PROMPT_VERSION)
+        self._memory_stats = {
+            'texts_total': 0,
+            'texts_unique': 0,
+            'memory_hits': 0,
+            'api_calls': 0,
+            'api_calls_saved': 0,
+        }
+
+    def _language_groups(self, langs: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+        """Split languages into groups requested together."""
+        return [
+            langs[start:start + self.languages_per_prompt]
+            for start in range(0, len(langs), self.languages_per_prompt)
+        ]
+
+    def _apply_translations(
+        self,
+        entries: Dict,
+        refs: List[DefinitionRef],
+        positions: Dict[str, List[int]],
+        lang: str,
+        translations: Dict[str, str],
+        journals: Dict,
+        stats: Dict[str, Dict[str, int]],
+        from_memory: bool = False
+    ):
+        """
+        Write one language's translations into their entries and journal them.
+
+        Args:
+            entries: Entries the references point into
+            refs: Definitions being translated
+            positions: Normalized text -> positions in refs (for this language)
+            lang: Language code
+            translations: Normalized text -> translation
+            journals: Language code -> TranslationJournal (empty on dry runs)
+            stats: Per-language statistics to update
+            from_memory: Translations came from the translation memory
+        """
+        text_field = f"text_{lang}"
+        records = []
+        for source, translation in translations.items():
+            for position in positions[source]:
+                ref = refs[position]
+                definitions = entries[ref.entry_key].get('definitions', [])
+                if ref.definition_idx >= len(definitions):
+                    continue
+                defn = definitions[ref.definition_idx]
+
+                # Migrate 'text' to 'text_en' if needed
+                if 'text' in defn and 'text_en' not in defn:
+                    defn['text_en'] = defn.pop('text')
+
+                # Add translation
+                defn[text_field] = translation
+                records.append((ref.entry_key, ref.order, ref.text, translation))
+
+        stats[lang]['definitions_translated'] += len(records)
+        if lang in journals:
+            journals[lang].append(records, from_memory=from_memory)
+
+    def _log_progress(self, journals: Dict):
+        """Log per-language progress and the overall ETA from the journals."""
+        from .journal import format_eta
+
+        if not journals:
+            return
+        progress = {lang: journal.progress() for lang, journal in journals.items()}
+        etas = [item['eta'] for item in progress.values() if item['done'] < item['total']]
+        if not etas:
+            eta = 0.0
+        elif None in etas:
+            eta = None
+        else:
+            eta = max(etas)
+        logger.info(
+            "Progress: " + ", ".join(
+                f"{lang} {item['done']}/{item['total']} ({item['percent']:.1f}%)"
+                for lang, item in progress.items()
+            ) + f", ETA {format_eta(eta)}"
+        )
+
+    def process_file(
+        self,
+        file_path: Path,
+        pretty_file_path: Optional[Path] = None,
+        strong_number: Optional[str] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Process a lexicon file, translating all definitions into every target language.
+
+        Args:
+            file_path: Path to JSON file to process
+            pretty_file_path: Optional path to pretty-printed version
+            strong_number: Optional Strong's number to process only that entry
+            dry_run: If True, don't save changes
+
+        Returns:
+            Dictionary of language code -> processing statistics
+        """
+        from .config import JOURNAL_DIR
+        from .journal import TranslationJournal
+        from .translation_memory import normalize_text
+
+        logger.info(f"Loading file: {file_path}")
+        data = load_lexicon_file(file_path)
+
+        stats = {
+            lang: {
+                'entries_processed': 0,
+                'entries_total': len(data),
+                'definitions_processed': 0,
+                'definitions_translated': 0,
+                'definitions_resumed': 0,
+            }
+            for lang in self.target_langs
+        }
+
+        # Replay the checkpoint journals of an interrupted run
+        journals = {}
+        if not dry_run:
+            for lang in self.target_langs:
+                journals[lang] = TranslationJournal(JOURNAL_DIR / f"{file_path.stem}.{lang}.ndjson")
+                stats[lang]['definitions_resumed'] = journals[lang].replay(data, f"text_{lang}")
+
+        # Filter entries if strong_number is specified
+        entries = select_entries(data, strong_number)
+        if strong_number and not entries:
+            logger.warning(f"Strong's number {strong_number} not found")
+            return stats
+
+        logger.info(
+            f"Processing {len(entries)} entries "
+            f"(target languages: {', '.join(self.target_langs)})"
+        )
+
+        # One walk: the untranslated definitions of every language, grouped
+        # by normalized English text
+        refs = []
+        positions = {lang: {} for lang in self.target_langs}
+        for entry_key, entry in entries.items():
+            for def_idx, defn in enumerate(entry.get('definitions', [])):
+                text_en = defn.get('text_en') or defn.get('text')
+                if not text_en:
+                    continue
+                langs = [lang for lang in self.target_langs if f"text_{lang}" not in defn]
+                if not langs:
+                    continue
+
+                order = defn.get('order', def_idx + 1)
+                refs.append(DefinitionRef(
+                    entry_key=entry_key,
+                    definition_idx=def_idx,
+                    order=order,
+                    text=text_en,
+                    batch_key=f"{entry_key}-def-{order}"
+                ))
+                source = normalize_text(text_en)
+                for lang in langs:
+                    positions[lang].setdefault(source, []).append(len(refs) - 1)
+                    stats[lang]['definitions_processed'] += 1
+
+        for lang in self.target_langs:
+            stats[lang]['entries_processed'] = len(entries)
+            logger.info(
+                f"{lang}: {stats[lang]['definitions_processed']} definitions, "
+                f"{len(positions[lang])} unique texts to translate"
+            )
+            if lang in journals:
+                journals[lang].start_run(stats[lang]['definitions_processed'])
+
+        try:
+            # Serve what the translation memory already has
+            missing = {}
+            for lang in self.target_langs:
+                hits = self.memory.get_many(positions[lang], lang) if self.memory else {}
+                if hits:
+                    self._apply_translations(entries, refs, positions[lang], lang, hits, journals, stats, True)
+                for source in positions[lang]:
+                    if source not in hits:
+                        missing.setdefault(source, []).append(lang)
+
+                self._memory_stats['texts_total'] += stats[lang]['definitions_processed']
+                self._memory_stats['texts_unique'] += len(positions[lang])
+                self._memory_stats['memory_hits'] += len(hits)
+                self._memory_stats['api_calls_saved'] += math.ceil(
+                    stats[lang]['definitions_processed'] / self.batch_size
+                )
+
+            # Each remaining text is sent once for all languages it still
+            # needs, in groups of languages_per_prompt
+            pending = {}
+            for source, langs in missing.items():
+                for group in self._language_groups(tuple(langs)):
+                    pending.setdefault(group, []).append(source)
+
+            batches = [
+                (group, sources[start:start + self.batch_size])
+                for group, sources in pending.items()
+                for start in range(0, len(sources), self.batch_size)
+            ]
+            self._memory_stats['api_calls'] += len(batches)
+            self._memory_stats['api_calls_saved'] -= len(batches)
+            self._log_progress(journals)
+
+            # Translate (batches run concurrently and are applied in batch order)
+            for batch_number, translations, error in self.translator.translate_batches_multi(
+                [sources for _, sources in batches],
+                [list(group) for group, _ in batches]
+            ):
+                group, sources = batches[batch_number]
+                if error is not None:
+                    logger.error(
+                        f"Failed to translate batch {batch_number + 1}/{len(batches)} "
+                        f"({', '.join(group)}): {error}"
+                    )
+                    # Continue with next batch
+                    continue
+
+                for lang in group:
+                    # Empty strings are padding for missing translations; keep
+                    # them out of the memory and the file so a later run retries them
+                    new = [
+                        (source, item[lang].strip())
+                        for source, item in zip(sources, translations)
+                        if item[lang].strip()
+                    ]
+                    if self.memory:
+                        self.memory.put_many(new, lang)
+                    self._apply_translations(entries, refs, positions[lang], lang, dict(new), journals, stats)
+
+                logger.info(
+                    f"Translated batch {batch_number + 1}/{len(batches)}: {len(sources)} texts "
+                    f"into {', '.join(group)}"
+                )
+                self._log_progress(journals)
+        finally:
+            # The journals stay on disk until the file is saved
+            for journal in journals.values():
+                journal.close()
+
+        # Save updated file once for all languages (unless dry run)
+        if not dry_run:
+            logger.info(f"Saving updated file: {file_path}")
+            save_lexicon_file(data, file_path, pretty=False)
+
+            if pretty_file_path:
+                logger.info(f"Saving pretty file: {pretty_file_path}")
+                save_lexicon_file(data, pretty_file_path, pretty=True)
+
+            for journal in journals.values():
+                journal.remove()
+        else:
+            logger.info("DRY RUN MODE - Skipping file save")
+
+        return stats
+
+    def process_roots(
+        self,
+        strong_number: Optional[str] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Dict[str, int]]:
+        """Process roots.json file."""
+        from .config import ROOTS_FILE, ROOTS_PRETTY_FILE
+
+        return self.process_file(ROOTS_FILE, ROOTS_PRETTY_FILE, strong_number, dry_run)
+
+    def process_words(
+        self,
+        strong_number: Optional[str] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Dict[str, int]]:
+        """Process words.json file."""
+        from .config import WORDS_FILE, WORDS_PRETTY_FILE
+
+        return self.process_file(WORDS_FILE, WORDS_PRETTY_FILE, strong_number, dry_run)
+
+    def get_mismatch_stats(self) -> Dict[str, int]:
+        """Get mismatch statistics from the translator."""
+        return self.translator.get_mismatch_stats()
+
+    def get_usage_stats(self) -> Dict[str, int]:
+        """Get API usage statistics from the translator."""
+        return self.translator.get_usage_stats()
+
+    def get_language_usage_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get API calls and tokens per language from the translator."""
+        return self.translator.get_language_usage_stats()
+
+    def get_memory_stats(self) -> Dict[str, int]:
+        """Get translation memory statistics (total vs unique texts, hits, API calls saved)."""
+        return dict(self._memory_stats)
+
+    def close(self):
+        """Close the translation memory."""
+        if self.memory:
+            self.memory.close()
+            self.memory = None
@@ -291,41 +291,35 @@ class MismatchFixer:
             data = data_files[file_type]
             fixed_count = 0
 
-            # Translate in batches
-            for batch_idx in range(0, len(problems), self.batch_size):
-                batch_problems = problems[batch_idx:batch_idx + self.batch_size]
-                batch_texts = [p.text_en for p in batch_problems]
-                batch_keys = [p.batch_key for p in batch_problems]
-
-                try:
-                    logger.info(f"Translating batch {batch_idx // self.batch_size + 1} with {len(batch_problems)} definitions...")
-                    translations = self.translator.translate_batch(
-                        batch_texts,
-                        self.target_lang,
-                        keys=batch_keys,
-                        batch_index=batch_idx // self.batch_size + 1
-                    )
-
-                    # Apply translations back to data
-                    for problem, translation in zip(batch_problems, translations):
-                        entry = data[problem.entry_key]
-                        definitions = entry.get('definitions', [])
-
-                        if problem.definition_idx < len(definitions):
-                            defn = definitions[problem.definition_idx]
-
-                            # Migrate 'text' to 'text_en' if needed
-                            if 'text' in defn and 'text_en' not in defn:
-                                defn['text_en'] = defn.pop('text')
-
-                            # Add the translation
-                            defn[self.text_field] = translation.strip()
-                            fixed_count += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to translate batch starting at index {batch_idx}: {e}")
+            # Translate in batches (concurrently, applied in batch order)
+            batches = [problems[start:start + self.batch_size] for start in range(0, len(problems), self.batch_size)]
+            logger.info(f"Translating {len(batches)} batches of up to {self.batch_size} definitions...")
+
+            for batch_number, translations, error in self.translator.translate_batches(
+                [[p.text_en for p in batch_problems] for batch_problems in batches],
+                self.target_lang,
+                keys=[[p.batch_key for p in batch_problems] for batch_problems in batches]
+            ):
+                if error is not None:
+                    logger.error(f"Failed to translate batch starting at index {batch_number * self.batch_size}: {error}")
                     continue
 
+                # Apply translations back to data
+                for problem, translation in zip(batches[batch_number], translations):
+                    entry = data[problem.entry_key]
+                    definitions = entry.get('definitions', [])
+
+                    if problem.definition_idx < len(definitions):
+                        defn = definitions[problem.definition_idx]
+
+                        # Migrate 'text' to 'text_en' if needed
+                        if 'text' in defn and 'text_en' not in defn:
+                            defn['text_en'] = defn.pop('text')
+
+                        # Add the translation
+                        defn[self.text_field] = translation.strip()
+                        fixed_count += 1
+
             stats[file_type]['fixed'] = fixed_count
             total_fixed += fixed_count
             logger.info(f"Fixed {fixed_count} entries in {file_type}")
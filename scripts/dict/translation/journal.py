@@ -0,0 +1,187 @@
+"""
+Checkpoint journal module.
+
+Append-only NDJSON log of the translations of one lexicon file into one
+language, flushed to disk as each batch completes. A run that is
+interrupted replays the journal on restart, so only definitions that were
+never translated are sent again; the journal is removed once the file has
+been saved.
+
+Each line is either a run header:
+
+    {"run": <start time>, "pending": <definitions to translate>}
+
+or a translation:
+
+    {"entry": <entry key>, "order": <definition order>, "source": <English text>, "text": <translation>}
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def definition_order(defn: Dict, idx: int) -> int:
+    """Order of a definition (its position + 1 when the field is missing)."""
+    return defn.get('order', idx + 1)
+
+
+class TranslationJournal:
+    """Checkpoint journal of one file's translations into one language."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the journal (the file is created on the first write).
+
+        Args:
+            path: NDJSON journal file
+        """
+        self.path = Path(path)
+        self._file = None
+        self.run_started = None
+        self.run_pending = 0
+        self.run_done = 0
+        self.run_translated = 0
+        self.resumed = 0
+
+    def replay(self, data: Dict, text_field: str) -> int:
+        """
+        Apply the journaled translations to loaded file data.
+
+        Only definitions that still lack a translation and whose English text
+        is unchanged are filled in; a torn last line (crash mid-write) is
+        ignored.
+
+        Args:
+            data: Lexicon file data (entry key -> entry)
+            text_field: Translation field, e.g. 'text_es'
+
+        Returns:
+            Number of definitions restored
+        """
+        if not self.path.exists():
+            return 0
+
+        restored = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable line {line_number} of {self.path}")
+                    continue
+                if 'entry' not in record:
+                    continue
+
+                entry = data.get(record['entry'])
+                if not entry:
+                    continue
+                for idx, defn in enumerate(entry.get('definitions', [])):
+                    if definition_order(defn, idx) != record['order']:
+                        continue
+                    text_en = defn.get('text_en') or defn.get('text', '')
+                    if text_field in defn or text_en != record['source']:
+                        break
+
+                    # Migrate 'text' to 'text_en' if needed
+                    if 'text' in defn and 'text_en' not in defn:
+                        defn['text_en'] = defn.pop('text')
+                    defn[text_field] = record['text']
+                    restored += 1
+                    break
+
+        self.resumed = restored
+        if restored:
+            logger.info(f"Resumed {restored} translations from journal {self.path}")
+        return restored
+
+    def _write(self, records: List[Dict]):
+        """Append records and flush them to disk."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start_run(self, pending: int):
+        """
+        Record the start of a run.
+
+        Args:
+            pending: Definitions still to translate in this run
+        """
+        self.run_started = time.time()
+        self.run_pending = pending
+        self.run_done = 0
+        self.run_translated = 0
+        self._write([{'run': self.run_started, 'pending': pending}])
+
+    def append(self, translations: List[Tuple[str, int, str, str]], from_memory: bool = False):
+        """
+        Journal a completed batch.
+
+        Args:
+            translations: (entry key, definition order, English text, translation) tuples
+            from_memory: Translations were served from the translation memory
+                (counted as done, but not towards the translation rate)
+        """
+        if not translations:
+            return
+        self._write([
+            {'entry': entry_key, 'order': order, 'source': source, 'text': text}
+            for entry_key, order, source, text in translations
+        ])
+        self.run_done += len(translations)
+        if not from_memory:
+            self.run_translated += len(translations)
+
+    def progress(self) -> Dict[str, Optional[float]]:
+        """
+        Progress of the current run, from the journaled translations.
+
+        Returns:
+            Dictionary with done, total (including resumed), percent, rate
+            (definitions/second) and eta (seconds, None until known)
+        """
+        total = self.resumed + self.run_pending
+        done = self.resumed + self.run_done
+        elapsed = time.time() - self.run_started if self.run_started else 0.0
+        rate = self.run_translated / elapsed if elapsed > 0 else 0.0
+        remaining = max(0, total - done)
+        return {
+            'done': done,
+            'total': total,
+            'percent': 100.0 * done / total if total else 100.0,
+            'rate': rate,
+            'eta': remaining / rate if rate > 0 else None,
+        }
+
+    def close(self):
+        """Close the journal file (it stays on disk for a later resume)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        """Close and delete the journal once its translations are saved."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Format an ETA in seconds as e.g. '1h02m', '3m05s' or '12s'."""
+    if seconds is None:
+        return 'unknown'
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
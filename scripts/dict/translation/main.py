@@ -12,7 +12,14 @@ import sys
 from pathlib import Path
 
 from .processor import LexiconProcessor
-from .config import DEFAULT_LANGUAGE, DEFAULT_BATCH_SIZE
+from .config import (
+    DEFAULT_LANGUAGE,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    REQUESTS_PER_MINUTE,
+    TOKENS_PER_MINUTE,
+    MAX_LANGUAGES_PER_PROMPT,
+)
 
 # Set up logging
 logging.basicConfig(
@@ -51,6 +58,19 @@ def parse_args():
         help=f'Target language code (default: {DEFAULT_LANGUAGE}). Examples: es, pt, fr'
     )
     
+    parser.add_argument(
+        '--langs',
+        help='Comma-separated target language codes translated in one pass (e.g., es,pt,fr). '
+             'Each file is loaded and saved once; overrides --language.'
+    )
+    
+    parser.add_argument(
+        '--languages-per-prompt',
+        type=int,
+        help=f'Languages requested per API call with --langs (default: {MAX_LANGUAGES_PER_PROMPT} '
+             f'when the model supports structured outputs, otherwise 1)'
+    )
+    
     parser.add_argument(
         '--batch-size',
         type=int,
@@ -58,6 +78,33 @@ def parse_args():
         help=f'Number of definitions per API call (default: {DEFAULT_BATCH_SIZE}). Ignored when using --strong-number.'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Number of batches in flight at once (default: {DEFAULT_CONCURRENCY}). Output order is unchanged.'
+    )
+    
+    parser.add_argument(
+        '--rpm',
+        type=float,
+        default=REQUESTS_PER_MINUTE,
+        help=f'Requests per minute shared by all in-flight batches (default: {REQUESTS_PER_MINUTE})'
+    )
+    
+    parser.add_argument(
+        '--tpm',
+        type=float,
+        default=TOKENS_PER_MINUTE,
+        help=f'Estimated tokens per minute shared by all in-flight batches (default: {TOKENS_PER_MINUTE})'
+    )
+    
+    parser.add_argument(
+        '--no-memory',
+        action='store_true',
+        help='Do not reuse or store translations in the translation memory'
+    )
+    
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -97,6 +144,11 @@ def main():
         logger.error(f"Failed to import Grok configuration: {e}")
         sys.exit(1)
     
+    # Several languages in one pass
+    if args.langs:
+        run_languages(args)
+        return
+    
     # Validate language
     from .config import validate_language, SUPPORTED_LANGUAGES
     if not validate_language(args.language):
@@ -118,7 +170,11 @@ def main():
 
         processor = LexiconProcessor(
             target_lang=args.language,
-            batch_size=effective_batch_size
+            batch_size=effective_batch_size,
+            concurrency=args.concurrency,
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            use_memory=not args.no_memory
         )
     except Exception as e:
         logger.error(f"Failed to initialize processor: {e}")
@@ -174,11 +230,14 @@ def main():
         for file_type, stats in all_stats.items():
             entries = stats.get('entries_processed', 0)
             definitions = stats.get('definitions_translated', 0)
+            resumed = stats.get('definitions_resumed', 0)
             
             if entries > 0 or definitions > 0:
                 print(f"\n{file_type.capitalize()}:")
                 print(f"  Entries processed: {entries}")
                 print(f"  Definitions translated: {definitions}")
+                if resumed:
+                    print(f"  Definitions resumed from journal: {resumed}")
                 
                 total_entries += entries
                 total_definitions += definitions
@@ -198,6 +257,25 @@ def main():
                 print(f"  Total truncation applied: {mismatch_stats['total_truncation']}")
                 print(f"  Mismatch patterns: {mismatch_stats['mismatch_patterns']}")
 
+        # Print API usage statistics
+        usage_stats = processor.get_usage_stats()
+        if usage_stats['requests'] > 0 or usage_stats['rate_limited'] > 0:
+            print(f"\nAPI Usage:")
+            print(f"  Requests: {usage_stats['requests']} (concurrency {args.concurrency})")
+            print(f"  Rate limited (429): {usage_stats['rate_limited']}, retries: {usage_stats['retries']}")
+            print(f"  Tokens: {usage_stats['input_tokens']} input, {usage_stats['output_tokens']} output")
+            print(f"  Rate limiter waits: {usage_stats['limiter_waits']} "
+                  f"({usage_stats['limiter_wait_seconds']:.1f}s)")
+
+        # Print translation memory statistics
+        memory_stats = processor.get_memory_stats()
+        if memory_stats['texts_total'] > 0:
+            print(f"\nTranslation Memory:")
+            print(f"  Definitions: {memory_stats['texts_total']} total, {memory_stats['texts_unique']} unique")
+            print(f"  Memory hits: {memory_stats['memory_hits']}"
+                  f"{' (memory disabled)' if args.no_memory else ''}")
+            print(f"  API calls: {memory_stats['api_calls']} made, {memory_stats['api_calls_saved']} saved")
+
         print("="*60)
 
         if args.dry_run:
@@ -206,13 +284,111 @@ def main():
             print("\n✅ Translation completed successfully!")
     
     except KeyboardInterrupt:
-        logger.info("\n\nTranslation interrupted by user")
+        logger.info("\n\nTranslation interrupted by user (completed batches are journaled; re-run to resume)")
         sys.exit(1)
     
     except Exception as e:
         logger.error(f"Translation failed: {e}", exc_info=args.verbose)
         sys.exit(1)
 
+    finally:
+        processor.close()
+
+
+def run_languages(args):
+    """Translate into several languages in one pass (--langs)."""
+    from .config import validate_language, SUPPORTED_LANGUAGES
+    from .fanout import MultiLanguageProcessor
+
+    languages = [lang.strip().lower() for lang in args.langs.split(',') if lang.strip()]
+    unsupported = [lang for lang in languages if not validate_language(lang)]
+    if not languages or unsupported:
+        logger.error(
+            f"Unsupported language(s): {', '.join(unsupported) or args.langs}\n"
+            f"Supported languages: {', '.join(SUPPORTED_LANGUAGES.keys())}"
+        )
+        sys.exit(1)
+
+    try:
+        processor = MultiLanguageProcessor(
+            target_langs=languages,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            use_memory=not args.no_memory,
+            languages_per_prompt=args.languages_per_prompt
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize processor: {e}")
+        sys.exit(1)
+
+    all_stats = {}
+
+    try:
+        if args.file == 'roots' or args.file is None:
+            logger.info("Processing roots.json...")
+            all_stats['roots'] = processor.process_roots(args.strong_number, args.dry_run)
+
+        if args.file == 'words' or args.file is None:
+            logger.info("Processing words.json...")
+            all_stats['words'] = processor.process_words(args.strong_number, args.dry_run)
+
+        # Print summary
+        print("\n" + "="*60)
+        print(f"Translation Summary ({', '.join(processor.target_langs)}, "
+              f"{processor.languages_per_prompt} per prompt)")
+        print("="*60)
+
+        for file_type, file_stats in all_stats.items():
+            print(f"\n{file_type.capitalize()}:")
+            for lang, stats in file_stats.items():
+                line = (f"  {lang}: {stats['definitions_translated']}/{stats['definitions_processed']} "
+                        f"definitions translated")
+                if stats['definitions_resumed']:
+                    line += f", {stats['definitions_resumed']} resumed from journal"
+                print(line)
+
+        # Print API usage per language
+        language_usage = processor.get_language_usage_stats()
+        usage_stats = processor.get_usage_stats()
+        if language_usage:
+            print(f"\nAPI Usage by Language (tokens of multi-language calls split evenly):")
+            for lang, usage in language_usage.items():
+                print(f"  {lang}: {usage['requests']} calls, "
+                      f"{usage['input_tokens']} input / {usage['output_tokens']} output tokens")
+            print(f"  Total: {usage_stats['requests']} calls, "
+                  f"{usage_stats['input_tokens']} input / {usage_stats['output_tokens']} output tokens")
+            print(f"  Rate limited (429): {usage_stats['rate_limited']}, retries: {usage_stats['retries']}")
+
+        # Print translation memory statistics
+        memory_stats = processor.get_memory_stats()
+        if memory_stats['texts_total'] > 0:
+            print(f"\nTranslation Memory:")
+            print(f"  Definitions: {memory_stats['texts_total']} total, {memory_stats['texts_unique']} unique")
+            print(f"  Memory hits: {memory_stats['memory_hits']}"
+                  f"{' (memory disabled)' if args.no_memory else ''}")
+            print(f"  API calls: {memory_stats['api_calls']} made, "
+                  f"{memory_stats['api_calls_saved']} saved vs. one run per language")
+
+        print("="*60)
+
+        if args.dry_run:
+            print("\n⚠️  DRY RUN MODE - No files were saved")
+        else:
+            print("\n✅ Translation completed successfully!")
+
+    except KeyboardInterrupt:
+        logger.info("\n\nTranslation interrupted by user (completed batches are journaled; re-run to resume)")
+        sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Translation failed: {e}", exc_info=args.verbose)
+        sys.exit(1)
+
+    finally:
+        processor.close()
+
 
 if __name__ == '__main__':
     main()
@@ -6,19 +6,87 @@ Handles loading, processing, and updating lexicon JSON files with translations.
 
 import json
 import logging
+import math
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, NamedTuple
+from typing import Callable, Dict, List, Optional, Tuple, NamedTuple
 
 logger = logging.getLogger(__name__)
 
 
+class DefinitionRef(NamedTuple):
+    """Reference to a definition that needs translation."""
+    entry_key: str
+    definition_idx: int
+    order: int
+    text: str
+    batch_key: str
+
+
+def load_lexicon_file(file_path: Path) -> Dict:
+    """Load a lexicon JSON file, handling both minified and pretty formats."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.error(f"File not found: {file_path}")
+        raise
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in {file_path}: {e}")
+        raise
+
+
+def save_lexicon_file(data: Dict, file_path: Path, pretty: bool = False):
+    """Save a lexicon JSON file in minified or pretty format (atomically, via a temp file)."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = file_path.with_name(file_path.name + '.tmp')
+
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        if pretty:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, file_path)
+
+
+def select_entries(data: Dict, strong_number: Optional[str] = None) -> Dict:
+    """
+    Select the entries to process.
+
+    Args:
+        data: Lexicon file data (entry key -> entry)
+        strong_number: Optional Strong's number (entry key or strong_number field)
+
+    Returns:
+        All entries, or the matching entry (empty if not found)
+    """
+    if not strong_number:
+        return data
+
+    # Try to find entry by key or strong_number field
+    if strong_number in data:
+        return {strong_number: data[strong_number]}
+
+    # Search by strong_number field
+    for key, entry in data.items():
+        if entry.get('strong_number') == strong_number:
+            return {key: entry}
+    return {}
+
+
 class LexiconProcessor:
     """Processes lexicon JSON files for translation."""
     
     def __init__(
         self,
         target_lang: str,
-        batch_size: int = 50
+        batch_size: int = 50,
+        concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        use_memory: bool = True,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None
     ):
         """
         Initialize the processor.
@@ -26,14 +94,25 @@ class LexiconProcessor:
         Args:
             target_lang: Target language code (e.g., 'es', 'pt')
             batch_size: Number of definitions to translate per API call
+            concurrency: Batches in flight at once (default: DEFAULT_CONCURRENCY)
+            requests_per_minute: Request budget (default: REQUESTS_PER_MINUTE)
+            tokens_per_minute: Token budget (default: TOKENS_PER_MINUTE)
+            use_memory: Reuse and store translations in the translation memory
+            base_url: API endpoint (default: GROK_BASE_URL)
+            api_key: API key (default: XAI_API_KEY)
         """
         from .config import (
             SUPPORTED_LANGUAGES,
             DEFAULT_BATCH_SIZE,
+            DEFAULT_CONCURRENCY,
+            REQUESTS_PER_MINUTE,
+            TOKENS_PER_MINUTE,
             ROOTS_FILE,
             WORDS_FILE,
             ROOTS_PRETTY_FILE,
             WORDS_PRETTY_FILE,
+            TRANSLATION_MEMORY_FILE,
+            PROMPT_VERSION,
             validate_language
         )
 
@@ -46,29 +125,35 @@ class LexiconProcessor:
 
         # Initialize Grok translator
         from .translator import GrokTranslator
-        self.translator = GrokTranslator()
+        self.translator = GrokTranslator(
+            concurrency=concurrency or DEFAULT_CONCURRENCY,
+            requests_per_minute=requests_per_minute or REQUESTS_PER_MINUTE,
+            tokens_per_minute=tokens_per_minute or TOKENS_PER_MINUTE,
+            base_url=base_url,
+            api_key=api_key
+        )
+
+        # Translation memory shared across entries, files and runs
+        self.memory = None
+        if use_memory:
+            from .translation_memory import TranslationMemory
+            self.memory = TranslationMemory(TRANSLATION_MEMORY_FILE, self.translator.model_name, PROMPT_VERSION)
+        self.journal = None
+        self._memory_stats = {
+            'texts_total': 0,
+            'texts_unique': 0,
+            'memory_hits': 0,
+            'api_calls': 0,
+            'api_calls_saved': 0,
+        }
     
     def _load_json_file(self, file_path: Path) -> Dict:
         """Load JSON file, handling both minified and pretty formats."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.error(f"File not found: {file_path}")
-            raise
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {file_path}: {e}")
-            raise
+        return load_lexicon_file(file_path)
     
     def _save_json_file(self, data: Dict, file_path: Path, pretty: bool = False):
-        """Save JSON file in minified or pretty format."""
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            else:
-                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        """Save JSON file in minified or pretty format (atomically, via a temp file)."""
+        save_lexicon_file(data, file_path, pretty)
     
     def _extract_definitions_to_translate(
         self,
@@ -108,33 +193,161 @@ class LexiconProcessor:
         """
         return sorted(definitions, key=lambda d: d.get('order', 999))
 
-    def _update_entry_definitions(
+    def _apply_translations(
         self,
-        entry: Dict,
-        translations: List[str],
-        indices: List[int]
+        entries: Dict,
+        refs: List[DefinitionRef],
+        translated: Dict[int, str],
+        from_memory: bool = False
     ):
         """
-        Update entry definitions with translations.
-        
+        Write translations into their entries and journal them.
+
         Args:
-            entry: Entry dictionary to update
-            translations: List of translated texts
-            indices: List of definition indices that were translated
+            entries: Entries the references point into
+            refs: Definitions being translated
+            translated: Dictionary of reference position -> translation
+            from_memory: Translations came from the translation memory
         """
-        definitions = entry.get('definitions', [])
-        
-        for idx, translation in zip(indices, translations):
-            if idx < len(definitions):
-                defn = definitions[idx]
-                
+        records = []
+        for position in sorted(translated):
+            ref = refs[position]
+            definitions = entries[ref.entry_key].get('definitions', [])
+
+            if ref.definition_idx < len(definitions):
+                defn = definitions[ref.definition_idx]
+
                 # Migrate 'text' to 'text_en' if needed
                 if 'text' in defn and 'text_en' not in defn:
                     defn['text_en'] = defn.pop('text')
-                
+
                 # Add translation
-                defn[self.text_field] = translation.strip()
-    
+                defn[self.text_field] = translated[position]
+                records.append((ref.entry_key, ref.order, ref.text, translated[position]))
+
+        if self.journal and records:
+            from .journal import format_eta
+
+            self.journal.append(records, from_memory=from_memory)
+            progress = self.journal.progress()
+            logger.info(
+                f"Progress: {progress['done']}/{progress['total']} definitions "
+                f"({progress['percent']:.1f}%), ETA {format_eta(progress['eta'])}"
+            )
+
+    def _translate_texts(
+        self,
+        texts: List[str],
+        keys: List[str],
+        label: str,
+        on_translated: Callable[[Dict[int, str], bool], None]
+    ) -> int:
+        """
+        Translate definition texts, each unique text once.
+
+        Texts are collapsed to their unique normalized form; texts found in
+        the translation memory are served from it, and only the remaining
+        ones are batched and sent to the API. New translations are stored in
+        the memory and handed to `on_translated` as each batch completes.
+
+        Args:
+            texts: English definition texts
+            keys: Batch key of each text ({entry_key}-def-{order})
+            label: Description of the texts for logging
+            on_translated: Called with (text position -> translation,
+                from_memory) for each group of translated texts
+
+        Returns:
+            Number of texts translated
+        """
+        from .translation_memory import normalize_text
+
+        normalized = [normalize_text(text) for text in texts]
+        positions = {}
+        unique_keys = {}
+        for position, (source, key) in enumerate(zip(normalized, keys)):
+            positions.setdefault(source, []).append(position)
+            unique_keys.setdefault(source, key)
+        unique = list(unique_keys)
+
+        hits = self.memory.get_many(unique, self.target_lang) if self.memory else {}
+        pending = [source for source in unique if source not in hits]
+        batches = [pending[start:start + self.batch_size] for start in range(0, len(pending), self.batch_size)]
+
+        self._memory_stats['texts_total'] += len(texts)
+        self._memory_stats['texts_unique'] += len(unique)
+        self._memory_stats['memory_hits'] += len(hits)
+        self._memory_stats['api_calls'] += len(batches)
+        self._memory_stats['api_calls_saved'] += math.ceil(len(texts) / self.batch_size) - len(batches)
+
+        if len(unique) < len(texts) or hits:
+            logger.info(
+                f"{label}: {len(texts)} definitions, {len(unique)} unique, "
+                f"{len(hits)} from translation memory, {len(pending)} to translate"
+            )
+
+        def spread(results: Dict[str, str]) -> Dict[int, str]:
+            return {
+                position: translation
+                for source, translation in results.items()
+                for position in positions[source]
+            }
+
+        total = 0
+        if hits:
+            translated = spread(hits)
+            on_translated(translated, True)
+            total += len(translated)
+
+        # Translate the remaining texts (batches run concurrently and are
+        # applied in batch order)
+        sent = 0
+        for batch_number, translations, error in self.translator.translate_batches(
+            batches,
+            self.target_lang,
+            keys=[[unique_keys[source] for source in batch] for batch in batches]
+        ):
+            if error is not None:
+                logger.error(f"Failed to translate batch {batch_number + 1}/{len(batches)} for {label}: {error}")
+                # Continue with next batch
+                continue
+
+            # Empty strings are padding for missing translations; keep them
+            # out of the memory and the file so a later run retries them
+            new = [
+                (source, translation.strip())
+                for source, translation in zip(batches[batch_number], translations)
+                if translation.strip()
+            ]
+            if self.memory:
+                self.memory.put_many(new, self.target_lang)
+            translated = spread(dict(new))
+            on_translated(translated, False)
+            total += len(translated)
+
+            sent += len(translations)
+            logger.info(
+                f"Translated batch {batch_number + 1}/{len(batches)} for {label}: {len(translations)} texts "
+                f"(total translated: {sent}/{len(pending)})"
+            )
+
+        return total
+
+    def _collect_definitions(self, entries: Dict) -> List[DefinitionRef]:
+        """Collect the definitions of entries that need translation."""
+        refs = []
+        for entry_key, entry in entries.items():
+            for def_idx, defn in self._extract_definitions_to_translate(entry):
+                order = defn.get('order', def_idx + 1)  # Use order field, fallback to index + 1
+                refs.append(DefinitionRef(
+                    entry_key=entry_key,
+                    definition_idx=def_idx,
+                    order=order,
+                    text=defn.get('text_en') or defn.get('text', ''),
+                    batch_key=f"{entry_key}-def-{order}"
+                ))
+        return refs
+
     def _process_entry(
         self,
         entry: Dict,
@@ -146,60 +359,24 @@ class LexiconProcessor:
         Returns:
             Tuple of (definitions_processed, definitions_translated)
         """
-        definitions_to_translate = self._extract_definitions_to_translate(entry)
+        entries = {entry_key: entry}
+        refs = self._collect_definitions(entries)
 
-        if not definitions_to_translate:
+        if not refs:
             return 0, 0
 
-        # Extract texts and create keys for batch processing
-        texts_to_translate = []
-        indices = []
-        batch_keys = []
+        # Translate unique texts (memory first, then the API)
+        translated = self._translate_texts(
+            [ref.text for ref in refs],
+            [ref.batch_key for ref in refs],
+            entry_key,
+            lambda part, from_memory: self._apply_translations(entries, refs, part, from_memory)
+        )
 
-        for idx, defn in definitions_to_translate:
-            text_en = defn.get('text_en') or defn.get('text', '')
-            texts_to_translate.append(text_en)
-            indices.append(idx)
+        if translated:
+            logger.info(f"Translated {translated} definitions for {entry_key}")
 
-            # Create key for batch processing: {entry_key}-def-{order}
-            order = defn.get('order', idx + 1)  # Use order field, fallback to index + 1
-            batch_keys.append(f"{entry_key}-def-{order}")
-        
-        # Translate in batches
-        total_translated = 0
-
-        for batch_idx in range(0, len(texts_to_translate), self.batch_size):
-            batch_texts = texts_to_translate[batch_idx:batch_idx + self.batch_size]
-            batch_indices = indices[batch_idx:batch_idx + self.batch_size]
-            batch_keys_subset = batch_keys[batch_idx:batch_idx + self.batch_size]
-
-            try:
-                translations = self.translator.translate_batch(
-                    batch_texts,
-                    self.target_lang,
-                    keys=batch_keys_subset,
-                    batch_index=batch_idx // self.batch_size + 1
-                )
-                
-                # Update entry with translations
-                self._update_entry_definitions(
-                    entry,
-                    translations,
-                    batch_indices
-                )
-                
-                total_translated += len(translations)
-                logger.info(
-                    f"Translated {len(translations)} definitions for {entry_key}"
-                )
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to translate batch for {entry_key}: {e}"
-                )
-                # Continue with next batch
-        
-        return len(definitions_to_translate), total_translated
+        return len(refs), translated
 
     def _process_entries_cross_batch(self, entries: Dict) -> Tuple[int, int]:
         """
@@ -214,80 +391,25 @@ class LexiconProcessor:
         Returns:
             Tuple of (total_definitions_processed, total_definitions_translated)
         """
-        class DefinitionRef(NamedTuple):
-            entry_key: str
-            definition_idx: int
-            text: str
-            batch_key: str
-
         # Collect all definitions that need translation
-        definitions_to_translate = []
-        total_definitions_processed = 0
-
-        for entry_key, entry in entries.items():
-            entry_definitions = self._extract_definitions_to_translate(entry)
-            total_definitions_processed += len(entry_definitions)
+        refs = self._collect_definitions(entries)
 
-            for def_idx, defn in entry_definitions:
-                text_en = defn.get('text_en') or defn.get('text', '')
-                order = defn.get('order', def_idx + 1)
-                batch_key = f"{entry_key}-def-{order}"
-
-                definitions_to_translate.append(DefinitionRef(
-                    entry_key=entry_key,
-                    definition_idx=def_idx,
-                    text=text_en,
-                    batch_key=batch_key
-                ))
-
-        if not definitions_to_translate:
+        if not refs:
             return 0, 0
 
-        logger.info(f"Collected {len(definitions_to_translate)} definitions to translate across {len(entries)} entries")
-
-        # Batch and translate all definitions together
-        total_translated = 0
-
-        for batch_idx in range(0, len(definitions_to_translate), self.batch_size):
-            batch_refs = definitions_to_translate[batch_idx:batch_idx + self.batch_size]
-            batch_texts = [ref.text for ref in batch_refs]
-            batch_keys = [ref.batch_key for ref in batch_refs]
-
-            try:
-                translations = self.translator.translate_batch(
-                    batch_texts,
-                    self.target_lang,
-                    keys=batch_keys,
-                    batch_index=batch_idx // self.batch_size + 1
-                )
-
-                # Distribute translations back to their respective entries
-                for ref, translation in zip(batch_refs, translations):
-                    entry = entries[ref.entry_key]
-                    definitions = entry.get('definitions', [])
-
-                    if ref.definition_idx < len(definitions):
-                        defn = definitions[ref.definition_idx]
+        logger.info(f"Collected {len(refs)} definitions to translate across {len(entries)} entries")
 
-                        # Migrate 'text' to 'text_en' if needed
-                        if 'text' in defn and 'text_en' not in defn:
-                            defn['text_en'] = defn.pop('text')
-
-                        # Add translation
-                        defn[self.text_field] = translation.strip()
-
-                total_translated += len(translations)
-                logger.info(
-                    f"Translated batch {i//self.batch_size + 1}: {len(translations)} definitions "
-                    f"(total translated: {total_translated}/{len(definitions_to_translate)})"
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to translate batch starting at index {i}: {e}")
-                # Continue with next batch
-                continue
+        # Translate the unique texts of all entries together (memory first,
+        # then the API in concurrent batches); translations are distributed
+        # back to their entries as each batch completes
+        translated = self._translate_texts(
+            [ref.text for ref in refs],
+            [ref.batch_key for ref in refs],
+            f"{len(entries)} entries",
+            lambda part, from_memory: self._apply_translations(entries, refs, part, from_memory)
+        )
 
-        return total_definitions_processed, total_translated
+        return len(refs), translated
 
     def process_file(
         self,
@@ -307,6 +429,9 @@ class LexiconProcessor:
         Returns:
             Dictionary with processing statistics
         """
+        from .config import JOURNAL_DIR
+        from .journal import TranslationJournal
+
         logger.info(f"Loading file: {file_path}")
         data = self._load_json_file(file_path)
         
@@ -315,56 +440,61 @@ class LexiconProcessor:
             'entries_total': len(data),
             'definitions_processed': 0,
             'definitions_translated': 0,
+            'definitions_resumed': 0,
         }
+
+        # Replay the checkpoint journal of an interrupted run
+        journal = None
+        if not dry_run:
+            journal = TranslationJournal(JOURNAL_DIR / f"{file_path.stem}.{self.target_lang}.ndjson")
+            stats['definitions_resumed'] = journal.replay(data, self.text_field)
         
         # Filter entries if strong_number is specified
-        entries_to_process = {}
-        if strong_number:
-            # Try to find entry by key or strong_number field
-            if strong_number in data:
-                entries_to_process[strong_number] = data[strong_number]
-            else:
-                # Search by strong_number field
-                for key, entry in data.items():
-                    if entry.get('strong_number') == strong_number:
-                        entries_to_process[key] = entry
-                        break
-            
-            if not entries_to_process:
-                logger.warning(f"Strong's number {strong_number} not found")
-                return stats
-        else:
-            entries_to_process = data
+        entries_to_process = select_entries(data, strong_number)
+        if strong_number and not entries_to_process:
+            logger.warning(f"Strong's number {strong_number} not found")
+            return stats
         
         logger.info(
             f"Processing {len(entries_to_process)} entries "
             f"(target language: {self.target_lang})"
         )
 
-        # Choose processing method based on whether we're processing a single entry or multiple entries
-        if strong_number:
-            # For single entry processing, use the original per-entry method
-            processed, translated = 0, 0
-            for entry_key, entry in entries_to_process.items():
-                try:
-                    entry_processed, entry_translated = self._process_entry(entry, entry_key)
-                    processed += entry_processed
-                    translated += entry_translated
-
-                    stats['entries_processed'] += 1
-
-                    if entry_processed > 0:
-                        logger.info(
-                            f"Entry {entry_key}: {entry_translated}/{entry_processed} definitions translated"
-                        )
-
-                except Exception as e:
-                    logger.error(f"Error processing entry {entry_key}: {e}")
-                    continue
-        else:
-            # For full processing, use cross-entry batching for better efficiency
-            processed, translated = self._process_entries_cross_batch(entries_to_process)
-            stats['entries_processed'] = len(entries_to_process)
+        # Journal each completed batch so an interrupted run can resume
+        if journal:
+            journal.start_run(len(self._collect_definitions(entries_to_process)))
+        self.journal = journal
+
+        try:
+            # Choose processing method based on whether we're processing a single entry or multiple entries
+            if strong_number:
+                # For single entry processing, use the original per-entry method
+                processed, translated = 0, 0
+                for entry_key, entry in entries_to_process.items():
+                    try:
+                        entry_processed, entry_translated = self._process_entry(entry, entry_key)
+                        processed += entry_processed
+                        translated += entry_translated
+
+                        stats['entries_processed'] += 1
+
+                        if entry_processed > 0:
+                            logger.info(
+                                f"Entry {entry_key}: {entry_translated}/{entry_processed} definitions translated"
+                            )
+
+                    except Exception as e:
+                        logger.error(f"Error processing entry {entry_key}: {e}")
+                        continue
+            else:
+                # For full processing, use cross-entry batching for better efficiency
+                processed, translated = self._process_entries_cross_batch(entries_to_process)
+                stats['entries_processed'] = len(entries_to_process)
+        finally:
+            # The journal stays on disk until the file is saved
+            self.journal = None
+            if journal:
+                journal.close()
 
         stats['definitions_processed'] = processed
         stats['definitions_translated'] = translated
@@ -377,6 +507,8 @@ class LexiconProcessor:
             if pretty_file_path:
                 logger.info(f"Saving pretty file: {pretty_file_path}")
                 self._save_json_file(data, pretty_file_path, pretty=True)
+
+            journal.remove()
         else:
             logger.info("DRY RUN MODE - Skipping file save")
         
@@ -414,4 +546,18 @@ class LexiconProcessor:
 
     def get_mismatch_stats(self) -> Dict[str, int]:
         """Get mismatch statistics from the translator."""
-        return self.translator.get_mismatch_stats()
\ No newline at end of file
+        return self.translator.get_mismatch_stats()
+
+    def get_usage_stats(self) -> Dict[str, int]:
+        """Get API usage statistics from the translator."""
+        return self.translator.get_usage_stats()
+
+    def get_memory_stats(self) -> Dict[str, int]:
+        """Get translation memory statistics (total vs unique texts, hits, API calls saved)."""
+        return dict(self._memory_stats)
+
+    def close(self):
+        """Close the translation memory."""
+        if self.memory:
+            self.memory.close()
+            self.memory = None
\ No newline at end of file
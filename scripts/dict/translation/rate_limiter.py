@@ -0,0 +1,100 @@
+"""
+Token-bucket rate limiter module.
+
+Shared by all in-flight translation batches: one bucket holds the request
+budget per minute, another the (estimated) token budget per minute.
+"""
+
+import threading
+import time
+from typing import Callable, Dict
+
+
+class TokenBucketLimiter:
+    """Thread-safe limiter for requests/min and tokens/min."""
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter with full buckets.
+
+        Args:
+            requests_per_minute: Requests allowed per minute
+            tokens_per_minute: Tokens (input + output) allowed per minute
+            clock: Monotonic clock in seconds
+        """
+        if requests_per_minute <= 0 or tokens_per_minute <= 0:
+            raise ValueError("Rate limits must be positive")
+
+        self.request_capacity = float(requests_per_minute)
+        self.token_capacity = float(tokens_per_minute)
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._requests = self.request_capacity
+        self._tokens = self.token_capacity
+        self._updated = clock()
+        self._stats = {'acquired': 0, 'waits': 0, 'wait_seconds': 0.0}
+
+    def _refill(self):
+        """Add the budget accrued since the last update (caller holds the lock)."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.request_capacity, self._requests + elapsed * self.request_capacity / 60)
+        self._tokens = min(self.token_capacity, self._tokens + elapsed * self.token_capacity / 60)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request and the given tokens are available, then take them.
+
+        Args:
+            tokens: Estimated tokens of the request (capped at the bucket size)
+
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = min(float(tokens), self.token_capacity)
+        waited = 0.0
+        with self._condition:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    self._stats['acquired'] += 1
+                    if waited:
+                        self._stats['waits'] += 1
+                        self._stats['wait_seconds'] += waited
+                    return waited
+
+                # Sleep until the scarcer bucket has refilled enough
+                wait = max(
+                    (1 - self._requests) * 60 / self.request_capacity,
+                    (tokens - self._tokens) * 60 / self.token_capacity,
+                    0.001
+                )
+                start = self._clock()
+                self._condition.wait(wait)
+                waited += self._clock() - start
+
+    def settle(self, estimated: int, actual: int):
+        """
+        Correct the token bucket once a request's real usage is known.
+
+        Args:
+            estimated: Tokens taken by acquire()
+            actual: Tokens reported by the API
+        """
+        with self._condition:
+            self._refill()
+            self._tokens = min(self.token_capacity, self._tokens + estimated - actual)
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict:
+        """Get limiter statistics (requests acquired, waits, seconds waited)."""
+        with self._condition:
+            return dict(self._stats)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Local stub of the Grok (OpenAI-compatible) responses API.
+
+Answers POST /v1/responses with a deterministic "translation" of every
+numbered definition in the prompt (the text followed by the language name;
+one object of language code -> translation per definition for multi-language
+prompts), after a configurable latency, and answers a configurable share of requests
+with 429 + Retry-After. Used to exercise concurrency, rate limiting and
+retries without an API key:
+
+    python -m scripts.dict.translation.stub_server --port 8089 --latency 0.5 --error-rate 0.1
+    GROK_BASE_URL=http://127.0.0.1:8089/v1 XAI_API_KEY=stub python -m scripts.dict.translation.main ...
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+PROMPT_LANGUAGE = re.compile(r'from English to (.+?)\.')
+PROMPT_LANGUAGES = re.compile(r'^- (\w+): (.+)$', re.MULTILINE)
+PROMPT_ITEM = re.compile(r'^(\d+)\. (.*)$', re.MULTILINE)
+
+
+def stub_translation(text: str, language: str) -> str:
+    """The stub's translation of a definition."""
+    return f"{text} [{language}]"
+
+
+def parse_prompt(prompt: str) -> Tuple[str, List[str]]:
+    """Extract the target language name and the numbered definitions of a prompt."""
+    match = PROMPT_LANGUAGE.search(prompt)
+    language = match.group(1) if match else 'unknown'
+    body = prompt.split('Input definitions:', 1)[-1]
+    return language, [text for _, text in PROMPT_ITEM.findall(body)]
+
+
+def parse_languages(prompt: str) -> List[Tuple[str, str]]:
+    """Extract the (code, name) target languages of a multi-language prompt."""
+    if 'into each of these languages:' not in prompt:
+        return []
+    header = prompt.split('Input definitions:', 1)[0]
+    return PROMPT_LANGUAGES.findall(header)
+
+
+class StubServer:
+    """Threaded stub server with injected latency and 429 responses."""
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.2,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 0.5,
+        seed: int = 0
+    ):
+        """
+        Initialize the server (port 0 picks a free port).
+
+        Args:
+            latency: Seconds before each response
+            jitter: Extra random latency, up to this many seconds
+            error_rate: Share of requests answered with 429
+            retry_after: Retry-After value of the 429 responses (seconds)
+            seed: Random seed for jitter and 429 injection
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'rate_limited': 0, 'in_flight': 0, 'max_in_flight': 0}
+        self._thread: Optional[threading.Thread] = None
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                stub.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-compatible base URL of the server."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _draw(self) -> Tuple[bool, float]:
+        """Decide whether the next request is rate limited, and its delay."""
+        with self._lock:
+            limited = self._random.random() < self.error_rate
+            delay = self.latency + self._random.random() * self.jitter
+        return limited, delay
+
+    def handle(self, request: BaseHTTPRequestHandler):
+        """Answer one request."""
+        length = int(request.headers.get('Content-Length') or 0)
+        body = json.loads(request.rfile.read(length) or b'{}')
+
+        if request.path.rstrip('/') not in ('/v1/responses', '/responses'):
+            self._send(request, 404, {'error': {'message': f'Unknown path {request.path}'}})
+            return
+
+        limited, delay = self._draw()
+        with self._lock:
+            self.stats['requests'] += 1
+            if limited:
+                self.stats['rate_limited'] += 1
+
+        if limited:
+            self._send(request, 429, {'error': {'message': 'Rate limit exceeded (stub)', 'type': 'rate_limit'}},
+                       {'Retry-After': f"{self.retry_after:g}"})
+            return
+
+        with self._lock:
+            self.stats['in_flight'] += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.stats['in_flight'])
+        try:
+            time.sleep(delay)
+        finally:
+            with self._lock:
+                self.stats['in_flight'] -= 1
+
+        prompt = '\n'.join(
+            item.get('content', '') for item in body.get('input', [])
+            if isinstance(item, dict) and item.get('role') == 'user'
+        )
+        language, texts = parse_prompt(prompt)
+        languages = parse_languages(prompt)
+        if languages:
+            output_text = json.dumps({'translations': [
+                {code: stub_translation(text, name) for code, name in languages} for text in texts
+            ]}, ensure_ascii=False)
+        else:
+            output_text = json.dumps([stub_translation(text, language) for text in texts], ensure_ascii=False)
+        self._send(request, 200, self._response(body.get('model', 'stub'), output_text, prompt))
+
+    def _response(self, model: str, output_text: str, prompt: str) -> Dict:
+        """Responses API body with one output message."""
+        input_tokens = len(prompt) // 4
+        output_tokens = len(output_text) // 4
+        return {
+            'id': f"resp_stub_{self.stats['requests']}",
+            'object': 'response',
+            'created_at': int(time.time()),
+            'model': model,
+            'status': 'completed',
+            'output': [{
+                'type': 'message',
+                'id': 'msg_stub',
+                'role': 'assistant',
+                'status': 'completed',
+                'content': [{'type': 'output_text', 'text': output_text, 'annotations': []}],
+            }],
+            'parallel_tool_calls': False,
+            'tool_choice': 'auto',
+            'tools': [],
+            'usage': {
+                'input_tokens': input_tokens,
+                'input_tokens_details': {'cached_tokens': 0},
+                'output_tokens': output_tokens,
+                'output_tokens_details': {'reasoning_tokens': 0},
+                'total_tokens': input_tokens + output_tokens,
+            },
+        }
+
+    def _send(self, request: BaseHTTPRequestHandler, status: int, payload: Dict,
+              headers: Optional[Dict[str, str]] = None):
+        """Write a JSON response."""
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(data)
+
+    def start(self) -> 'StubServer':
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+def main():
+    """Serve the stub until interrupted."""
+    parser = argparse.ArgumentParser(description='Stub OpenAI-compatible translation server')
+    parser.add_argument('--host', default='127.0.0.1', help='Host to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8089, help='Port to bind (default: 8089)')
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds per response (default: 0.5)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency in seconds (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=0.5, help='Retry-After of 429 responses (default: 0.5)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, args.latency, args.jitter, args.error_rate, args.retry_after, args.seed)
+    print(f"Stub translation server on {server.base_url} (latency {args.latency}s, 429 rate {args.error_rate})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"Served {server.stats['requests']} requests ({server.stats['rate_limited']} rate limited, "
+              f"max {server.stats['max_in_flight']} in flight)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for resuming an interrupted translation run from its checkpoint journal.
+
+Journals part of a run, then translates the file against the local stub
+server and checks that only the definitions missing from the journal are
+sent again. No API key or network access is needed.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.dict.translation import config
+from scripts.dict.translation.journal import TranslationJournal
+from scripts.dict.translation.processor import LexiconProcessor
+from scripts.dict.translation.stub_server import StubServer, stub_translation
+
+
+def make_lexicon():
+    """Small lexicon file with four English definitions."""
+    return {
+        'H1': {'strong_number': 'H1', 'definitions': [
+            {'text_en': 'father', 'source': 'bdb', 'order': 1, 'sense': '0'},
+            {'text_en': 'ancestor', 'source': 'bdb', 'order': 2, 'sense': '1'},
+        ]},
+        'H2': {'strong_number': 'H2', 'definitions': [
+            {'text_en': 'to perish', 'source': 'bdb', 'order': 1, 'sense': '0'},
+        ]},
+        'H3': {'strong_number': 'H3', 'definitions': [
+            {'text_en': 'reed', 'source': 'strongs', 'order': 1},
+        ]},
+    }
+
+
+def journal_partial_run(path: Path):
+    """Journal the first batches of a run that was then interrupted."""
+    journal = TranslationJournal(path)
+    journal.start_run(pending=4)
+    journal.append([
+        ('H1', 1, 'father', 'padre (journal)'),
+        # The English text of H2 has changed since it was journaled
+        ('H2', 1, 'to be lost', 'perderse (journal)'),
+    ])
+    journal.close()
+
+    # The run died while writing the next batch
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"entry":"H3","order":1,"source":"re')
+
+
+def test_journal_resume():
+    """Test that a resumed run re-sends only the untranslated definitions."""
+    print("Testing journal resume...")
+
+    server = StubServer(latency=0.0).start()
+    journal_dir = config.JOURNAL_DIR
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        config.JOURNAL_DIR = tmp_path / 'journal'
+        try:
+            file_path = tmp_path / 'words.json'
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(make_lexicon(), f, ensure_ascii=False)
+
+            journal_path = config.JOURNAL_DIR / 'words.es.ndjson'
+            journal_partial_run(journal_path)
+
+            processor = LexiconProcessor(target_lang='es', batch_size=10, use_memory=False,
+                                         base_url=server.base_url, api_key='stub')
+
+            sent = []
+            translate_batch = processor.translator.translate_batch
+
+            def recording_translate_batch(texts, *args, **kwargs):
+                sent.extend(texts)
+                return translate_batch(texts, *args, **kwargs)
+
+            processor.translator.translate_batch = recording_translate_batch
+            stats = processor.process_file(file_path)
+            processor.close()
+        finally:
+            config.JOURNAL_DIR = journal_dir
+            server.stop()
+
+        # Only the journaled H1 definition with unchanged English text is restored
+        assert stats['definitions_resumed'] == 1
+        assert sorted(sent) == ['ancestor', 'reed', 'to perish']
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved['H1']['definitions'][0]['text_es'] == 'padre (journal)'
+        assert saved['H1']['definitions'][1]['text_es'] == stub_translation('ancestor', 'Spanish')
+        assert saved['H2']['definitions'][0]['text_es'] == stub_translation('to perish', 'Spanish')
+        assert saved['H3']['definitions'][0]['text_es'] == stub_translation('reed', 'Spanish')
+
+        # The journal is removed once the file is saved
+        assert not journal_path.exists()
+
+    print("✓ Journal resume tests passed\n")
+
+
+def test_replay_skips_translated():
+    """Test that replay never overwrites an existing translation."""
+    print("Testing journal replay of translated definitions...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / 'words.es.ndjson'
+        journal_partial_run(path)
+
+        data = make_lexicon()
+        data['H1']['definitions'][0]['text_es'] = 'padre'
+        assert TranslationJournal(path).replay(data, 'text_es') == 0
+        assert data['H1']['definitions'][0]['text_es'] == 'padre'
+        assert 'text_es' not in data['H2']['definitions'][0]
+
+    print("✓ Journal replay tests passed\n")
+
+
+def main():
+    """Run all tests."""
+    print("Running translation journal tests...\n")
+
+    try:
+        test_journal_resume()
+        test_replay_skips_translated()
+
+        print("🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent batch translation.
+
+Covers the token-bucket limiter (with a fake clock), retry-after parsing and
+in-order delivery of concurrently translated batches. No API calls are made.
+"""
+
+import sys
+import threading
+import time
+from email.utils import formatdate
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.dict.translation.rate_limiter import TokenBucketLimiter
+from scripts.dict.translation.translator import GrokTranslator
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the test advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_translator(concurrency: int = 4) -> GrokTranslator:
+    """Translator that never reaches the network."""
+    return GrokTranslator(concurrency=concurrency, base_url='http://127.0.0.1:9/v1', api_key='stub')
+
+
+def error_with_headers(headers):
+    """Stand-in for an API error carrying response headers."""
+    return SimpleNamespace(response=SimpleNamespace(headers=headers))
+
+
+def test_limiter_buckets():
+    """Test request and token budgets, refill and settle."""
+    print("Testing token bucket limiter...")
+
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(requests_per_minute=2, tokens_per_minute=100, clock=clock)
+
+    # Full buckets: two requests go through without waiting
+    assert limiter.acquire(tokens=40) == 0.0
+    assert limiter.acquire(tokens=40) == 0.0
+
+    # 30 seconds refill one request (of 2/min) and 50 tokens (of 100/min)
+    clock.now = 30.0
+    assert limiter.acquire(tokens=60) == 0.0
+
+    # Requests larger than the bucket are capped instead of waiting forever
+    clock.now = 90.0
+    assert limiter.acquire(tokens=1000) == 0.0
+
+    # settle() returns the unused part of an estimate
+    clock.now = 120.0
+    limiter.settle(estimated=100, actual=20)
+    assert limiter.acquire(tokens=80) == 0.0
+
+    stats = limiter.get_stats()
+    assert stats['acquired'] == 5 and stats['waits'] == 0
+
+    try:
+        TokenBucketLimiter(requests_per_minute=0, tokens_per_minute=100)
+        assert False, "zero rate limit was accepted"
+    except ValueError:
+        pass
+
+    print("✓ Token bucket limiter tests passed\n")
+
+
+def test_limiter_waits():
+    """Test that an empty bucket blocks until the clock has refilled it."""
+    print("Testing token bucket limiter waits...")
+
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(requests_per_minute=1, tokens_per_minute=1000, clock=clock)
+    assert limiter.acquire() == 0.0
+
+    waited = []
+    thread = threading.Thread(target=lambda: waited.append(limiter.acquire()))
+    thread.start()
+    time.sleep(0.05)
+    assert thread.is_alive(), "acquire did not wait for an empty bucket"
+
+    # A minute later the request bucket is full again; settle() wakes the waiter
+    clock.now = 60.0
+    limiter.settle(estimated=0, actual=0)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert waited == [60.0]
+    stats = limiter.get_stats()
+    assert stats['waits'] == 1 and stats['wait_seconds'] == 60.0
+
+    print("✓ Token bucket limiter wait tests passed\n")
+
+
+def test_retry_after_seconds():
+    """Test parsing of retry-after-ms, retry-after seconds and HTTP dates."""
+    print("Testing retry-after parsing...")
+
+    translator = make_translator()
+    retry_after = translator._retry_after_seconds
+
+    assert retry_after(error_with_headers({'retry-after-ms': '1500'})) == 1.5
+    assert retry_after(error_with_headers({'retry-after': '3'})) == 3.0
+    assert retry_after(error_with_headers({'retry-after-ms': '250', 'retry-after': '3'})) == 0.25
+
+    # An unreadable retry-after-ms falls back to retry-after
+    assert retry_after(error_with_headers({'retry-after-ms': 'soon', 'retry-after': '2'})) == 2.0
+
+    # HTTP-date form, in the future and in the past
+    future = retry_after(error_with_headers({'retry-after': formatdate(time.time() + 10, usegmt=True)}))
+    assert 8.0 <= future <= 10.0
+    assert retry_after(error_with_headers({'retry-after': formatdate(time.time() - 60, usegmt=True)})) == 0.0
+
+    # No usable hint
+    assert retry_after(error_with_headers({'retry-after': 'later'})) is None
+    assert retry_after(error_with_headers({})) is None
+    assert retry_after(Exception("no response")) is None
+
+    print("✓ Retry-after parsing tests passed\n")
+
+
+def test_run_batches_order():
+    """Test that results come back in input order whatever order batches finish in."""
+    print("Testing in-order batch delivery...")
+
+    translator = make_translator(concurrency=4)
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, maximum
+    finished = []
+
+    def translate(index: int):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        try:
+            # Later batches finish first
+            time.sleep(0.01 * (8 - index))
+            if index == 5:
+                raise RuntimeError("batch 5 failed")
+            return f"result {index}"
+        finally:
+            with lock:
+                in_flight[0] -= 1
+                finished.append(index)
+
+    results = list(translator._run_batches(8, translate))
+
+    assert [index for index, _, _ in results] == list(range(8))
+    for index, result, error in results:
+        if index == 5:
+            assert result is None and str(error) == "batch 5 failed"
+        else:
+            assert result == f"result {index}" and error is None
+    assert finished != sorted(finished), "batches did not run concurrently"
+    assert in_flight[1] <= 4
+
+    assert list(translator._run_batches(0, translate)) == []
+
+    print("✓ In-order batch delivery tests passed\n")
+
+
+def main():
+    """Run all tests."""
+    print("Running translation concurrency tests...\n")
+
+    try:
+        test_limiter_buckets()
+        test_limiter_waits()
+        test_retry_after_seconds()
+        test_run_batches_order()
+
+        print("🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
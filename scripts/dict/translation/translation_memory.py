@@ -0,0 +1,120 @@
+"""
+Translation memory module.
+
+Persists translations in a local SQLite database keyed by (normalized
+English text, target language, model, prompt version), so identical
+definitions are translated once across entries, files and runs.
+"""
+
+import re
+import sqlite3
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize English source text for lookup.
+
+    NFC normalization and collapsed whitespace; case and punctuation are
+    kept since they carry over into the translation.
+    """
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+class TranslationMemory:
+    """SQLite-backed store of translated definition texts."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS translations (
+            source TEXT NOT NULL,
+            lang TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_version TEXT NOT NULL,
+            translation TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            PRIMARY KEY (source, lang, model, prompt_version)
+        ) WITHOUT ROWID
+    """
+
+    def __init__(self, db_path: Path, model: str, prompt_version: str):
+        """
+        Open (or create) the translation memory.
+
+        Args:
+            db_path: SQLite database file
+            model: Model name the translations come from
+            prompt_version: Version of the translation prompt
+        """
+        self.db_path = Path(db_path)
+        self.model = model
+        self.prompt_version = prompt_version
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.connection = sqlite3.connect(str(self.db_path))
+            self.connection.execute(self.SCHEMA)
+            self.connection.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to open translation memory {self.db_path}: {e}")
+
+    def close(self):
+        """Close the database connection."""
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    def get_many(self, sources: Iterable[str], lang: str) -> Dict[str, str]:
+        """
+        Look up translations.
+
+        Args:
+            sources: Normalized English texts
+            lang: Target language code
+
+        Returns:
+            Dictionary of normalized text -> translation for the texts found
+        """
+        sources = list(sources)
+        found = {}
+        # Stay well below SQLite's host parameter limit
+        for start in range(0, len(sources), 500):
+            chunk = sources[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT source, translation FROM translations "
+                f"WHERE lang = ? AND model = ? AND prompt_version = ? AND source IN ({placeholders})",
+                [lang, self.model, self.prompt_version, *chunk]
+            )
+            found.update(rows)
+        return found
+
+    def put_many(self, pairs: Iterable[Tuple[str, str]], lang: str):
+        """
+        Store translations (committed immediately).
+
+        Args:
+            pairs: (normalized English text, translation) pairs
+            lang: Target language code
+        """
+        now = time.time()
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+            [(source, lang, self.model, self.prompt_version, translation, now) for source, translation in pairs]
+        )
+        self.connection.commit()
+
+    def count(self, lang: str = None) -> int:
+        """Number of stored translations (for one language, or all)."""
+        if lang:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM translations WHERE lang = ?", (lang,)
+            ).fetchone()[0]
+        return self.connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def languages(self) -> List[str]:
+        """Languages with stored translations."""
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT lang FROM translations ORDER BY lang")]
@@ -9,11 +9,13 @@ import json
 import time
 import logging
 import re
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 try:
     import httpx
-    from openai import OpenAI
+    from openai import APIStatusError, OpenAI
 except ImportError as e:
     raise ImportError(
         "Grok translator requires 'openai' package. Install with: pip install openai"
@@ -26,35 +28,68 @@ from .config import (
     GROK_TIMEOUT,
     MAX_RETRIES,
     RETRY_BACKOFF_BASE,
-    RATE_LIMIT_DELAY,
+    RATE_LIMIT_RETRY_DEFAULT,
+    DEFAULT_CONCURRENCY,
+    REQUESTS_PER_MINUTE,
+    TOKENS_PER_MINUTE,
     get_language_name,
+    supports_structured_output,
     validate_grok_api_key,
 )
+from .rate_limiter import TokenBucketLimiter
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class GrokTranslator:
     """Translator using xAI Grok API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        requests_per_minute: float = REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = TOKENS_PER_MINUTE,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None
+    ):
         """
         Initialize the translator with API key.
+
+        Args:
+            concurrency: Maximum number of batches in flight (translate_batches)
+            requests_per_minute: Request budget shared by all batches
+            tokens_per_minute: Estimated token budget shared by all batches
+            base_url: API endpoint (default: GROK_BASE_URL)
+            api_key: API key (default: XAI_API_KEY)
         """
-        if not validate_grok_api_key():
+        if not api_key and not validate_grok_api_key():
             raise ValueError(
                 "XAI_API_KEY not found in environment variables. "
                 "Please set it in .env file or as an environment variable."
             )
 
-        # Initialize OpenAI client with Grok base URL
+        # Initialize OpenAI client with Grok base URL (retries are handled here,
+        # per batch, so the client's own retry loop is disabled)
         self.client = OpenAI(
-            api_key=XAI_API_KEY,
-            base_url=GROK_BASE_URL,
+            api_key=api_key or XAI_API_KEY,
+            base_url=base_url or GROK_BASE_URL,
             timeout=httpx.Timeout(GROK_TIMEOUT),
+            max_retries=0,
         )
         self.model_name = GROK_MODEL
-        self._last_request_time = 0
+        self.concurrency = max(1, concurrency)
+        self.limiter = TokenBucketLimiter(requests_per_minute, tokens_per_minute)
+        self._stats_lock = threading.Lock()
+        self._usage_stats = {
+            'requests': 0,
+            'rate_limited': 0,
+            'retries': 0,
+            'input_tokens': 0,
+            'output_tokens': 0,
+        }
+        self._language_usage: Dict[str, Dict[str, float]] = {}
         self._mismatch_stats = {
             'total_batches': 0,
             'mismatched_batches': 0,
@@ -63,14 +98,101 @@ class GrokTranslator:
             'mismatch_patterns': {}
         }
     
-    def _rate_limit(self):
-        """Enforce rate limiting between API calls."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < RATE_LIMIT_DELAY:
-            sleep_time = RATE_LIMIT_DELAY - time_since_last
-            time.sleep(sleep_time)
-        self._last_request_time = time.time()
+    def _estimate_tokens(self, prompt: str, texts: List[str]) -> int:
+        """
+        Estimate the tokens of a request before sending it.
+
+        Roughly 4 characters per input token, plus an output about as long as
+        the texts themselves (translations and JSON quoting).
+        """
+        return (len(prompt) + 100) // 4 + sum(len(text) for text in texts) // 3 + 4 * len(texts)
+
+    def _retry_after_seconds(self, error: Exception) -> Optional[float]:
+        """
+        Extract the server's retry-after hint from an API error.
+
+        Returns:
+            Seconds to wait, or None if the response carries no hint
+        """
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+
+        retry_after = headers.get('retry-after')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                # HTTP-date form
+                from email.utils import parsedate_to_datetime
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    return None
+        return None
+
+    def _count_usage(self, **counts: int):
+        """Add to the usage statistics (thread-safe)."""
+        with self._stats_lock:
+            for name, count in counts.items():
+                self._usage_stats[name] += count
+
+    def _count_language_usage(self, target_langs: List[str], input_tokens: int, output_tokens: int):
+        """
+        Add a request to the per-language usage statistics (thread-safe).
+
+        A request covering several languages counts as one call for each of
+        them, and its tokens are split evenly between them.
+        """
+        share = len(target_langs)
+        with self._stats_lock:
+            for lang in target_langs:
+                usage = self._language_usage.setdefault(
+                    lang, {'requests': 0, 'input_tokens': 0.0, 'output_tokens': 0.0}
+                )
+                usage['requests'] += 1
+                usage['input_tokens'] += input_tokens / share
+                usage['output_tokens'] += output_tokens / share
+
+    def _retry_wait(self, error: Exception) -> Optional[float]:
+        """
+        Seconds to wait before retrying after a rate limit error.
+
+        Returns:
+            The server's (or the default) rate limit wait, or None if the
+            error is not a rate limit (exponential backoff applies)
+        """
+        error_str = str(error)
+        wait_time = None
+
+        if isinstance(error, APIStatusError) and error.status_code == 429:
+            self._count_usage(rate_limited=1)
+            # Prefer the server's retry-after header
+            wait_time = self._retry_after_seconds(error)
+            if wait_time is not None:
+                logger.info(f"Rate limit detected. Waiting {wait_time:.1f} seconds as suggested by API...")
+
+        # Try to extract retry_delay from error message
+        if wait_time is None and ("429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower()):
+            # Look for retry delay in error message
+            retry_match = re.search(r'retry.*?(\d+(?:\.\d+)?)', error_str, re.IGNORECASE)
+            if retry_match:
+                wait_time = float(retry_match.group(1))
+                logger.info(f"Rate limit detected. Waiting {wait_time:.1f} seconds as suggested by API...")
+            else:
+                # Default wait time for rate limits
+                wait_time = RATE_LIMIT_RETRY_DEFAULT
+                logger.info(f"Rate limit detected. Waiting {wait_time:.1f} seconds...")
+
+        return wait_time
     
     def _generate_prompt(self, texts: List[str], target_lang: str) -> str:
         """
@@ -227,7 +349,98 @@ Input definitions:
         Returns:
             Dictionary with mismatch statistics
         """
-        return self._mismatch_stats.copy()
+        with self._stats_lock:
+            stats = self._mismatch_stats.copy()
+            stats['mismatch_patterns'] = dict(stats['mismatch_patterns'])
+        return stats
+
+    def get_usage_stats(self) -> Dict:
+        """
+        Get API usage statistics for reporting.
+
+        Returns:
+            Dictionary with requests, 429 responses, retries, reported tokens
+            and rate limiter waits
+        """
+        with self._stats_lock:
+            stats = self._usage_stats.copy()
+        limiter_stats = self.limiter.get_stats()
+        stats['limiter_waits'] = limiter_stats['waits']
+        stats['limiter_wait_seconds'] = limiter_stats['wait_seconds']
+        return stats
+
+    def get_language_usage_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get API usage statistics per target language.
+
+        Returns:
+            Dictionary of language code -> requests, input_tokens and
+            output_tokens (tokens of multi-language requests are split
+            evenly between their languages)
+        """
+        with self._stats_lock:
+            return {
+                lang: {
+                    'requests': usage['requests'],
+                    'input_tokens': round(usage['input_tokens']),
+                    'output_tokens': round(usage['output_tokens']),
+                }
+                for lang, usage in sorted(self._language_usage.items())
+            }
+
+    def _run_batches(
+        self,
+        count: int,
+        translate: Callable[[int], T]
+    ) -> Iterator[Tuple[int, Optional[T], Optional[Exception]]]:
+        """
+        Run translate(index) for each batch in the thread pool.
+
+        Yields:
+            (batch index, result, None) or (batch index, None, error), in input order
+        """
+        if not count:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, count)) as executor:
+            futures = [executor.submit(translate, index) for index in range(count)]
+            try:
+                for index, future in enumerate(futures):
+                    try:
+                        yield index, future.result(), None
+                    except Exception as e:
+                        yield index, None, e
+            finally:
+                # Stop queued batches if the consumer gives up early
+                for future in futures:
+                    future.cancel()
+
+    def translate_batches(
+        self,
+        batches: List[List[str]],
+        target_lang: str,
+        keys: Optional[List[List[str]]] = None
+    ) -> Iterator[Tuple[int, Optional[List[str]], Optional[Exception]]]:
+        """
+        Translate several batches concurrently.
+
+        Up to `concurrency` batches are in flight at once, all drawing on the
+        shared rate limiter; a batch that is backing off (429, parse error)
+        only delays itself. Results are yielded in input order.
+
+        Args:
+            batches: Lists of English definition texts
+            target_lang: Target language code (e.g., 'es', 'pt')
+            keys: Optional keys per batch (kept for compatibility)
+
+        Yields:
+            (batch index, translations, None) or (batch index, None, error)
+        """
+        def translate(index: int) -> List[str]:
+            batch_keys = keys[index] if keys else None
+            return self.translate_batch(batches[index], target_lang, keys=batch_keys, batch_index=index + 1)
+
+        return self._run_batches(len(batches), translate)
 
     def translate_batch(
         self,
@@ -257,13 +470,225 @@ Input definitions:
 
         # Grok doesn't have a separate batch API like Gemini
         # Process synchronously
-        return self._translate_batch_sync(texts, target_lang, retry_count)
+        return self._translate_batch_sync(texts, target_lang, retry_count, batch_index)
+
+    def translate_batches_multi(
+        self,
+        batches: List[List[str]],
+        target_langs: List[List[str]]
+    ) -> Iterator[Tuple[int, Optional[List[Dict[str, str]]], Optional[Exception]]]:
+        """
+        Translate several batches, each into several languages, concurrently.
+
+        Args:
+            batches: Lists of English definition texts
+            target_langs: Target language codes of each batch
+
+        Yields:
+            (batch index, translations, None) or (batch index, None, error);
+            translations hold one dictionary of language code -> text per input text
+        """
+        def translate(index: int) -> List[Dict[str, str]]:
+            return self.translate_batch_multi(batches[index], target_langs[index], batch_index=index + 1)
+
+        return self._run_batches(len(batches), translate)
+
+    def translate_batch_multi(
+        self,
+        texts: List[str],
+        target_langs: List[str],
+        retry_count: int = 0,
+        batch_index: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Translate a batch of English texts into several languages in one request.
+
+        Uses a JSON schema for the response (structured outputs) when the
+        model supports it. A single language goes through translate_batch().
+
+        Args:
+            texts: List of English definition texts to translate
+            target_langs: Target language codes (e.g., ['es', 'pt'])
+            retry_count: Current retry attempt (for internal use)
+            batch_index: Batch number for logging
+
+        Returns:
+            One dictionary of language code -> translation per input text, in
+            input order (missing translations are empty strings)
+
+        Raises:
+            ValueError: If translation fails after max retries
+        """
+        if not texts:
+            return []
+        if len(target_langs) == 1:
+            translations = self.translate_batch(texts, target_langs[0], retry_count, batch_index=batch_index)
+            return [{target_langs[0]: translation} for translation in translations]
+
+        prompt = self._generate_multi_prompt(texts, target_langs)
+        estimated_tokens = self._estimate_tokens(prompt, texts * len(target_langs))
+        self.limiter.acquire(estimated_tokens)
+
+        request = {}
+        if supports_structured_output(self.model_name):
+            request['text'] = {'format': {
+                'type': 'json_schema',
+                'name': 'translations',
+                'schema': self._multi_language_schema(target_langs),
+                'strict': True,
+            }}
+
+        try:
+            response = self.client.responses.create(
+                model=self.model_name,
+                input=[
+                    {
+                        "role": "system",
+                        "content": "You are a helpful translator specializing in biblical Hebrew dictionary definitions."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                **request
+            )
+
+            # Settle the limiter with the reported usage
+            usage = getattr(response, 'usage', None)
+            input_tokens = getattr(usage, 'input_tokens', None) or 0
+            output_tokens = getattr(usage, 'output_tokens', None) or 0
+            self._count_usage(requests=1, input_tokens=input_tokens, output_tokens=output_tokens)
+            self._count_language_usage(target_langs, input_tokens, output_tokens)
+            if input_tokens or output_tokens:
+                self.limiter.settle(estimated_tokens, input_tokens + output_tokens)
+
+            return self._parse_multi_response(response.output_text, texts, target_langs, batch_index)
+
+        except Exception as e:
+            logger.error(f"Translation error: {e}")
+            wait_time = None if isinstance(e, (json.JSONDecodeError, ValueError)) else self._retry_wait(e)
+
+            if retry_count < MAX_RETRIES:
+                if wait_time is None:
+                    wait_time = RETRY_BACKOFF_BASE ** retry_count
+                logger.info(f"Retrying in {wait_time:.1f} seconds... (attempt {retry_count + 1}/{MAX_RETRIES})")
+                # Only this batch sleeps; other in-flight batches keep going
+                self._count_usage(retries=1)
+                time.sleep(wait_time)
+                return self.translate_batch_multi(texts, target_langs, retry_count + 1, batch_index)
+            else:
+                raise ValueError(
+                    f"Translation failed after {MAX_RETRIES} retries: {e}"
+                )
+
+    def _generate_multi_prompt(self, texts: List[str], target_langs: List[str]) -> str:
+        """
+        Generate the prompt for translating a batch into several languages.
+
+        Args:
+            texts: List of English definition texts to translate
+            target_langs: Target language codes
+
+        Returns:
+            Formatted prompt string
+        """
+        languages = '\n'.join(f"- {lang}: {get_language_name(lang) or lang}" for lang in target_langs)
+
+        prompt = f"""Translate these Hebrew dictionary definitions from English into each of these languages:
+{languages}
+Maintain technical accuracy and preserve biblical terminology.
+
+Return ONLY a valid JSON object of the form {{"translations": [...]}} with one object per input
+definition, in the same order as the input, mapping each language code above to the translation.
+Do not include any explanations, comments, or additional text - just the JSON object.
+
+Input definitions:
+"""
+        for i, text in enumerate(texts, 1):
+            prompt += f"{i}. {text}\n"
+
+        prompt += "\nReturn the translations as a JSON object:"
+
+        return prompt
+
+    def _multi_language_schema(self, target_langs: List[str]) -> Dict:
+        """JSON schema of a multi-language response."""
+        return {
+            'type': 'object',
+            'properties': {
+                'translations': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'properties': {lang: {'type': 'string'} for lang in target_langs},
+                        'required': list(target_langs),
+                        'additionalProperties': False,
+                    },
+                },
+            },
+            'required': ['translations'],
+            'additionalProperties': False,
+        }
+
+    def _parse_multi_response(
+        self,
+        response_text: str,
+        texts: List[str],
+        target_langs: List[str],
+        batch_index: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Parse a multi-language response into one dictionary per input text.
+
+        Raises:
+            ValueError: If the response holds no translations
+        """
+        response_text = (response_text or '').strip()
+        try:
+            parsed = json.loads(response_text)
+        except json.JSONDecodeError:
+            # Without structured outputs the object may be wrapped in text
+            start, end = response_text.find('{'), response_text.rfind('}')
+            if start < 0 or end <= start:
+                raise ValueError("Response holds no JSON object")
+            parsed = json.loads(response_text[start:end + 1])
+
+        translations = parsed.get('translations') if isinstance(parsed, dict) else parsed
+        if not isinstance(translations, list):
+            raise ValueError("Response has no translations array")
+
+        with self._stats_lock:
+            self._mismatch_stats['total_batches'] += 1
+            if len(translations) != len(texts):
+                pattern_key = f"{len(texts)}->{len(translations)}"
+                self._mismatch_stats['mismatched_batches'] += 1
+                if len(translations) > len(texts):
+                    self._mismatch_stats['total_truncation'] += len(translations) - len(texts)
+                else:
+                    self._mismatch_stats['total_padding'] += len(texts) - len(translations)
+                self._mismatch_stats['mismatch_patterns'][pattern_key] = \
+                    self._mismatch_stats['mismatch_patterns'].get(pattern_key, 0) + 1
+
+        if len(translations) != len(texts):
+            logger.warning(
+                f"Translation count mismatch in batch {batch_index or 'unknown'}: "
+                f"expected {len(texts)}, got {len(translations)}"
+            )
+
+        # Pad with empty strings if needed
+        results = []
+        for i in range(len(texts)):
+            item = translations[i] if i < len(translations) and isinstance(translations[i], dict) else {}
+            results.append({lang: str(item.get(lang) or '') for lang in target_langs})
+        return results
 
     def _translate_batch_sync(
         self,
         texts: List[str],
         target_lang: str,
-        retry_count: int = 0
+        retry_count: int = 0,
+        batch_index: Optional[int] = None
     ) -> List[str]:
         """
         Synchronous batch translation using Grok API.
@@ -272,6 +697,7 @@ Input definitions:
             texts: List of English definition texts to translate
             target_lang: Target language code (e.g., 'es', 'pt')
             retry_count: Current retry attempt
+            batch_index: Batch number for logging
 
         Returns:
             List of translated texts in the same order as input
@@ -279,13 +705,13 @@ Input definitions:
         if not texts:
             return []
 
-        self._rate_limit()
+        prompt = self._generate_prompt(texts, target_lang)
+        estimated_tokens = self._estimate_tokens(prompt, texts)
+        self.limiter.acquire(estimated_tokens)
         
         response_text = None
         
         try:
-            prompt = self._generate_prompt(texts, target_lang)
-            
             # Grok API uses /v1/responses endpoint with input array format
             logger.debug(f"Making API call to Grok with model: {self.model_name}")
             logger.debug(f"Prompt length: {len(prompt)} characters")
@@ -306,6 +732,15 @@ Input definitions:
 
             logger.debug(f"API call completed successfully")
 
+            # Settle the limiter with the reported usage
+            usage = getattr(response, 'usage', None)
+            input_tokens = getattr(usage, 'input_tokens', None) or 0
+            output_tokens = getattr(usage, 'output_tokens', None) or 0
+            self._count_usage(requests=1, input_tokens=input_tokens, output_tokens=output_tokens)
+            self._count_language_usage([target_lang], input_tokens, output_tokens)
+            if input_tokens or output_tokens:
+                self.limiter.settle(estimated_tokens, input_tokens + output_tokens)
+
             # Debug the response structure
             logger.debug(f"Response object: {response}")
             logger.debug(f"Response dir: {[attr for attr in dir(response) if not attr.startswith('_')]}")
@@ -511,26 +946,28 @@ Input definitions:
                 raise ValueError("Response is not a JSON array")
             
             # Track batch statistics
-            self._mismatch_stats['total_batches'] += 1
+            with self._stats_lock:
+                self._mismatch_stats['total_batches'] += 1
 
             if len(translations) != len(texts):
-                self._mismatch_stats['mismatched_batches'] += 1
-
                 # Calculate mismatch details
                 expected_count = len(texts)
                 actual_count = len(translations)
                 mismatch_diff = actual_count - expected_count
+                pattern_key = f"{expected_count}->{actual_count}"
 
-                # Track padding/truncation
-                if mismatch_diff > 0:
-                    self._mismatch_stats['total_truncation'] += mismatch_diff
-                elif mismatch_diff < 0:
-                    self._mismatch_stats['total_padding'] += abs(mismatch_diff)
+                with self._stats_lock:
+                    self._mismatch_stats['mismatched_batches'] += 1
 
-                # Track mismatch patterns
-                pattern_key = f"{expected_count}->{actual_count}"
-                self._mismatch_stats['mismatch_patterns'][pattern_key] = \
-                    self._mismatch_stats['mismatch_patterns'].get(pattern_key, 0) + 1
+                    # Track padding/truncation
+                    if mismatch_diff > 0:
+                        self._mismatch_stats['total_truncation'] += mismatch_diff
+                    elif mismatch_diff < 0:
+                        self._mismatch_stats['total_padding'] += abs(mismatch_diff)
+
+                    # Track mismatch patterns
+                    self._mismatch_stats['mismatch_patterns'][pattern_key] = \
+                        self._mismatch_stats['mismatch_patterns'].get(pattern_key, 0) + 1
 
                 # Enhanced logging with batch details
                 log_msg = f"Translation count mismatch in batch {batch_index or 'unknown'}: expected {expected_count}, got {actual_count}"
@@ -570,8 +1007,9 @@ Input definitions:
             if retry_count < MAX_RETRIES:
                 wait_time = RETRY_BACKOFF_BASE ** retry_count
                 logger.info(f"Retrying in {wait_time} seconds... (attempt {retry_count + 1}/{MAX_RETRIES})")
+                self._count_usage(retries=1)
                 time.sleep(wait_time)
-                return self.translate_batch(texts, target_lang, retry_count + 1)
+                return self.translate_batch(texts, target_lang, retry_count + 1, batch_index=batch_index)
             else:
                 raise ValueError(
                     f"Failed to parse translation response after {MAX_RETRIES} retries: {e}"
@@ -582,26 +1020,16 @@ Input definitions:
             logger.error(f"Translation error: {error_str}")
             
             # Check if it's a quota/rate limit error (429)
-            wait_time = None
-            
-            # Try to extract retry_delay from error message
-            if "429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower():
-                # Look for retry delay in error message
-                retry_match = re.search(r'retry.*?(\d+(?:\.\d+)?)', error_str, re.IGNORECASE)
-                if retry_match:
-                    wait_time = float(retry_match.group(1))
-                    logger.info(f"Rate limit detected. Waiting {wait_time:.1f} seconds as suggested by API...")
-                else:
-                    # Default wait time for rate limits
-                    wait_time = 60.0
-                    logger.info(f"Rate limit detected. Waiting {wait_time:.1f} seconds...")
+            wait_time = self._retry_wait(e)
             
             if retry_count < MAX_RETRIES:
                 if wait_time is None:
                     wait_time = RETRY_BACKOFF_BASE ** retry_count
                 logger.info(f"Retrying in {wait_time:.1f} seconds... (attempt {retry_count + 1}/{MAX_RETRIES})")
+                # Only this batch sleeps; other in-flight batches keep going
+                self._count_usage(retries=1)
                 time.sleep(wait_time)
-                return self._translate_batch_sync(texts, target_lang, retry_count + 1)
+                return self._translate_batch_sync(texts, target_lang, retry_count + 1, batch_index)
             else:
                 raise ValueError(
                     f"Translation failed after {MAX_RETRIES} retries: {e}"
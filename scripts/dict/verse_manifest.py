@@ -0,0 +1,166 @@
+"""
+Per-book input manifest for incremental verse builds
+
+Records, for every consolidated book file, hashes of what it was built
+from: each oe/ chapter file, the book's morphus XML and the senses the
+sense index holds for the Strong's numbers used in the book. A default
+build_verses.py run recomputes those hashes and rebuilds only the books
+whose inputs changed or whose output file is missing.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+import sys
+sys.path.insert(0, str(Path(__file__).parent))
+from config import config
+from book_mappings import BookMapper
+
+# Bump when the verse builder changes in a way that alters its output
+VERSE_BUILD_VERSION = 1
+
+MANIFEST_VERSION = 1
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_chapter_files(book_dir: Path) -> Dict[str, str]:
+    """Hash every oe/ chapter file of a book, keyed by file name"""
+    return {path.name: hash_file(path) for path in sorted(book_dir.glob("*.json"))}
+
+
+def hash_morphus(book_key: str) -> Optional[str]:
+    """Hash of a book's morphus XML, or None if the book has none"""
+    morphus_file = BookMapper.MORPHUS_BOOK_MAP.get(book_key)
+    if not morphus_file:
+        return None
+    xml_path = config.MORPHUS_DIR / morphus_file
+    return hash_file(xml_path) if xml_path.exists() else None
+
+
+def hash_senses(strong_numbers: Iterable[str], sense_index) -> str:
+    """Hash of the senses the sense index holds for a set of Strong's numbers"""
+    subset = [[number, list(sense_index.get_senses(number, count=False))] for number in sorted(strong_numbers)]
+    return hashlib.sha256(json.dumps(subset, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def book_strong_numbers(book_data: Dict) -> set:
+    """Strong's numbers used by the words of a consolidated book"""
+    return {
+        word['strong_number']
+        for chapter in book_data.values()
+        for verse in chapter.values()
+        for word in verse.get('words', [])
+        if word.get('strong_number')
+    }
+
+
+class VerseManifest:
+    """
+    Input hashes of each built book, keyed by book key.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize manifest.
+
+        Args:
+            path: Manifest JSON file (default: config.VERSE_MANIFEST)
+        """
+        self.path = path or config.VERSE_MANIFEST
+        self.books: Dict[str, Dict] = {}
+
+    def load(self):
+        """Load records from disk (missing or unreadable manifests start empty)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == MANIFEST_VERSION:
+            self.books = data.get('books', {})
+
+    def save(self):
+        """Write records atomically (temp file + rename)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'books': self.books}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def record_book(self, book_key: str, record: Dict):
+        """Store the record of a fully rebuilt book"""
+        self.books[book_key] = record
+
+    def record_chapter(self, book_key: str, chapter_name: str, chapter_hash: str, strong_numbers: Iterable[str]):
+        """
+        Update a book record after one chapter was patched in.
+
+        The morphus and sense hashes are left as they were, so a book whose
+        other inputs also changed is still rebuilt by the next default run.
+        """
+        record = self.books.get(book_key)
+        if record is None:
+            return
+        record['chapters'][chapter_name] = chapter_hash
+        record['strong_numbers'] = sorted(set(record['strong_numbers']) | set(strong_numbers))
+
+    def stale_reason(self, book_key: str, book_dir: Path, output_file: Path, sense_index) -> Optional[str]:
+        """
+        Explain why a book must be rebuilt.
+
+        Returns:
+            Reason string, or None if the book is up to date
+        """
+        record = self.books.get(book_key)
+        if record is None:
+            return "not in manifest"
+        if record.get('builder') != VERSE_BUILD_VERSION:
+            return "builder version changed"
+        if not output_file.exists():
+            return "output missing"
+
+        chapters = hash_chapter_files(book_dir)
+        if chapters != record['chapters']:
+            changed = sorted(set(chapters.items()) ^ set(record['chapters'].items()))
+            names = sorted({name for name, _ in changed})
+            return f"chapter files changed ({', '.join(names[:5])}{'...' if len(names) > 5 else ''})"
+        if hash_morphus(book_key) != record['morphus']:
+            return "morphus XML changed"
+        if hash_senses(record['strong_numbers'], sense_index) != record['senses']:
+            return "lexicon senses changed"
+
+        return None
+
+
+def build_book_record(book_key: str, book_dir: Path, strong_numbers: Iterable[str], sense_index) -> Dict:
+    """
+    Describe the inputs a book was just built from.
+
+    Args:
+        book_key: Book key in BOOK_MAPPING
+        book_dir: Path to the book directory in oe/
+        strong_numbers: Strong's numbers used by the book's words
+        sense_index: Sense index used for validation
+
+    Returns:
+        Manifest record for the book
+    """
+    strong_numbers = sorted(strong_numbers)
+    return {
+        'builder': VERSE_BUILD_VERSION,
+        'chapters': hash_chapter_files(book_dir),
+        'morphus': hash_morphus(book_key),
+        'strong_numbers': strong_numbers,
+        'senses': hash_senses(strong_numbers, sense_index),
+    }
@@ -5,10 +5,9 @@ Handles the creation of lightweight verse JSON files from Hebrew text data,
 integrating morphological analysis and lexicon validation.
 """
 
-import json
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -16,6 +15,7 @@ from config import config
 from book_mappings import BookMapper
 from strong_processor import StrongProcessor
 from morphus_loader import MorphusLoader
+from corpus_store import get_corpus_store, load_chapter
 
 
 class VerseProcessor:
@@ -127,8 +127,8 @@ class VerseProcessor:
         Returns:
             List of generated verses
         """
-        with open(chapter_file, 'r', encoding='utf-8') as f:
-            verses_data = json.load(f)
+        # Read-only verses from the corpus store (files outside it are loaded directly)
+        verses_data = load_chapter(chapter_file)
 
         # Extract chapter number from filename
         chapter_num = int(chapter_file.stem)
@@ -147,7 +147,7 @@ class VerseProcessor:
 
         return verses
 
-    def process_book(self, book_key: str, book_dir: Path, chapter_num: Optional[int] = None, verbose: bool = False) -> Tuple[int, int]:
+    def process_book(self, book_key: str, book_dir: Path, chapter_num: Optional[int] = None, verbose: bool = False) -> Tuple[int, int, Dict]:
         """
         Process chapters of a book
 
@@ -158,12 +158,37 @@ class VerseProcessor:
             verbose: Enable verbose output
 
         Returns:
-            Tuple (processed verses, errors)
+            Tuple (processed verses, errors, consolidated book data)
         """
+        stats = {'verses': 0, 'errors': 0}
+        book_data = {}  # Consolidated book data
+        for chapter, chapter_data in self.iter_book_chapters(book_key, book_dir, chapter_num, verbose, stats):
+            book_data.setdefault(chapter, {}).update(chapter_data)
+
+        return stats['verses'], stats['errors'], book_data
+
+    def iter_book_chapters(self, book_key: str, book_dir: Path, chapter_num: Optional[int] = None,
+                           verbose: bool = False, stats: Optional[Dict] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Process the chapters of a book one at a time, in chapter order.
+
+        Args:
+            book_key: Book key in BOOK_MAPPING
+            book_dir: Path to the book directory in oe/
+            chapter_num: Optional chapter number to process only that chapter
+            verbose: Enable verbose output
+            stats: Optional dict whose 'verses' and 'errors' counts are updated
+
+        Yields:
+            (chapter, {verse: verse data}) with verses in numeric order
+        """
+        if stats is None:
+            stats = {'verses': 0, 'errors': 0}
+
         book_info = BookMapper.get_book_info(book_key)
         if not book_info:
             print(f"Error: Book not found: {book_key}")
-            return 0, 0
+            return
 
         if verbose:
             print(f"📖 Processing: {book_info['en']} ({book_key})")
@@ -177,10 +202,6 @@ class VerseProcessor:
         elif verbose:
             print("  ⚠️  No BDB senses found")
 
-        total_verses = 0
-        total_errors = 0
-        book_data = {}  # Consolidated book data
-
         # Get chapter files
         if chapter_num:
             # Process only the specified chapter
@@ -189,8 +210,9 @@ class VerseProcessor:
                 chapter_file = book_dir / f"{chapter_num}.json"
             chapter_files = [chapter_file] if chapter_file.exists() else []
         else:
-            # Get all chapter files
-            chapter_files = sorted(book_dir.glob("*.json"), key=lambda x: int(x.stem))
+            # Get all chapter files (from the corpus store's file table)
+            chapter_files = sorted(get_corpus_store().file_paths(source='oe', book=book_dir.name),
+                                   key=lambda x: int(x.stem))
 
         # Create directory for the book if it doesn't exist
         book_id = BookMapper.get_book_id(book_info)
@@ -205,23 +227,20 @@ class VerseProcessor:
 
             try:
                 verses = self.process_oe_file(book_key, chapter_file, morphus_senses)
-
-                # Accumulate verses in consolidated structure
-                for verse in verses:
-                    chapter = str(verse['chapter'])
-                    verse_num = str(verse['verse'])
-
-                    if chapter not in book_data:
-                        book_data[chapter] = {}
-                    book_data[chapter][verse_num] = verse
-
-                    total_verses += 1
-
-                if verses and verbose:
-                    print(f"  ✅ Chapter {chapter_file.stem}: {len(verses)} verses")
-
             except Exception as e:
                 print(f"  ❌ Error processing {chapter_file}: {e}")
-                total_errors += 1
+                stats['errors'] += 1
+                continue
+
+            # Group the file's verses by chapter
+            chapters = {}
+            for verse in verses:
+                chapters.setdefault(str(verse['chapter']), {})[str(verse['verse'])] = verse
+                stats['verses'] += 1
+
+            if verses and verbose:
+                print(f"  ✅ Chapter {chapter_file.stem}: {len(verses)} verses")
 
-        return total_verses, total_errors, book_data
+            for chapter in sorted(chapters, key=int):
+                chapter_verses = chapters[chapter]
+                yield chapter, {verse: chapter_verses[verse] for verse in sorted(chapter_verses, key=int)}
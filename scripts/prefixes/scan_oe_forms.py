@@ -16,13 +16,15 @@ Options:
 """
 
 import argparse
-import glob
 import json
 import os
 import sys
 from collections import defaultdict
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'dict'))
+from corpus_store import get_corpus_store, load_chapter
+
 # Inseparable Hebrew prefixes (only these - no standalone particles)
 HEBREW_PREFIXES = {'Hb', 'Hd', 'Hc', 'Hl', 'Hm', 'Hk', 'Ht'}
 
@@ -69,8 +71,7 @@ def scan_oe_file(file_path, verbose=False):
     form_counts = defaultdict(lambda: defaultdict(int))
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            verses = json.load(f)
+        verses = load_chapter(file_path)
 
         if verbose:
             print(f"Scanning {file_path}: {len(verses)} verses")
@@ -196,20 +197,12 @@ def create_forms_lookup(form_counts, entries_dir, output_path, dry_run=False):
     print(f"Created forms lookup: {output_path} ({len(lookup_dict)} forms)")
 
 def get_oe_files(test_mode=False, book=None):
-    """Get list of OE files to scan"""
+    """Get list of OE files to scan (from the corpus store's file table)"""
     if test_mode:
         return [os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'oe', 'genesis', '1.json')]
 
-    script_dir = os.path.dirname(__file__)
-    if book:
-        pattern = os.path.join(script_dir, '..', '..', 'data', 'oe', book.lower(), '*.json')
-    else:
-        pattern = os.path.join(script_dir, '..', '..', 'data', 'oe', '**', '*.json')
-
-    files = glob.glob(pattern, recursive=True)
-    # Exclude raw directory (different data structure)
-    files = [f for f in files if '/raw/' not in f]
-    return sorted(files)
+    paths = get_corpus_store().file_paths(source='oe', book=book.lower() if book else None)
+    return [str(path) for path in paths]
 
 def main():
     parser = argparse.ArgumentParser(description='Scan OE files for Hebrew prefix forms')
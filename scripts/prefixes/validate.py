@@ -14,13 +14,15 @@ Options:
 """
 
 import argparse
-import glob
 import json
 import os
 import sys
 from collections import defaultdict
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'dict'))
+from corpus_store import get_corpus_store, load_chapter
+
 # Valid Hebrew prefix IDs (inseparable prefixes only)
 VALID_PREFIX_IDS = {
     'Hb', 'Hd', 'Hc', 'Hl', 'Hm', 'Hk', 'Ht'
@@ -72,8 +74,7 @@ def validate_oe_file(file_path, particle_entries, verbose=False):
     }
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            verses = json.load(f)
+        verses = load_chapter(file_path)
 
         for verse in verses:
             for word in verse.get('words', []):
@@ -199,21 +200,11 @@ def generate_report(particle_issues, oe_stats, oe_issues, lookup_issues, test_mo
         return True
 
 def get_oe_files(test_mode=False, book=None):
-    """Get list of OE files to validate"""
+    """Get list of OE files to validate (from the corpus store's file table)"""
     if test_mode:
-        script_dir = os.path.dirname(__file__)
-        pattern = os.path.join(script_dir, '..', '..', 'data', 'oe', 'genesis', '*.json')
-        files = glob.glob(pattern)
-    elif book:
-        pattern = f"data/oe/{book.lower()}/*.json"
-        files = glob.glob(pattern, recursive=True)
-    else:
-        pattern = "data/oe/**/*.json"
-        files = glob.glob(pattern, recursive=True)
-    
-    # Exclude raw directory (different data structure)
-    files = [f for f in files if '/raw/' not in f]
-    return sorted(files)
+        book = 'genesis'
+    paths = get_corpus_store().file_paths(source='oe', book=book.lower() if book else None)
+    return [str(path) for path in paths]
 
 def main():
     parser = argparse.ArgumentParser(description='Validate Hebrew prefix dictionary system')
@@ -0,0 +1,159 @@
+"""
+Memoizing word-analysis cache for the Strong's matcher
+
+Hebrew text repeats heavily, so the prefix/stem/suffix analysis of a cleaned
+word is cached in a bounded LRU keyed by (cleaned word, incoming Strong's
+number, mode). Cached values are immutable tuples; callers format a fresh
+result dictionary for every occurrence.
+"""
+
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Hashable, Tuple
+
+from config import ANALYSIS_CACHE
+
+DEFAULT_MAX_ENTRIES = 50000
+
+# Marker for "analysis not cached" (None is a valid cached value component)
+MISSING = object()
+
+
+class AnalysisCache:
+    """
+    Bounded LRU cache of word analyses with hit/miss/eviction counters.
+
+    Persisted caches are tagged with a key (dictionary digest + matcher
+    version) and discarded on load if the key no longer matches.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize analysis cache.
+
+        Args:
+            max_entries: Maximum number of cached analyses (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable):
+        """
+        Look up an analysis.
+
+        Args:
+            key: (cleaned word, strong number, mode) tuple
+
+        Returns:
+            Cached analysis tuple or MISSING
+        """
+        value = self._entries.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Tuple):
+        """
+        Store an analysis, evicting the least recently used entry if full.
+
+        Args:
+            key: (cleaned word, strong number, mode) tuple
+            value: Immutable analysis tuple
+        """
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def export(self) -> Dict[Hashable, Tuple]:
+        """Return a plain copy of the cached analyses (in LRU order)"""
+        return dict(self._entries)
+
+    def merge(self, entries: Dict[Hashable, Tuple]):
+        """Add analyses produced elsewhere (e.g. by worker processes)"""
+        for key, value in entries.items():
+            self.put(key, value)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache counters"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+        }
+
+    def add_stats(self, stats: Dict[str, int]):
+        """Accumulate counters reported by a worker process"""
+        self.hits += stats.get('hits', 0)
+        self.misses += stats.get('misses', 0)
+        self.evictions += stats.get('evictions', 0)
+
+    def format_stats(self) -> str:
+        """Human-readable counter summary"""
+        lookups = self.hits + self.misses
+        hit_rate = (self.hits / lookups * 100) if lookups else 0.0
+        return (f"Analysis cache: {self.hits} hits, {self.misses} misses "
+                f"({hit_rate:.1f}% hit rate), {self.evictions} evictions, "
+                f"{len(self._entries)} entries")
+
+    def load(self, key: Hashable, path: Path = ANALYSIS_CACHE) -> bool:
+        """
+        Load persisted analyses if they were produced with the same key.
+
+        Args:
+            key: Validity key (dictionary digest, matcher code version)
+            path: Persisted cache file
+
+        Returns:
+            True if entries were loaded
+        """
+        if not path.exists():
+            return False
+
+        try:
+            with open(path, 'rb') as f:
+                stored = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return False
+
+        if not isinstance(stored, dict) or stored.get('key') != key:
+            return False
+
+        self.merge(stored['entries'])
+        return True
+
+    def save(self, key: Hashable, path: Path = ANALYSIS_CACHE):
+        """
+        Persist cached analyses atomically (temp file + rename).
+
+        Args:
+            key: Validity key (dictionary digest, matcher code version)
+            path: Persisted cache file
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'key': key, 'entries': self.export()}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not save analysis cache: {e}")
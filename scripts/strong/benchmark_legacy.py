@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the legacy Delitzsch JSON matching path
+
+Compares the hand-written fallback chain in WordMatcher.match_word with the
+trie-based Decomposer on every word of data/delitzsch/*.json, reporting
+words per second, unmatched rate and how often the two engines agree.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the current directory to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analysis_cache import AnalysisCache
+from config import get_book_files, get_book_name
+from dictionary_loader import get_dictionary_loader
+from hebrew_utils import tokenize_verse
+from morph_trie import Decomposer
+from prefix_detector import PrefixDetector
+from result_formatter import ResultFormatter
+from word_matcher import WordMatcher
+
+
+def load_words(book: str = None):
+    """Load all tokenized words from the Delitzsch JSON books"""
+    words = []
+    for book_path in get_book_files():
+        if book and get_book_name(book_path) != book:
+            continue
+        with open(book_path, 'r', encoding='utf-8') as f:
+            book_data = json.load(f)
+        for chapter in book_data.get('chapters', []):
+            for verse in chapter.get('verses', []):
+                words.extend(tokenize_verse(verse.get('text_nikud', '')))
+    return words
+
+
+def run_engine(name: str, matcher: WordMatcher, words):
+    """Match every word and return (results, stats row)"""
+    start = time.perf_counter()
+    results = [matcher.match_word(word) for word in words]
+    elapsed = time.perf_counter() - start
+
+    unmatched = sum(1 for result in results if not result['strong'])
+    return results, {
+        'engine': name,
+        'seconds': elapsed,
+        'words_per_second': len(words) / elapsed if elapsed else 0.0,
+        'unmatched_rate': unmatched / len(words) * 100 if words else 0.0,
+    }
+
+
+def main():
+    """Benchmark CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="Compare the fallback chain and the trie decomposer on the legacy JSON path"
+    )
+    parser.add_argument('--book', type=str, help='Limit to one book (e.g., acts)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Disable the analysis cache to measure raw matching speed')
+    args = parser.parse_args()
+
+    loader = get_dictionary_loader()
+    words = load_words(args.book)
+    print(f"Words: {len(words)}")
+
+    start = time.perf_counter()
+    decomposer = Decomposer(loader)
+    build_seconds = time.perf_counter() - start
+    print(f"Trie: {decomposer.stems.size} keys built in {build_seconds:.2f}s\n")
+
+    cache_size = 0 if args.no_cache else AnalysisCache().max_entries
+    engines = {
+        'chain': None,
+        'trie': decomposer,
+    }
+
+    all_results = {}
+    rows = []
+    for name, engine_decomposer in engines.items():
+        matcher = WordMatcher(loader, PrefixDetector(loader), ResultFormatter(loader),
+                              AnalysisCache(cache_size), engine_decomposer)
+        all_results[name], row = run_engine(name, matcher, words)
+        rows.append(row)
+
+    print(f"{'engine':<8} {'seconds':>8} {'words/s':>10} {'unmatched':>10}")
+    for row in rows:
+        print(f"{row['engine']:<8} {row['seconds']:>8.2f} {row['words_per_second']:>10.0f} "
+              f"{row['unmatched_rate']:>9.1f}%")
+
+    agree = sum(1 for a, b in zip(all_results['chain'], all_results['trie']) if a == b)
+    print(f"\nIdentical results: {agree}/{len(words)} ({agree / len(words) * 100:.1f}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for Hebrew normalization
+
+Compares the previous regex-plus-join implementation of normalize_for_matching
+(and the regex mark stripping used by the lexicon scripts) with the
+str.translate kernel in hebrew_normalize: uncached, memoized and batch.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the current directory to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_legacy import load_words
+from hebrew_normalize import FINAL_FORMS, PROFILES, normalize, normalize_batch
+
+# Previous implementations
+NIKUD_PATTERN = re.compile(r'[\u0591-\u05BD\u05BF-\u05C7]')
+MARKS_PATTERN = r'[\u0591-\u05C7]'
+
+
+def regex_matching(text):
+    """normalize_for_matching as implemented before the translate tables"""
+    text = text.replace('\u05c2', '')
+    text = text.replace('\u05c1', '')
+    text = NIKUD_PATTERN.sub('', text)
+    return ''.join(FINAL_FORMS.get(char, char) for char in text)
+
+
+def regex_marks(text):
+    """Mark stripping as implemented in build_lexicon.find_bdb_entry"""
+    return re.sub(MARKS_PATTERN, '', text)
+
+
+def time_call(func, words, repeat):
+    """Return (best seconds, results) over repeat runs"""
+    best = None
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = func(words)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main():
+    """Benchmark CLI entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark Hebrew normalization implementations")
+    parser.add_argument('--book', type=str, help='Limit to one book (e.g., acts)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per implementation (best is reported)')
+    args = parser.parse_args()
+
+    words = load_words(args.book)
+    print(f"Words: {len(words)} ({len(set(words))} distinct)\n")
+
+    matching_table = PROFILES['matching']
+    marks_table = PROFILES['marks']
+    cases = [
+        ('matching', 'regex + join', lambda ws: [regex_matching(w) for w in ws]),
+        ('matching', 'translate', lambda ws: [w.translate(matching_table) for w in ws]),
+        ('matching', 'normalize (cached)', lambda ws: [normalize(w, 'matching') for w in ws]),
+        ('matching', 'normalize_batch', lambda ws: normalize_batch(ws, 'matching')),
+        ('marks', 're.sub', lambda ws: [regex_marks(w) for w in ws]),
+        ('marks', 'translate', lambda ws: [w.translate(marks_table) for w in ws]),
+    ]
+
+    baselines = {}
+    print(f"{'profile':<9} {'implementation':<20} {'seconds':>8} {'words/s':>12} {'speedup':>8}")
+    for profile, name, func in cases:
+        seconds, results = time_call(func, words, max(1, args.repeat))
+        if profile not in baselines:
+            baselines[profile] = (seconds, results)
+        base_seconds, base_results = baselines[profile]
+        assert results == base_results, f"{name} differs from the regex implementation"
+        rate = len(words) / seconds if seconds else 0.0
+        print(f"{profile:<9} {name:<20} {seconds:>8.3f} {rate:>12.0f} {base_seconds / seconds:>7.1f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
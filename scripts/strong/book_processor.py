@@ -3,7 +3,7 @@ Book and chapter processing orchestration
 Coordinates SQLite loading, text parsing, word matching, and result formatting
 """
 
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from sqlite_loader import get_sqlite_loader
 from text_parser import get_text_parser
@@ -36,12 +36,15 @@ class BookProcessor:
         self.matcher = word_matcher
         self.formatter = result_formatter
 
-    def process_book_from_sqlite(self, book_name: str) -> List[Dict]:
+    def process_book_from_sqlite(self, book_name: str,
+                                 chapter_filter: Optional[Callable[[int, List[Dict]], bool]] = None) -> List[Dict]:
         """
         Process an entire Delitzsch book from SQLite database.
 
         Args:
             book_name: Name of the book (e.g., "matthew", "acts", "john1")
+            chapter_filter: Optional predicate (chapter_num, verse rows) selecting
+                which chapters to process; others are skipped
 
         Returns:
             List of chapter dictionaries ready for JSON output
@@ -57,20 +60,24 @@ class BookProcessor:
         book_verses = self.sqlite_loader.get_book_verses(book_number)
 
         for chapter_num, verses in book_verses.items():
+            if chapter_filter and not chapter_filter(chapter_num, verses):
+                continue
+
             verses_output = []
+            logged = len(self.matcher.unmatched_log)
 
             for verse_data in verses:
                 verse_num = verse_data['verse']
                 verse_text_with_tags = verse_data['text']
 
-                # Clean text for display (remove tags)
-                clean_verse_text = self.parser.clean_verse_text_for_display(verse_text_with_tags)
+                # Single pass: display text (tags removed), words and their spans
+                clean_verse_text, parsed_words, spans = self.parser.parse_verse(verse_text_with_tags)
 
                 # Process the verse with SQLite data
-                words = self._process_verse_from_sqlite(verse_text_with_tags)
+                words = self._process_verse_from_sqlite(parsed_words)
 
                 # Add "/" separators for prefixes in the Hebrew text
-                hebrew_with_separators = self.formatter.add_prefix_separators(clean_verse_text, words)
+                hebrew_with_separators = self.formatter.add_prefix_separators(clean_verse_text, words, spans)
 
                 verse_output = self.formatter.format_verse(
                     verse_num=verse_num,
@@ -80,6 +87,10 @@ class BookProcessor:
                 )
                 verses_output.append(verse_output)
 
+            # Tag this chapter's unmatched words so the log can be merged per chapter
+            for item in self.matcher.unmatched_log[logged:]:
+                item['chapter'] = f"{book_name}/{chapter_num}"
+
             # Group by chapter
             chapter_output = {
                 'chapter': chapter_num,
@@ -132,17 +143,16 @@ class BookProcessor:
 
         return chapters_output
 
-    def _process_verse_from_sqlite(self, verse_text: str) -> List[Dict]:
+    def _process_verse_from_sqlite(self, parsed_words: List[Dict]) -> List[Dict]:
         """
-        Process all words in a verse from SQLite text with embedded Strong's tags.
+        Process all words in a verse parsed from SQLite text with embedded Strong's tags.
 
         Args:
-            verse_text: Full Hebrew verse text with <S>NNNN</S> tags
+            parsed_words: Word entries from TextParser.parse_verse
 
         Returns:
             List of word dictionaries with text, strong, prefixes
         """
-        parsed_words = self.parser.parse_verse_text(verse_text)
         processed_words = []
 
         for word_data in parsed_words:
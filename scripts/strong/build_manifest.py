@@ -0,0 +1,210 @@
+"""
+Build manifest for incremental Strong's matching
+
+Records, for every output chapter, a hash of its input verse rows, the
+dictionary content digest and the matcher code version it was built with,
+plus the size/mtime of the written file. A re-run only rebuilds chapters
+whose record no longer matches.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import BUILD_MANIFEST
+
+MANIFEST_VERSION = 1
+
+# Modules whose source defines the matcher output
+MATCHER_MODULES = [
+    'book_processor.py',
+    'hebrew_normalize.py',
+    'hebrew_utils.py',
+    'prefix_detector.py',
+    'result_formatter.py',
+    'text_parser.py',
+    'word_matcher.py',
+]
+
+
+def hash_chapter_rows(verses: List[Dict]) -> str:
+    """
+    Hash the input verse rows of a chapter.
+
+    Args:
+        verses: List of {'verse': int, 'text': str} rows from SQLite
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for verse in verses:
+        digest.update(f"{verse['verse']}\t{verse['text']}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def matcher_code_version(matcher_version: int) -> str:
+    """
+    Version string for the matcher code: MATCHER_VERSION plus a hash of the
+    matcher module sources, so any code change invalidates outputs.
+    """
+    digest = hashlib.sha256(str(matcher_version).encode('utf-8'))
+    module_dir = Path(__file__).parent
+    for module in MATCHER_MODULES:
+        digest.update((module_dir / module).read_bytes())
+    return f"{matcher_version}-{digest.hexdigest()[:16]}"
+
+
+class BuildManifest:
+    """
+    Per-chapter build records keyed by "book/chapter".
+    """
+
+    def __init__(self, path: Path = BUILD_MANIFEST):
+        """
+        Initialize manifest.
+
+        Args:
+            path: Manifest JSON file
+        """
+        self.path = path
+        self.chapters: Dict[str, Dict] = {}
+
+    def load(self):
+        """Load records from disk (missing or unreadable manifests start empty)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == MANIFEST_VERSION:
+            self.chapters = data.get('chapters', {})
+
+    def save(self):
+        """Write records atomically (temp file + rename)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'chapters': self.chapters}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def stale_reason(self, book_name: str, chapter_num: int, input_hash: str,
+                     dictionary: str, code: str, output_file: Path) -> Optional[str]:
+        """
+        Explain why a chapter must be rebuilt.
+
+        Returns:
+            Reason string, or None if the chapter is up to date
+        """
+        record = self.chapters.get(f"{book_name}/{chapter_num}")
+        if record is None:
+            return "not in manifest"
+        if record['input'] != input_hash:
+            return "input verses changed"
+        if record['dictionary'] != dictionary:
+            return "dictionary changed"
+        if record['code'] != code:
+            return "matcher code changed"
+
+        try:
+            stat = output_file.stat()
+        except OSError:
+            return "output missing"
+        if stat.st_size != record['output_size'] or stat.st_mtime_ns != record['output_mtime_ns']:
+            return "output modified"
+
+        return None
+
+    def make_record(self, input_hash: str, dictionary: str, code: str, output_file: Path) -> Dict:
+        """Build a record for a freshly written chapter file"""
+        stat = output_file.stat()
+        return {
+            'input': input_hash,
+            'dictionary': dictionary,
+            'code': code,
+            'output_size': stat.st_size,
+            'output_mtime_ns': stat.st_mtime_ns,
+        }
+
+    def update(self, records: Dict[str, Dict]):
+        """Merge records keyed by "book/chapter" """
+        self.chapters.update(records)
+
+
+class IncrementalBuild:
+    """
+    Selects stale chapters for one run and collects records for rebuilt ones.
+    """
+
+    def __init__(self, manifest: BuildManifest, output_dir: Path, dictionary: str, code: str,
+                 force: bool = False, explain: bool = False):
+        """
+        Initialize incremental build state.
+
+        Args:
+            manifest: Loaded build manifest
+            output_dir: Root output directory (book/chapter.json files)
+            dictionary: Dictionary content digest
+            code: Matcher code version
+            force: Rebuild every chapter regardless of the manifest
+            explain: Print why each chapter is rebuilt
+        """
+        self.manifest = manifest
+        self.output_dir = output_dir
+        self.dictionary = dictionary
+        self.code = code
+        self.force = force
+        self.explain = explain
+
+        self.input_hashes: Dict[str, str] = {}
+        self.records: Dict[str, Dict] = {}
+        self.rebuilt = 0
+        self.skipped = 0
+
+    def output_file(self, book_name: str, chapter_num: int) -> Path:
+        """Output path of a chapter"""
+        return self.output_dir / book_name / f"{chapter_num}.json"
+
+    def is_stale(self, book_name: str, chapter_num: int, verses: List[Dict]) -> bool:
+        """
+        Decide whether a chapter must be rebuilt (and explain why if requested).
+
+        Args:
+            book_name: Book name
+            chapter_num: Chapter number
+            verses: Input verse rows for the chapter
+
+        Returns:
+            True if the chapter must be rebuilt
+        """
+        input_hash = hash_chapter_rows(verses)
+        self.input_hashes[f"{book_name}/{chapter_num}"] = input_hash
+
+        if self.force:
+            reason = "forced"
+        else:
+            reason = self.manifest.stale_reason(book_name, chapter_num, input_hash, self.dictionary,
+                                                self.code, self.output_file(book_name, chapter_num))
+
+        if reason is None:
+            self.skipped += 1
+            return False
+
+        self.rebuilt += 1
+        if self.explain:
+            print(f"Rebuild {book_name}/{chapter_num}: {reason}")
+        return True
+
+    def record(self, book_name: str, chapter_num: int):
+        """Record a chapter that was just written"""
+        key = f"{book_name}/{chapter_num}"
+        self.records[key] = self.manifest.make_record(
+            self.input_hashes[key], self.dictionary, self.code, self.output_file(book_name, chapter_num))
+
+    def add_counts(self, rebuilt: int, skipped: int):
+        """Accumulate chapter counts reported by a worker process"""
+        self.rebuilt += rebuilt
+        self.skipped += skipped
@@ -22,12 +22,21 @@ ROOTS_JSON = DICT_DIR / "lexicon" / "roots.pretty.json"
 PREFIX_FORMS_JSON = DICT_DIR / "prefixes" / "forms_lookup.json"
 PREFIX_ENTRIES_DIR = DICT_DIR / "prefixes" / "entries"
 
+# Compiled dictionary snapshot (rebuilt automatically when sources change)
+CACHE_DIR = PROJECT_ROOT / "scripts" / "strong" / ".cache"
+DICTIONARY_SNAPSHOT = CACHE_DIR / "dictionary_snapshot.pickle"
+ANALYSIS_CACHE = CACHE_DIR / "analysis_cache.pickle"
+BUILD_MANIFEST = CACHE_DIR / "build_manifest.json"
+
 # Output directory
 OUTPUT_DIR = DATA_DIR / "delitzsch_parsed"
 
 # Log file
 UNMATCHED_WORDS_LOG = PROJECT_ROOT / "scripts" / "strong" / "unmatched_words.log"
 
+# Debug trace sink (NDJSON, only written when tracing is enabled)
+TRACE_LOG = PROJECT_ROOT / "scripts" / "strong" / "trace.ndjson"
+
 # SQLite database
 SQLITE_DB = DELITZSCH_DIR / "raw" / ".SQLite3"
 
@@ -1,40 +1,251 @@
 """
-Debug logging utility for Hebrew matcher
-Writes NDJSON logs to debug.log file
+Debug tracing for Hebrew matcher
+Buffers structured trace events in memory and writes them as NDJSON batches
+
+Tracing is off by default. When it is off, call sites guarded by
+``tracer.enabled`` skip building their payloads, so a full run does not
+touch the filesystem per word. Enable it through the CLI (``--trace``) or
+environment variables:
+
+    DAVAR_TRACE=debug                   # off | summary | debug
+    DAVAR_TRACE_FILE=/tmp/trace.ndjson  # NDJSON sink path
+    DAVAR_TRACE_SAMPLE=A=0.1,B=0.5      # per-hypothesis sampling rates
 """
+import atexit
 import json
-import time
 import os
+import threading
+import time
+from collections import deque
 from pathlib import Path
+from typing import Dict, Optional
 
-# Use the exact path from system reminder: /Users/jhonny/davar/.cursor/debug.log
-# Fallback to workspace root if .cursor not accessible  
-DEBUG_LOG_PATH = Path('/Users/jhonny/davar/.cursor/debug.log')
-FALLBACK_LOG_PATH = Path('/Users/jhonny/davar/debug.log')
+from config import TRACE_LOG
 
-def debug_log(location: str, message: str, data: dict = None, hypothesis_id: str = None, run_id: str = 'debug-unmatched'):
-    """Write a debug log entry in NDJSON format"""
-    log_entry = {
-        'id': f"log_{int(time.time() * 1000)}",
-        'timestamp': int(time.time() * 1000),
-        'location': location,
-        'message': message,
-        'data': data or {},
-        'sessionId': 'debug-session',
-        'runId': run_id,
-        'hypothesisId': hypothesis_id
-    }
-    
-    # Try .cursor/debug.log first, fallback to workspace root
-    log_path = DEBUG_LOG_PATH
-    try:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(log_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
-    except (PermissionError, OSError, FileNotFoundError):
-        # Fallback to workspace root if .cursor not accessible
+# Trace levels (higher = more detail)
+TRACE_OFF = 0
+TRACE_SUMMARY = 1   # Match outcomes only
+TRACE_DEBUG = 2     # Every intermediate matching step
+
+TRACE_LEVELS = {
+    'off': TRACE_OFF,
+    'summary': TRACE_SUMMARY,
+    'debug': TRACE_DEBUG,
+}
+
+# Ring buffer and writer defaults
+DEFAULT_BUFFER_SIZE = 50000
+DEFAULT_BATCH_SIZE = 2000
+DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+
+
+def parse_sample_rates(spec: Optional[str]) -> Dict[str, float]:
+    """
+    Parse a sampling spec like "A=0.1,B=0.5" into {hypothesis_id: rate}.
+
+    Args:
+        spec: Comma-separated hypothesis=rate pairs
+
+    Returns:
+        Dictionary of sampling rates clamped to [0, 1]
+    """
+    rates = {}
+    if not spec:
+        return rates
+
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '=' not in part:
+            raise ValueError(f"Invalid trace sample '{part}', expected HYPOTHESIS=RATE")
+        hypothesis_id, rate = part.split('=', 1)
+        rates[hypothesis_id.strip()] = min(max(float(rate), 0.0), 1.0)
+
+    return rates
+
+
+class Tracer:
+    """
+    Level-gated structured tracer with an in-memory ring buffer.
+
+    Events are appended to a bounded deque and written to the sink in
+    batches by a background thread. If the writer falls behind, the oldest
+    events are dropped and counted instead of blocking the matcher.
+    """
+
+    def __init__(self, level: int = TRACE_OFF, sink_path: Optional[Path] = None,
+                 sample_rates: Optional[Dict[str, float]] = None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        Initialize tracer.
+
+        Args:
+            level: Trace level (TRACE_OFF, TRACE_SUMMARY, TRACE_DEBUG)
+            sink_path: NDJSON output file (defaults to config.TRACE_LOG)
+            sample_rates: Optional {hypothesis_id: rate} sampling map
+            buffer_size: Maximum number of buffered events
+            batch_size: Number of buffered events that triggers an early flush
+            flush_interval: Seconds between background flushes
+        """
+        self.level = TRACE_OFF
+        self.enabled = False
+        self.sink_path = Path(sink_path) if sink_path else TRACE_LOG
+        self.sample_rates: Dict[str, float] = {}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._buffer = deque(maxlen=buffer_size)
+        self._sample_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+
+        self.events_written = 0
+        self.events_dropped = 0
+
+        self.configure(level=level, sample_rates=sample_rates)
+
+    def configure(self, level: Optional[int] = None, sink_path: Optional[Path] = None,
+                  sample_rates: Optional[Dict[str, float]] = None):
+        """
+        Reconfigure tracer level, sink and sampling.
+
+        Args:
+            level: New trace level
+            sink_path: New NDJSON output file
+            sample_rates: New {hypothesis_id: rate} sampling map
+        """
+        if self.enabled:
+            self.flush()
+
+        if level is not None:
+            self.level = level
+        if sink_path is not None:
+            self.sink_path = Path(sink_path)
+        if sample_rates is not None:
+            self.sample_rates = dict(sample_rates)
+            self._sample_counts.clear()
+
+        self.enabled = self.level > TRACE_OFF
+
+    def log(self, location: str, message: str, data: dict = None,
+            hypothesis_id: str = None, level: int = TRACE_DEBUG,
+            run_id: str = 'debug-unmatched'):
+        """
+        Buffer a trace event.
+
+        Args:
+            location: Code location (e.g. "word_matcher.py:match_word")
+            message: Human-readable event description
+            data: Structured event payload
+            hypothesis_id: Hypothesis tag used for grouping and sampling
+            level: Level of this event
+            run_id: Run identifier
+        """
+        if level > self.level:
+            return
+        if hypothesis_id in self.sample_rates and not self._sampled(hypothesis_id):
+            return
+
+        if os.getpid() != self._pid:
+            self._reset_after_fork()
+
+        timestamp = int(time.time() * 1000)
+        event = {
+            'id': f"log_{timestamp}",
+            'timestamp': timestamp,
+            'location': location,
+            'message': message,
+            'data': data or {},
+            'sessionId': 'debug-session',
+            'runId': run_id,
+            'hypothesisId': hypothesis_id
+        }
+
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.events_dropped += 1
+            self._buffer.append(event)
+            pending = len(self._buffer)
+
+        self._ensure_writer()
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _sampled(self, hypothesis_id: str) -> bool:
+        """Deterministically keep a fraction of events for a hypothesis"""
+        rate = self.sample_rates[hypothesis_id]
+        count = self._sample_counts.get(hypothesis_id, 0) + 1
+        self._sample_counts[hypothesis_id] = count
+        return int(count * rate) != int((count - 1) * rate)
+
+    def _ensure_writer(self):
+        """Start the background writer thread on first use"""
+        if self._writer is not None and self._writer.is_alive():
+            return
+        self._writer = threading.Thread(target=self._run_writer, name='trace-writer', daemon=True)
+        self._writer.start()
+
+    def _run_writer(self):
+        """Background loop that flushes the buffer periodically"""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _reset_after_fork(self):
+        """Drop state inherited from the parent process after fork()"""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer = None
+        self._buffer.clear()
+
+    def flush(self):
+        """Write all buffered events to the sink in one batch"""
+        with self._lock:
+            if not self._buffer:
+                return
+            events = list(self._buffer)
+            self._buffer.clear()
+
+        lines = ''.join(json.dumps(event, ensure_ascii=False) + '\n' for event in events)
         try:
-            with open(FALLBACK_LOG_PATH, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
-        except Exception:
-            pass  # Silently fail if logging not possible
+            self.sink_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.sink_path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+            self.events_written += len(events)
+        except OSError:
+            self.events_dropped += len(events)
+
+    def close(self):
+        """Flush remaining events (called automatically at exit)"""
+        if self.enabled and os.getpid() == self._pid:
+            self.flush()
+
+
+def _tracer_from_env() -> Tracer:
+    """Build the global tracer from DAVAR_TRACE* environment variables"""
+    level_name = os.environ.get('DAVAR_TRACE', 'off').lower()
+    if level_name not in TRACE_LEVELS:
+        level_name = 'off'
+    return Tracer(
+        level=TRACE_LEVELS[level_name],
+        sink_path=os.environ.get('DAVAR_TRACE_FILE') or None,
+        sample_rates=parse_sample_rates(os.environ.get('DAVAR_TRACE_SAMPLE')),
+    )
+
+
+# Global tracer instance
+tracer = _tracer_from_env()
+atexit.register(tracer.close)
+
+
+def debug_log(location: str, message: str, data: dict = None, hypothesis_id: str = None, run_id: str = 'debug-unmatched'):
+    """Write a debug log entry in NDJSON format (through the global tracer)"""
+    if tracer.enabled:
+        tracer.log(location, message, data, hypothesis_id, run_id=run_id)
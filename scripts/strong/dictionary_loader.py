@@ -2,32 +2,87 @@
 Dictionary loading and indexing for Delitzsch Strong's Matcher
 """
 
+import hashlib
 import json
-from typing import Dict, List, Tuple
+import os
+import pickle
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-from config import WORDS_JSON, ROOTS_JSON, PREFIX_FORMS_JSON, PREFIX_ENTRIES_DIR
+from config import (
+    WORDS_JSON, ROOTS_JSON, PREFIX_FORMS_JSON, PREFIX_ENTRIES_DIR, DICTIONARY_SNAPSHOT
+)
+from hebrew_normalize import normalize
+
+
+# Bump when the snapshot layout or the derivation of its tables changes
+SNAPSHOT_VERSION = 1
+
+# Modules whose source defines the derived tables (normalization profiles)
+SNAPSHOT_MODULES = ['hebrew_normalize.py']
+
+
+def snapshot_code_hash() -> str:
+    """Hash of the SNAPSHOT_MODULES sources, so a normalization change invalidates the snapshot"""
+    digest = hashlib.sha256()
+    module_dir = Path(__file__).parent
+    for module in SNAPSHOT_MODULES:
+        digest.update((module_dir / module).read_bytes())
+    return digest.hexdigest()[:16]
 
 
 class DictionaryLoader:
     """
     Loads and indexes Hebrew dictionaries for fast lookups.
+
+    The derived lookup tables are cached in a compiled snapshot (pickle)
+    that is validated against the source files' size/mtime and, when those
+    differ, their SHA-256 hashes. A valid snapshot skips JSON parsing and
+    normalization entirely.
     """
 
-    def __init__(self):
+    # Known alternate forms added on top of words.json
+    ALTERNATE_FORMS = {
+        'היא': 'H1931',  # She (alternate of הוא he)
+        'יהי': 'H1961',  # Let it be (jussive form)
+        'תהיה': 'H1961', # You will be
+        'למען': 'H4616', # For the sake of (with prefix)
+    }
+
+    def __init__(self, snapshot_path: Optional[Path] = DICTIONARY_SNAPSHOT):
+        """
+        Initialize dictionary loader.
+
+        Args:
+            snapshot_path: Compiled snapshot location, or None to always load from JSON
+        """
         self.words_by_normalized: Dict[str, str] = {}  # normalized -> H1234
         self.roots_by_normalized: Dict[str, str] = {}  # normalized -> H1234
         self.prefix_forms: Dict[str, List[str]] = {}   # form -> ["Hb"]
         self.prefix_patterns: List[Tuple[str, str]] = []  # [(pattern, id)]
         self.proper_names: set = set()  # Strong's numbers that are proper names
 
+        self.snapshot_path = snapshot_path
+        self.loaded_from_snapshot = False
+        self.source_digest: Optional[str] = None  # Identifies the loaded dictionary content
         self._loaded = False
 
-    def load_all(self):
-        """Load all dictionary data"""
+    def load_all(self, rebuild_snapshot: bool = False):
+        """
+        Load all dictionary data.
+
+        Args:
+            rebuild_snapshot: Ignore any existing snapshot and recompile it
+        """
         if self._loaded:
             return
 
+        if self.snapshot_path and not rebuild_snapshot and self._load_snapshot():
+            self._loaded = True
+            self.loaded_from_snapshot = True
+            print("Dictionary loaded from snapshot.")
+            return
+
         print("Loading words dictionary...")
         self._load_words()
 
@@ -40,6 +95,135 @@ class DictionaryLoader:
         self._loaded = True
         print("Dictionary loading complete.")
 
+        sources = {str(path): self._source_fingerprint(path) for path in self._source_files()}
+        self.source_digest = self._digest_sources(sources)
+        if self.snapshot_path:
+            self._save_snapshot(sources)
+
+    def _source_files(self) -> List[Path]:
+        """Source files the compiled tables are derived from"""
+        return [WORDS_JSON, ROOTS_JSON, PREFIX_FORMS_JSON]
+
+    def _source_fingerprint(self, path: Path, with_hash: bool = True) -> Dict:
+        """
+        Fingerprint a source file.
+
+        Args:
+            path: Source file path
+            with_hash: Also compute the SHA-256 of the file contents
+
+        Returns:
+            Dictionary with size, mtime_ns and (optionally) sha256
+        """
+        if not path.exists():
+            return {'missing': True}
+
+        stat = path.stat()
+        fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        if with_hash:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            fingerprint['sha256'] = digest.hexdigest()
+        return fingerprint
+
+    def _snapshot_key(self) -> Tuple:
+        """Code-side inputs that invalidate the snapshot when changed"""
+        return (SNAPSHOT_VERSION, snapshot_code_hash(), tuple(sorted(self.ALTERNATE_FORMS.items())))
+
+    def _digest_sources(self, sources: Dict[str, Dict]) -> str:
+        """Combine snapshot key and source hashes into one content digest"""
+        digest = hashlib.sha256(repr(self._snapshot_key()).encode('utf-8'))
+        for path in sorted(sources):
+            digest.update(f"{Path(path).name}:{sources[path].get('sha256', 'missing')}".encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load lookup tables from the compiled snapshot if it is still valid.
+
+        Returns:
+            True if the snapshot was valid and loaded
+        """
+        if not self.snapshot_path.exists():
+            return False
+
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return False
+
+        if not isinstance(snapshot, dict) or snapshot.get('key') != self._snapshot_key():
+            return False
+
+        stale_stats = False
+        for path in self._source_files():
+            stored = snapshot['sources'].get(str(path))
+            if stored is None:
+                return False
+
+            current = self._source_fingerprint(path, with_hash=False)
+            if stored.get('missing') or current.get('missing'):
+                if stored.get('missing') != current.get('missing'):
+                    return False
+                continue
+
+            # Fast path: unchanged size and mtime
+            if current['size'] == stored['size'] and current['mtime_ns'] == stored['mtime_ns']:
+                continue
+
+            # Touched but possibly identical content: compare hashes
+            current = self._source_fingerprint(path)
+            if current['sha256'] != stored['sha256']:
+                return False
+            stored.update(current)
+            stale_stats = True
+
+        tables = snapshot['tables']
+        self.words_by_normalized = tables['words_by_normalized']
+        self.roots_by_normalized = tables['roots_by_normalized']
+        self.prefix_forms = tables['prefix_forms']
+        self.proper_names = tables['proper_names']
+        self.source_digest = self._digest_sources(snapshot['sources'])
+
+        if stale_stats:
+            # Refresh stored mtimes so the next load takes the fast path
+            self._write_snapshot(snapshot)
+
+        return True
+
+    def _save_snapshot(self, sources: Dict[str, Dict]):
+        """
+        Compile the current lookup tables into the snapshot file.
+
+        Args:
+            sources: Fingerprints (with hashes) of the source files
+        """
+        snapshot = {
+            'key': self._snapshot_key(),
+            'sources': sources,
+            'tables': {
+                'words_by_normalized': self.words_by_normalized,
+                'roots_by_normalized': self.roots_by_normalized,
+                'prefix_forms': self.prefix_forms,
+                'proper_names': self.proper_names,
+            },
+        }
+        self._write_snapshot(snapshot)
+
+    def _write_snapshot(self, snapshot: Dict):
+        """Atomically write a snapshot (temp file + rename)"""
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"Warning: could not write dictionary snapshot: {e}")
+
     def _load_words(self):
         """Load words.json and build normalized lookup table"""
         if not WORDS_JSON.exists():
@@ -59,14 +243,7 @@ class DictionaryLoader:
                 self.proper_names.add(strong_num)
 
         # Add known alternate forms
-        ALTERNATE_FORMS = {
-            'היא': 'H1931',  # She (alternate of הוא he)
-            'יהי': 'H1961',  # Let it be (jussive form)
-            'תהיה': 'H1961', # You will be
-            'למען': 'H4616', # For the sake of (with prefix)
-        }
-
-        self.words_by_normalized.update(ALTERNATE_FORMS)
+        self.words_by_normalized.update(self.ALTERNATE_FORMS)
 
     def _load_roots(self):
         """Load roots.pretty.json and build normalized lookup table"""
@@ -89,26 +266,8 @@ class DictionaryLoader:
             self.roots_by_normalized[normalized] = strong_num
 
     def _normalize_for_matching(self, text):
-        """Normalize Hebrew text for dictionary matching (copied from hebrew_utils)"""
-        # Import here to avoid circular imports
-        import re
-
-        # Unicode ranges for Hebrew nikud (vowel points and accents)
-        nikud_pattern = re.compile(r'[\u0591-\u05BD\u05BF-\u05C7]')
-
-        # Hebrew final forms mapping for normalization
-        final_forms = {
-            '\u05da': '\u05db',  # ך -> כ
-            '\u05dd': '\u05de',  # ם -> מ
-            '\u05df': '\u05e0',  # ן -> נ
-            '\u05e3': '\u05e4',  # ף -> פ
-            '\u05e5': '\u05e6',  # ץ -> צ
-        }
-
-        # Strip nikud and normalize final forms
-        text = nikud_pattern.sub('', text)
-        text = ''.join(final_forms.get(char, char) for char in text)
-        return text
+        """Normalize Hebrew text for dictionary matching (strip nikud, fold final forms)"""
+        return normalize(text, 'matching')
 
     def _load_prefixes(self):
         """Load prefix forms and entries"""
@@ -186,10 +345,15 @@ class DictionaryLoader:
 # Singleton instance
 _loader_instance = None
 
-def get_dictionary_loader() -> DictionaryLoader:
-    """Get singleton dictionary loader instance"""
+def get_dictionary_loader(rebuild_snapshot: bool = False) -> DictionaryLoader:
+    """
+    Get singleton dictionary loader instance.
+
+    Args:
+        rebuild_snapshot: Recompile the dictionary snapshot on first load
+    """
     global _loader_instance
     if _loader_instance is None:
         _loader_instance = DictionaryLoader()
-        _loader_instance.load_all()
+        _loader_instance.load_all(rebuild_snapshot=rebuild_snapshot)
     return _loader_instance
\ No newline at end of file
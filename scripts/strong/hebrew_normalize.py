@@ -0,0 +1,99 @@
+"""
+Shared Hebrew normalization kernel
+
+Nikud stripping, cantillation stripping, final-form folding and sin/shin dot
+removal are expressed as precomputed ``str.translate`` tables, so each
+normalization is a single C-level pass over the string instead of a regex
+substitution plus a per-character Python join.
+
+Profiles combine these tables:
+
+    matching      drop sin/shin dots, strip nikud, fold finals (dictionary keys)
+    nikud         strip nikud and cantillation, keep maqaf (U+0591-U+05C7 except U+05BE)
+    marks         strip every point, accent and punctuation mark U+0591-U+05C7
+    cantillation  strip cantillation accents only (U+0591-U+05AF), keep vowels
+    finals        fold final forms only (ך ם ן ף ץ -> כ מ נ פ צ)
+    sin_shin      drop sin/shin dots only (U+05C1, U+05C2)
+
+This module has no dependencies, so the lexicon scripts (scripts/dict) can
+import it too.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+MAQAF = '\u05be'
+PASEQ = '\u05c0'
+SHIN_DOT = '\u05c1'
+SIN_DOT = '\u05c2'
+SOF_PASUQ = '\u05c3'
+NUN_HAFUKHA = '\u05c6'
+
+# Punctuation inside the U+0591..U+05C7 mark range (not attached to a letter)
+PUNCTUATION = MAQAF + PASEQ + SOF_PASUQ + NUN_HAFUKHA
+
+# Hebrew final forms mapping for normalization
+FINAL_FORMS = {
+    '\u05da': '\u05db',  # ך -> כ
+    '\u05dd': '\u05de',  # ם -> מ
+    '\u05df': '\u05e0',  # ן -> נ
+    '\u05e3': '\u05e4',  # ף -> פ
+    '\u05e5': '\u05e6',  # ץ -> צ
+}
+
+# Maximum number of memoized normalize() results
+NORMALIZE_CACHE_SIZE = 65536
+
+
+def _deletion_table(first: int, last: int, keep: str = '') -> Dict[int, None]:
+    """Translation table deleting code points first..last (inclusive) except keep"""
+    kept = {ord(char) for char in keep}
+    return {code: None for code in range(first, last + 1) if code not in kept}
+
+
+# Component tables
+NIKUD_TABLE = _deletion_table(0x0591, 0x05C7, keep=MAQAF)
+MARKS_TABLE = _deletion_table(0x0591, 0x05C7)
+CANTILLATION_TABLE = _deletion_table(0x0591, 0x05AF)
+FINALS_TABLE = str.maketrans(FINAL_FORMS)
+SIN_SHIN_TABLE = str.maketrans('', '', SHIN_DOT + SIN_DOT)
+
+# Named profiles (component tables merge into one translate() pass)
+PROFILES = {
+    'matching': {**NIKUD_TABLE, **FINALS_TABLE, **SIN_SHIN_TABLE},
+    'nikud': NIKUD_TABLE,
+    'marks': MARKS_TABLE,
+    'cantillation': CANTILLATION_TABLE,
+    'finals': FINALS_TABLE,
+    'sin_shin': SIN_SHIN_TABLE,
+}
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize(text: str, profile: str = 'matching') -> str:
+    """
+    Normalize Hebrew text with a named profile (memoized).
+
+    Args:
+        text: Hebrew text
+        profile: Profile name (see PROFILES)
+
+    Returns:
+        Normalized text
+    """
+    return text.translate(PROFILES[profile])
+
+
+def normalize_batch(words: Iterable[str], profile: str = 'matching') -> List[str]:
+    """
+    Normalize a list of words with one profile (uncached, one translate per word).
+
+    Args:
+        words: Hebrew words
+        profile: Profile name (see PROFILES)
+
+    Returns:
+        Normalized words in the same order
+    """
+    table = PROFILES[profile]
+    return [word.translate(table) for word in words]
@@ -0,0 +1,256 @@
+"""
+Trie-based morphological decomposition for the legacy Delitzsch matching path
+
+Builds a character trie over every normalized dictionary key (words, then
+roots) and combines it with a small prefix automaton (ו? then ב/ל/כ/מ? then ה?)
+and a reversed suffix trie. For each word, every valid
+(prefix chain, stem, suffix) decomposition is enumerated by walking the
+dictionary trie once from each prefix boundary; the results are ranked and the
+best one is used.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from hebrew_normalize import PUNCTUATION
+from hebrew_utils import SUFFIXES, normalize_final_forms
+
+# Marker key for the value stored at a trie node
+_VALUE = ''
+
+# Nikud code points that decide prefix readings
+HIRIQ = 0x05B4
+TZERE = 0x05B5
+CHOLAM = 0x05B9
+
+# Prefix automaton: (state, consonant) -> next state, in grammar order
+PREFIX_TRANSITIONS = {
+    (0, 'ו'): 1,
+    (0, 'ב'): 2, (0, 'ל'): 2, (0, 'כ'): 2, (0, 'מ'): 2,
+    (1, 'ב'): 2, (1, 'ל'): 2, (1, 'כ'): 2, (1, 'מ'): 2,
+    (0, 'ה'): 3, (1, 'ה'): 3, (2, 'ה'): 3,
+}
+
+PREFIX_IDS = {'ו': 'Hc', 'ב': 'Hb', 'ל': 'Hl', 'כ': 'Hk', 'ה': 'Hd'}
+
+# Prefix + pronominal suffix with no stem (e.g. לָנוּ, בָּכֶם)
+COMPOSITE_SUFFIXES = ('נו', 'כם')
+
+MIN_STEM = 2
+
+
+class Decomposition(NamedTuple):
+    """One (prefix chain, stem, suffix) reading of a word"""
+    prefixes: Tuple[str, ...]
+    stem: str                  # Normalized stem (dictionary key)
+    strong_number: Optional[str]
+    suffix: Optional[str]      # Suffix letters as written (finals preserved)
+    suffix_id: Optional[str]
+    composite: bool = False    # Prefix + suffix with no stem
+
+    def rank(self) -> Tuple:
+        """Sort key: whole word, composite, prefixes only, then with suffix; longer stems first"""
+        if not self.prefixes and not self.suffix_id and not self.composite:
+            category = 0
+        elif self.composite:
+            category = 1
+        elif not self.suffix_id:
+            category = 2
+        else:
+            category = 3
+        return (category, -len(self.stem), len(self.prefixes))
+
+
+class CharTrie:
+    """Character trie mapping normalized keys to Strong's numbers"""
+
+    def __init__(self):
+        self.root: Dict = {}
+        self.size = 0
+
+    def insert(self, key: str, value: str, overwrite: bool = False):
+        """
+        Insert a key.
+
+        Args:
+            key: Normalized key
+            value: Strong's number
+            overwrite: Replace an existing value for the same key
+        """
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        if _VALUE not in node:
+            self.size += 1
+        elif not overwrite:
+            return
+        node[_VALUE] = value
+
+    def walk(self, text: str, start: int):
+        """
+        Yield (end, value) for every key that is a prefix of text[start:].
+
+        Args:
+            text: Normalized text
+            start: Offset to start matching at
+        """
+        node = self.root
+        for end in range(start, len(text)):
+            node = node.get(text[end])
+            if node is None:
+                return
+            if _VALUE in node:
+                yield end + 1, node[_VALUE]
+
+
+class Decomposer:
+    """
+    Enumerates and ranks (prefix chain, stem, suffix) decompositions.
+    """
+
+    def __init__(self, dictionary_loader):
+        """
+        Build the stem trie and suffix trie from a loaded dictionary.
+
+        Args:
+            dictionary_loader: Dictionary loader instance
+        """
+        self.stems = CharTrie()
+        # Words take precedence over roots (same order as get_strong_number)
+        tables = [dictionary_loader.words_by_normalized, dictionary_loader.roots_by_normalized]
+        for table in tables:
+            for key, strong_number in table.items():
+                self.stems.insert(key, strong_number)
+                folded = normalize_final_forms(key)
+                if folded != key:
+                    self.stems.insert(folded, strong_number)
+
+        # Reversed trie of suffixes, keyed on folded letters
+        self.suffixes = CharTrie()
+        for suffix, suffix_id in SUFFIXES.items():
+            self.suffixes.insert(normalize_final_forms(suffix)[::-1], suffix_id)
+
+    def decompose(self, word: str) -> List[Decomposition]:
+        """
+        Enumerate all valid decompositions of a cleaned word, best first.
+
+        Args:
+            word: Cleaned Hebrew word with nikud (sin/shin dots removed)
+
+        Returns:
+            Ranked list of decompositions (empty if none)
+        """
+        consonants, marks = self._split_consonants(word)
+        if not consonants:
+            return []
+
+        letters = ''.join(consonants)
+        normalized = normalize_final_forms(letters)
+        suffix_ends = self._suffix_starts(normalized)
+
+        results = []
+        for start, prefixes in self._prefix_chains(consonants, marks):
+            # Prefix + pronominal suffix with nothing in between
+            remainder = letters[start:]
+            if prefixes and remainder in COMPOSITE_SUFFIXES:
+                results.append(Decomposition(tuple(prefixes), '', None, remainder, None, True))
+
+            for end, strong_number in self.stems.walk(normalized, start):
+                if prefixes and end - start < MIN_STEM:
+                    continue
+                stem = normalized[start:end]
+                if end == len(normalized):
+                    results.append(Decomposition(tuple(prefixes), stem, strong_number, None, None))
+                elif end in suffix_ends and end - start >= MIN_STEM:
+                    results.append(Decomposition(tuple(prefixes), stem, strong_number,
+                                                 letters[end:], suffix_ends[end]))
+
+        results.sort(key=Decomposition.rank)
+        return results
+
+    def best(self, word: str) -> Optional[Decomposition]:
+        """Return the top-ranked decomposition of a word, or None"""
+        results = self.decompose(word)
+        return results[0] if results else None
+
+    def _split_consonants(self, word: str) -> Tuple[List[str], List[str]]:
+        """
+        Split a word into consonants and the nikud attached to each.
+
+        Returns:
+            (consonants, marks) where marks[i] holds the nikud after consonants[i]
+        """
+        consonants = []
+        marks = []
+        for char in word:
+            if 0x0591 <= ord(char) <= 0x05C7 and char not in PUNCTUATION:
+                if marks:
+                    marks[-1] += char
+            else:
+                consonants.append(char)
+                marks.append('')
+        return consonants, marks
+
+    def _suffix_starts(self, normalized: str) -> Dict[int, str]:
+        """
+        Map every offset from which a known suffix runs to the end of the word
+        to that suffix's ID.
+        """
+        starts = {}
+        reversed_text = normalized[::-1]
+        for length, suffix_id in self.suffixes.walk(reversed_text, 0):
+            starts[len(normalized) - length] = suffix_id
+        return starts
+
+    def _prefix_chains(self, consonants: List[str], marks: List[str]) -> List[Tuple[int, List[str]]]:
+        """
+        Run the prefix automaton over the leading consonants.
+
+        Returns:
+            List of (stem start offset, prefix IDs) for every accepted chain,
+            including the empty chain at offset 0
+        """
+        chains = [(0, [])]
+        state = 0
+        pos = 0
+        prefixes = []
+
+        while pos < len(consonants):
+            char = consonants[pos]
+            next_state = PREFIX_TRANSITIONS.get((state, char))
+            if next_state is None:
+                break
+
+            prefix_id, width = self._prefix_reading(char, consonants, marks, pos)
+            if prefix_id is None:
+                break
+
+            prefixes = prefixes + [prefix_id]
+            pos += width
+            state = next_state
+            chains.append((pos, prefixes))
+
+        return chains
+
+    def _prefix_reading(self, char: str, consonants: List[str], marks: List[str],
+                        pos: int) -> Tuple[Optional[str], int]:
+        """
+        Decide the prefix ID for a consonant from its nikud.
+
+        Returns:
+            (prefix_id, consonants consumed) or (None, 0) if the reading is rejected
+        """
+        vowels = {ord(mark) for mark in marks[pos]}
+
+        if char == 'ה':
+            # הִ (hiriq) is Hifil/Hitpael morphology, not the definite article
+            return (None, 0) if HIRIQ in vowels else ('Hd', 1)
+
+        if char == 'מ':
+            if HIRIQ in vowels or TZERE in vowels:
+                return 'HR', 1  # Preposition מִן
+            if (not vowels and pos + 1 < len(consonants) and consonants[pos + 1] == 'ו'
+                    and CHOLAM in {ord(mark) for mark in marks[pos + 1]}):
+                return 'Hm', 2  # Hiphil participle with cholam male (מוֹ)
+            return 'Hm', 1
+
+        return PREFIX_IDS[char], 1
@@ -3,7 +3,7 @@ Result formatting logic for Hebrew word matching
 Formats match results and adds prefix separators to Hebrew text
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class ResultFormatter:
@@ -91,87 +91,98 @@ class ResultFormatter:
 
         return result
 
-    def add_prefix_separators(self, hebrew_text: str, words: List[Dict]) -> str:
+    def add_prefix_separators(self, hebrew_text: str, words: List[Dict],
+                              spans: Optional[List[Optional[Tuple[int, int]]]] = None) -> str:
         """
         Add "/" separators for prefixes in the Hebrew text based on word analysis.
 
         Args:
             hebrew_text: Clean Hebrew text without tags
             words: List of word dictionaries with prefix information
+            spans: Optional (start, end) span of each word in hebrew_text, as
+                produced by TextParser.parse_verse. If None, words are
+                located by searching the text in order.
 
         Returns:
             Hebrew text with "/" separators for prefixes
         """
+        if spans is None:
+            spans = self._locate_words(hebrew_text, words)
+
         result_parts = []
-        remaining_text = hebrew_text
+        pos = 0
 
-        for word_info in words:
-            word_text = word_info['text']
+        for word_info, span in zip(words, spans):
             prefixes = word_info.get('prefixes', [])
+            if not prefixes or span is None:
+                continue
+
+            word_start = span[0]
+            for cut in self._prefix_cut_positions(word_info['text'], prefixes):
+                result_parts.append(hebrew_text[pos:word_start + cut])
+                result_parts.append('/')
+                pos = word_start + cut
 
-            # Find the word in remaining text
-            word_start = remaining_text.find(word_text)
+        if not result_parts:
+            return hebrew_text
 
+        result_parts.append(hebrew_text[pos:])
+        return ''.join(result_parts)
+
+    def _locate_words(self, hebrew_text: str, words: List[Dict]) -> List[Optional[Tuple[int, int]]]:
+        """
+        Find each word's span by searching the text in order.
+        Words that cannot be found get a None span.
+        """
+        spans = []
+        pos = 0
+        for word_info in words:
+            word_text = word_info['text']
+            word_start = hebrew_text.find(word_text, pos)
             if word_start == -1:
+                spans.append(None)
                 continue
+            pos = word_start + len(word_text)
+            spans.append((word_start, pos))
+        return spans
 
-            # Add any text before this word
-            if word_start > 0:
-                result_parts.append(remaining_text[:word_start])
-
-            if prefixes:
-                # Build the word with "/" after each prefix
-                modified_word = ""
-                char_pos = 0
+    def _prefix_cut_positions(self, word_text: str, prefixes: List[str]) -> List[int]:
+        """
+        Compute where "/" separators go inside a word, one after each prefix.
 
-                for prefix_code in prefixes:
-                    if char_pos >= len(word_text):
-                        break
+        Args:
+            word_text: Hebrew word with nikud
+            prefixes: Prefix IDs in order
 
-                    # Add the consonant
-                    modified_word += word_text[char_pos]
+        Returns:
+            Offsets within word_text at which to insert "/"
+        """
+        cuts = []
+        char_pos = 0
+        word_len = len(word_text)
+
+        for prefix_code in prefixes:
+            if char_pos >= word_len:
+                break
+
+            # Skip the consonant and any following nikud
+            char_pos += 1
+            while char_pos < word_len and self._is_nikud_char(word_text[char_pos]):
+                char_pos += 1
+
+            # Special handling for Hm (Hiphil) with cholam male (מוֹ)
+            # The vav is part of the prefix, not the stem
+            if (prefix_code == 'Hm' and char_pos + 1 < word_len
+                    and word_text[char_pos] == 'ו' and ord(word_text[char_pos + 1]) == 0x05B9):
+                char_pos += 2  # Include vav + cholam in the prefix
+                while char_pos < word_len and self._is_nikud_char(word_text[char_pos]):
                     char_pos += 1
 
-                    # Add any following nikud
-                    while char_pos < len(word_text) and self._is_nikud_char(word_text[char_pos]):
-                        modified_word += word_text[char_pos]
-                        char_pos += 1
-
-                    # Special handling for Hm (Hiphil) with cholam male (מוֹ)
-                    # The vav is part of the prefix, not the stem
-                    if prefix_code == 'Hm' and char_pos < len(word_text):
-                        next_char = word_text[char_pos]
-                        if next_char == 'ו':
-                            # Check if followed by cholam
-                            if char_pos + 1 < len(word_text) and ord(word_text[char_pos + 1]) == 0x05B9:
-                                # Include vav + cholam in the prefix
-                                modified_word += word_text[char_pos]  # vav
-                                char_pos += 1
-                                modified_word += word_text[char_pos]  # cholam
-                                char_pos += 1
-                                # Skip any additional nikud
-                                while char_pos < len(word_text) and self._is_nikud_char(word_text[char_pos]):
-                                    modified_word += word_text[char_pos]
-                                    char_pos += 1
-
-                    # Add "/" separator after this prefix
-                    if char_pos < len(word_text):
-                        modified_word += '/'
-
-                # Add the remaining stem
-                modified_word += word_text[char_pos:]
-                result_parts.append(modified_word)
-            else:
-                result_parts.append(word_text)
-
-            # Move past this word in remaining text
-            remaining_text = remaining_text[word_start + len(word_text):]
-
-        # Add any remaining text
-        if remaining_text:
-            result_parts.append(remaining_text)
+            # Separator after this prefix (only if a stem follows)
+            if char_pos < word_len:
+                cuts.append(char_pos)
 
-        return ''.join(result_parts)
+        return cuts
 
     def format_verse(self, verse_num: int, chapter_num: int, hebrew: str, words: List[Dict]) -> Dict:
         """
@@ -9,9 +9,11 @@ with prefix identification. Outputs data in book/chapter.json format.
 import argparse
 import json
 import logging
+import multiprocessing
+import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -22,9 +24,27 @@ from config import (
 from dictionary_loader import get_dictionary_loader
 from prefix_detector import PrefixDetector
 from result_formatter import ResultFormatter
-from word_matcher import WordMatcher
+from word_matcher import WordMatcher, MATCHER_VERSION
+from analysis_cache import AnalysisCache
 from book_processor import BookProcessor
-from sqlite_loader import get_sqlite_loader
+from sqlite_loader import get_sqlite_loader, close_sqlite_loader
+from debug_logger import tracer, parse_sample_rates, TRACE_LEVELS
+from build_manifest import BuildManifest, IncrementalBuild, matcher_code_version
+
+
+# Analysis cache shared by every book processed in this process
+analysis_cache = AnalysisCache()
+
+# Incremental build state for this run (None processes every chapter)
+incremental_build: Optional[IncrementalBuild] = None
+
+
+def analysis_cache_key() -> Tuple[str, str]:
+    """
+    Validity key for persisted analyses: dictionary content + matcher code
+    version (which hashes the matcher sources, as the build manifest does)
+    """
+    return (get_dictionary_loader().source_digest, matcher_code_version(MATCHER_VERSION))
 
 
 def setup_logging(verbose: bool = False):
@@ -36,6 +56,17 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def setup_tracing(level_name: Optional[str], trace_file: Optional[str], trace_sample: Optional[str]):
+    """Configure the matcher tracer from CLI options (overrides DAVAR_TRACE* env vars)"""
+    tracer.configure(
+        level=TRACE_LEVELS[level_name] if level_name else None,
+        sink_path=Path(trace_file) if trace_file else None,
+        sample_rates=parse_sample_rates(trace_sample) if trace_sample else None,
+    )
+    if tracer.enabled:
+        print(f"Tracing enabled ({level_name or 'env'}) -> {tracer.sink_path}")
+
+
 def save_chapter_data(book_name: str, chapter_data: List[dict], dry_run: bool = False):
     """Save processed chapter data to JSON files"""
     book_dir = OUTPUT_DIR / book_name
@@ -49,17 +80,60 @@ def save_chapter_data(book_name: str, chapter_data: List[dict], dry_run: bool =
             continue
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
+            # Atomic write: readers never see a half-written chapter
+            tmp_file = output_file.with_suffix(f".json.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump([chapter], f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, output_file)
             print(f"Saved: {output_file}")
+
+            if incremental_build:
+                incremental_build.record(book_name, chapter_num)
         except Exception as e:
             logging.error(f"Failed to save {output_file}: {e}")
 
 
-def log_unmatched_words(word_matcher: WordMatcher):
+def read_unmatched_log() -> List[Dict]:
+    """Read the entries of the previous unmatched words log"""
+    entries = []
+    if not UNMATCHED_WORDS_LOG.exists():
+        return entries
+
+    item = {}
+    with open(UNMATCHED_WORDS_LOG, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line == "-" * 30:
+                entries.append(item)
+                item = {}
+            elif line.startswith(("Chapter: ", "Word: ", "Stem: ", "Reason: ")):
+                field, value = line.split(": ", 1)
+                item[field.lower()] = value
+    return entries
+
+
+def merge_unmatched_words(unmatched: List[Dict], rebuilt: Set[str], book_order: List[str]) -> List[Dict]:
+    """
+    Combine this run's unmatched words with the previous log.
+
+    Entries of chapters that were not rebuilt are kept from the previous
+    log; rebuilt chapters ("book/chapter" keys) are replaced by this run's
+    entries. The result is in canonical book and chapter order.
+    """
+    kept = [item for item in read_unmatched_log()
+            if item.get('chapter') and item['chapter'] not in rebuilt]
+    order = {name: i for i, name in enumerate(book_order)}
+
+    def chapter_key(item: Dict) -> Tuple[int, int]:
+        book_name, _, chapter_num = item.get('chapter', '').rpartition('/')
+        return order.get(book_name, len(order)), int(chapter_num or 0)
+
+    return sorted(kept + unmatched, key=chapter_key)
+
+
+def log_unmatched_words(unmatched: List[Dict]):
     """Log unmatched words to file"""
-    unmatched = word_matcher.get_unmatched_words()
-    if not unmatched:
+    if not unmatched and not UNMATCHED_WORDS_LOG.exists():
         return
 
     try:
@@ -67,6 +141,8 @@ def log_unmatched_words(word_matcher: WordMatcher):
             f.write("Unmatched words log\n")
             f.write("=" * 50 + "\n\n")
             for item in unmatched:
+                if item.get('chapter'):
+                    f.write(f"Chapter: {item['chapter']}\n")
                 f.write(f"Word: {item['word']}\n")
                 f.write(f"Stem: {item['stem']}\n")
                 f.write(f"Reason: {item['reason']}\n")
@@ -77,8 +153,13 @@ def log_unmatched_words(word_matcher: WordMatcher):
         logging.error(f"Failed to write unmatched words log: {e}")
 
 
-def process_book(book_name: str, dry_run: bool = False, verbose: bool = False) -> bool:
-    """Process a single Delitzsch book from SQLite database"""
+def process_book(book_name: str, dry_run: bool = False, verbose: bool = False,
+                 unmatched: Optional[List[Dict]] = None) -> bool:
+    """
+    Process a single Delitzsch book from SQLite database.
+
+    If an ``unmatched`` list is given, the book's unmatched words are appended to it.
+    """
     if verbose:
         print(f"Processing book: {book_name}")
 
@@ -87,17 +168,23 @@ def process_book(book_name: str, dry_run: bool = False, verbose: bool = False) -
         loader = get_dictionary_loader()
         prefix_detector = PrefixDetector(loader)
         result_formatter = ResultFormatter(loader)
-        word_matcher = WordMatcher(loader, prefix_detector, result_formatter)
+        word_matcher = WordMatcher(loader, prefix_detector, result_formatter, analysis_cache)
         book_processor = BookProcessor(word_matcher, result_formatter)
 
-        # Process the book from SQLite
-        chapters_output = book_processor.process_book_from_sqlite(book_name)
+        # Process the book from SQLite (only stale chapters when building incrementally)
+        chapter_filter = None
+        if incremental_build:
+            def chapter_filter(chapter_num, verses):
+                return incremental_build.is_stale(book_name, chapter_num, verses)
+        chapters_output = book_processor.process_book_from_sqlite(book_name, chapter_filter)
 
         # Save results
         save_chapter_data(book_name, chapters_output, dry_run)
 
-        # Note: Unmatched words logging is not applicable for SQLite processing
-        # since all words have Strong's numbers from the database
+        # Note: Unmatched words are rare for SQLite processing since all
+        # tagged words have Strong's numbers from the database
+        if unmatched is not None:
+            unmatched.extend(word_matcher.get_unmatched_words())
 
         if verbose:
             print(f"Successfully processed {book_name}")
@@ -111,7 +198,83 @@ def process_book(book_name: str, dry_run: bool = False, verbose: bool = False) -
         return False
 
 
-def process_all_books(dry_run: bool = False, verbose: bool = False) -> int:
+def _init_worker():
+    """Pool initializer: open a per-worker read-only SQLite connection"""
+    get_sqlite_loader(read_only=True)
+
+
+def _process_book_worker(task: Tuple[str, bool, bool, bool]) -> Tuple[str, bool, List[Dict], Dict, Dict, Dict]:
+    """
+    Process one book in a worker process.
+
+    Returns its status, unmatched words, analysis cache counters for this
+    book, (when persisting) the worker's cached analyses, and the
+    incremental build records and chapter counts for this book.
+    """
+    book_name, dry_run, verbose, export_cache = task
+    before = analysis_cache.get_stats()
+    unmatched = []
+    build = {}
+    if incremental_build:
+        incremental_build.records.clear()
+        counts_before = (incremental_build.rebuilt, incremental_build.skipped)
+
+    try:
+        success = process_book(book_name, dry_run, verbose, unmatched)
+    finally:
+        # Pool workers exit through os._exit(), so atexit never flushes
+        # their buffered trace events; write them out per book
+        tracer.flush()
+
+    after = analysis_cache.get_stats()
+    stats = {name: after[name] - before[name] for name in ('hits', 'misses', 'evictions')}
+    entries = analysis_cache.export() if export_cache else {}
+    if incremental_build:
+        build = {
+            'records': dict(incremental_build.records),
+            'rebuilt': incremental_build.rebuilt - counts_before[0],
+            'skipped': incremental_build.skipped - counts_before[1],
+        }
+    return book_name, success, unmatched, stats, entries, build
+
+
+def _run_parallel(nt_books: List[Tuple[int, str]], jobs: int, dry_run: bool,
+                  verbose: bool, persist_cache: bool = False) -> Dict[str, Tuple[bool, List[Dict]]]:
+    """
+    Process books in a fork-based process pool.
+
+    The dictionary snapshot is loaded once in the parent and inherited by
+    every worker through fork(). Books are scheduled largest-first so the
+    run takes about as long as the longest single book.
+    """
+    sqlite_loader = get_sqlite_loader()
+    book_sizes = sqlite_loader.get_book_sizes()
+    schedule = sorted(nt_books, key=lambda book: book_sizes.get(book[0], 0), reverse=True)
+
+    # Preload shared state before forking; SQLite connections must not cross fork()
+    get_dictionary_loader()
+    close_sqlite_loader()
+
+    results = {}
+    context = multiprocessing.get_context('fork')
+    with context.Pool(processes=jobs, initializer=_init_worker) as pool:
+        tasks = [(book_name, dry_run, verbose, persist_cache) for _, book_name in schedule]
+        for done, (book_name, success, unmatched, stats, entries, build) in enumerate(
+                pool.imap_unordered(_process_book_worker, tasks), 1):
+            status = "done" if success else "FAILED"
+            print(f"[{done}/{len(tasks)}] {book_name} {status}")
+            results[book_name] = (success, unmatched)
+            analysis_cache.add_stats(stats)
+            analysis_cache.merge(entries)
+            if build:
+                incremental_build.records.update(build['records'])
+                incremental_build.add_counts(build['rebuilt'], build['skipped'])
+
+    return results
+
+
+def process_all_books(dry_run: bool = False, verbose: bool = False, jobs: int = 1,
+                      persist_cache: bool = False) -> int:
     """Process all Delitzsch books from SQLite database"""
     loader = get_sqlite_loader()
     available_books = loader.get_all_books()
@@ -127,21 +290,72 @@ def process_all_books(dry_run: bool = False, verbose: bool = False) -> int:
     if not dry_run:
         ensure_output_dirs()
 
-    success_count = 0
     total_count = len(nt_books)
 
-    for i, (book_number, book_name) in enumerate(nt_books, 1):
-        print(f"[{i}/{total_count}] Processing {book_name}...")
+    if jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        print("Parallel processing requires fork(); falling back to --jobs 1")
+        jobs = 1
 
-        if process_book(book_name, dry_run, verbose):
+    if jobs > 1:
+        print(f"Processing with {jobs} worker processes")
+        results = _run_parallel(nt_books, jobs, dry_run, verbose, persist_cache)
+    else:
+        results = {}
+        for i, (book_number, book_name) in enumerate(nt_books, 1):
+            print(f"[{i}/{total_count}] Processing {book_name}...")
+            unmatched = []
+            success = process_book(book_name, dry_run, verbose, unmatched)
+            results[book_name] = (success, unmatched)
+
+    # Merge results in canonical book order so the summary and log are deterministic
+    success_count = 0
+    all_unmatched = []
+    for book_number, book_name in nt_books:
+        success, unmatched = results.get(book_name, (False, []))
+        if success:
             success_count += 1
         else:
             print(f"Failed to process {book_name}")
+        all_unmatched.extend(unmatched)
+
+    if not dry_run:
+        if incremental_build and not incremental_build.force:
+            # Chapters skipped as up to date keep their entries from the previous log
+            if incremental_build.records:
+                book_order = [book_name for _, book_name in nt_books]
+                log_unmatched_words(merge_unmatched_words(all_unmatched, set(incremental_build.records),
+                                                          book_order))
+        else:
+            log_unmatched_words(all_unmatched)
 
     print(f"\nProcessing complete: {success_count}/{total_count} books successful")
+    print(analysis_cache.format_stats())
     return 0 if success_count == total_count else 1
 
 
+def setup_incremental_build(force: bool, explain: bool) -> IncrementalBuild:
+    """Load the build manifest and create this run's incremental build state"""
+    manifest = BuildManifest()
+    manifest.load()
+    return IncrementalBuild(
+        manifest,
+        OUTPUT_DIR,
+        dictionary=get_dictionary_loader().source_digest,
+        code=matcher_code_version(MATCHER_VERSION),
+        force=force,
+        explain=explain,
+    )
+
+
+def finish_incremental_build(build: IncrementalBuild, dry_run: bool):
+    """Report chapter counts and persist records for rebuilt chapters"""
+    verb = "Would rebuild" if dry_run else "Rebuilt"
+    print(f"{verb} {build.rebuilt} chapters, {build.skipped} up to date")
+    if not dry_run and build.records:
+        build.manifest.update(build.records)
+        build.manifest.save()
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -166,14 +380,81 @@ def main():
         help='Enable verbose output'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes for all-books mode (default: 1)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild every chapter even if the build manifest says it is up to date'
+    )
+
+    parser.add_argument(
+        '--explain',
+        action='store_true',
+        help='Report why each chapter is rebuilt'
+    )
+
+    parser.add_argument(
+        '--analysis-cache-size',
+        type=int,
+        default=analysis_cache.max_entries,
+        help=f'Maximum cached word analyses (default: {analysis_cache.max_entries}, 0 disables)'
+    )
+
+    parser.add_argument(
+        '--persist-analysis-cache',
+        action='store_true',
+        help='Load/save word analyses between runs (scripts/strong/.cache/analysis_cache.pickle)'
+    )
+
+    parser.add_argument(
+        '--rebuild-dict-cache',
+        action='store_true',
+        help='Recompile the dictionary snapshot even if it is up to date'
+    )
+
+    parser.add_argument(
+        '--trace',
+        choices=sorted(TRACE_LEVELS, key=TRACE_LEVELS.get),
+        help='Matcher trace level (default: off, or DAVAR_TRACE)'
+    )
+
+    parser.add_argument(
+        '--trace-file',
+        type=str,
+        help='NDJSON trace output file (default: scripts/strong/trace.ndjson)'
+    )
+
+    parser.add_argument(
+        '--trace-sample',
+        type=str,
+        help='Per-hypothesis trace sampling rates (e.g., A=0.1,B=0.5)'
+    )
+
     args = parser.parse_args()
 
     # Setup logging
     setup_logging(args.verbose)
+    setup_tracing(args.trace, args.trace_file, args.trace_sample)
 
     if args.dry_run:
         print("DRY RUN MODE - No files will be written")
 
+    if args.rebuild_dict_cache:
+        get_dictionary_loader(rebuild_snapshot=True)
+
+    global incremental_build
+    incremental_build = setup_incremental_build(args.force, args.explain)
+
+    analysis_cache.max_entries = max(0, args.analysis_cache_size)
+    if args.persist_analysis_cache and analysis_cache.load(analysis_cache_key()):
+        print(f"Loaded {len(analysis_cache)} cached word analyses")
+
     # Process books
     if args.book:
         # Validate book name exists in SQLite database
@@ -193,11 +474,20 @@ def main():
             output_book_dir.mkdir(parents=True, exist_ok=True)
 
         success = process_book(args.book, args.dry_run, args.verbose)
-        return 0 if success else 1
+        print(analysis_cache.format_stats())
+        exit_code = 0 if success else 1
 
     else:
         # Process all books
-        return process_all_books(args.dry_run, args.verbose)
+        exit_code = process_all_books(args.dry_run, args.verbose, max(1, args.jobs),
+                                      args.persist_analysis_cache)
+
+    finish_incremental_build(incremental_build, args.dry_run)
+
+    if args.persist_analysis_cache:
+        analysis_cache.save(analysis_cache_key())
+
+    return exit_code
 
 
 if __name__ == '__main__':
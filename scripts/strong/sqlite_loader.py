@@ -45,21 +45,27 @@ class SQLiteLoader:
         730: "revelation"
     }
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, read_only: bool = False):
         """
         Initialize SQLite loader.
 
         Args:
             db_path: Path to the SQLite database file
+            read_only: Open the database in read-only mode (used by worker processes)
         """
         self.db_path = db_path
+        self.read_only = read_only
         self.connection = None
         self._connect()
 
     def _connect(self):
         """Establish database connection"""
         try:
-            self.connection = sqlite3.connect(str(self.db_path))
+            if self.read_only:
+                uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                self.connection = sqlite3.connect(uri, uri=True)
+            else:
+                self.connection = sqlite3.connect(str(self.db_path))
             self.connection.row_factory = sqlite3.Row  # Enable column access by name
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to connect to database {self.db_path}: {e}")
@@ -182,6 +188,21 @@ class SQLiteLoader:
             print(f"Database error getting book {book_number}: {e}")
             return {}
 
+    def get_book_sizes(self) -> Dict[int, int]:
+        """
+        Get the number of verses stored for each book.
+
+        Returns:
+            Dictionary mapping book numbers to verse counts
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT book_number, COUNT(*) AS verses FROM verses GROUP BY book_number")
+            return {row['book_number']: row['verses'] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            print(f"Database error getting book sizes: {e}")
+            return {}
+
     def get_all_books(self) -> List[Tuple[int, str]]:
         """
         Get list of all available books.
@@ -203,12 +224,13 @@ class SQLiteLoader:
 # Singleton instance
 _loader_instance = None
 
-def get_sqlite_loader(db_path: Optional[Path] = None) -> SQLiteLoader:
+def get_sqlite_loader(db_path: Optional[Path] = None, read_only: bool = False) -> SQLiteLoader:
     """
     Get singleton SQLite loader instance.
 
     Args:
         db_path: Optional path to database file. If not provided, uses default from config.
+        read_only: Open the connection read-only (only applies when the singleton is created)
 
     Returns:
         SQLiteLoader instance
@@ -219,5 +241,18 @@ def get_sqlite_loader(db_path: Optional[Path] = None) -> SQLiteLoader:
             # Import here to avoid circular imports
             from config import SQLITE_DB
             db_path = SQLITE_DB
-        _loader_instance = SQLiteLoader(db_path)
-    return _loader_instance
\ No newline at end of file
+        _loader_instance = SQLiteLoader(db_path, read_only=read_only)
+    return _loader_instance
+
+
+def close_sqlite_loader():
+    """
+    Close and drop the singleton SQLite loader.
+
+    Must be called before forking worker processes: SQLite connections
+    cannot be shared across fork(), so each worker opens its own.
+    """
+    global _loader_instance
+    if _loader_instance is not None:
+        _loader_instance.close()
+        _loader_instance = None
\ No newline at end of file
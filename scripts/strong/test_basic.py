@@ -6,16 +6,25 @@ Tests the new modular architecture with separate components
 
 import sys
 import os
+import json
+import tempfile
+from pathlib import Path
 
 # Add the scripts directory to Python path for imports
 sys.path.insert(0, os.path.dirname(__file__))
 
 from hebrew_utils import strip_nikud, tokenize_verse, normalize_for_matching
-from dictionary_loader import get_dictionary_loader
+from hebrew_normalize import normalize, normalize_batch
+from dictionary_loader import get_dictionary_loader, DictionaryLoader
 from prefix_detector import PrefixDetector
 from result_formatter import ResultFormatter
 from word_matcher import WordMatcher
 from book_processor import BookProcessor
+from text_parser import TextParser
+from morph_trie import Decomposer
+from analysis_cache import AnalysisCache
+from debug_logger import Tracer, TRACE_OFF, TRACE_SUMMARY, TRACE_DEBUG
+from build_manifest import BuildManifest, IncrementalBuild
 
 
 def test_hebrew_utils():
@@ -43,6 +52,27 @@ def test_hebrew_utils():
     print("✓ Hebrew utilities tests passed\n")
 
 
+def test_hebrew_normalize():
+    """Test translate-table normalization profiles"""
+    print("Testing normalization profiles...")
+
+    # Cantillation (tipcha) + vowels + shin dot + final mem + maqaf
+    word = "שָׁלוֹ֖ם־"
+    assert normalize(word, 'matching') == "שלומ־"
+    assert normalize(word, 'nikud') == "שלום־"
+    assert normalize(word, 'marks') == "שלום"
+    assert normalize(word, 'cantillation') == "שָׁלוֹם־"
+    assert normalize(word, 'finals') == "שָׁלוֹ֖מ־"
+    assert normalize(word, 'sin_shin') == "שָלוֹ֖ם־"
+
+    # Same results as the regex-based helpers, singly and in batch
+    words = ["בְּמַּאֲמָר", "הָרִאשׁוֹן", "כָּתַבְתִּי", word]
+    assert normalize_batch(words) == [normalize_for_matching(w) for w in words]
+    assert normalize_batch(words, 'nikud') == [strip_nikud(w) for w in words]
+
+    print("✓ Normalization profile tests passed\n")
+
+
 def test_dictionary_loading():
     """Test dictionary loading"""
     print("Testing dictionary loading...")
@@ -61,6 +91,41 @@ def test_dictionary_loading():
     print("✓ Dictionary loading tests passed\n")
 
 
+def test_dictionary_snapshot():
+    """Test compiled dictionary snapshot round-trip"""
+    print("Testing dictionary snapshot...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = Path(tmp_dir) / "dictionary_snapshot.pickle"
+
+        fresh = DictionaryLoader(snapshot_path=snapshot_path)
+        fresh.load_all()
+        assert not fresh.loaded_from_snapshot
+        assert snapshot_path.exists()
+
+        cached = DictionaryLoader(snapshot_path=snapshot_path)
+        cached.load_all()
+        assert cached.loaded_from_snapshot
+        assert cached.words_by_normalized == fresh.words_by_normalized
+        assert cached.roots_by_normalized == fresh.roots_by_normalized
+        assert cached.prefix_forms == fresh.prefix_forms
+        assert cached.proper_names == fresh.proper_names
+
+        # A change to the normalization code invalidates the snapshot
+        import dictionary_loader
+        code_hash = dictionary_loader.snapshot_code_hash
+        dictionary_loader.snapshot_code_hash = lambda: 'changed'
+        try:
+            changed = DictionaryLoader(snapshot_path=snapshot_path)
+            changed.load_all()
+            assert not changed.loaded_from_snapshot
+            assert changed.source_digest != fresh.source_digest
+        finally:
+            dictionary_loader.snapshot_code_hash = code_hash
+
+    print("✓ Dictionary snapshot tests passed\n")
+
+
 def test_prefix_detector():
     """Test prefix detection module"""
     print("Testing prefix detector...")
@@ -107,6 +172,79 @@ def test_word_matcher():
     print("✓ Word matcher tests passed\n")
 
 
+def test_analysis_cache():
+    """Test memoized word analysis"""
+    print("Testing analysis cache...")
+
+    loader = get_dictionary_loader()
+    detector = PrefixDetector(loader)
+    formatter = ResultFormatter(loader)
+    cache = AnalysisCache(max_entries=2)
+    matcher = WordMatcher(loader, detector, formatter, cache)
+
+    word = "וְאֵלֶּה"
+    first = matcher.match_word(word)
+    second = matcher.match_word(word)
+    print(f"Cache stats: {cache.get_stats()}")
+    assert first == second
+    assert first is not second
+    assert first['prefixes'] is not second['prefixes']
+    assert cache.hits == 1 and cache.misses == 1
+
+    # Same cleaned word with a known Strong's number is a separate entry
+    with_strong = matcher.match_word_with_strong({'text': word, 'strong': 'H428'})
+    assert with_strong['prefixes'] == ['Hc']
+    assert cache.misses == 2
+
+    # Bounded: a third key evicts the least recently used entry
+    matcher.match_word("בְּמַּאֲמָר")
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+    print("✓ Analysis cache tests passed\n")
+
+
+def test_decomposer():
+    """Test trie-based prefix/stem/suffix decomposition"""
+    print("Testing trie decomposer...")
+
+    class StubLoader:
+        words_by_normalized = {'בית': 'H1004', 'ובבית': 'H9999'}
+        roots_by_normalized = {'אמר': 'H559'}
+
+    decomposer = Decomposer(StubLoader())
+
+    # Whole word ranks above any prefix reading
+    best = decomposer.best("וּבְבֵית")
+    assert best.strong_number == 'H9999' and best.prefixes == ()
+
+    # Prefix chain ו + ב + stem
+    alternatives = decomposer.decompose("וּבְבֵית")
+    assert any(d.prefixes == ('Hc', 'Hb') and d.strong_number == 'H1004' for d in alternatives)
+
+    # Stem + pronominal suffix
+    best = decomposer.best("בֵּיתוֹ")
+    print(f"Decomposition: {best}")
+    assert best.strong_number == 'H1004' and best.suffix_id == 'S3ms'
+
+    # Prefix + suffix with no stem
+    best = decomposer.best("לָנוּ")
+    assert best.composite and best.prefixes == ('Hl',) and best.suffix == 'נו'
+
+    # Mem with hiriq reads as the preposition מִן
+    best = decomposer.best("מִבֵּית")
+    assert best.prefixes == ('HR',) and best.strong_number == 'H1004'
+
+    assert decomposer.best("קקק") is None
+
+    # Paseq, sof pasuq and nun hafukha are punctuation, not nikud of the letter before
+    consonants, marks = decomposer._split_consonants("בֵּית")
+    for mark in ('\u05c0', '\u05c3', '\u05c6'):
+        assert decomposer._split_consonants("בֵּית" + mark) == (consonants + [mark], marks + [''])
+
+    print("✓ Trie decomposer tests passed\n")
+
+
 def test_result_formatter():
     """Test result formatting"""
     print("Testing result formatter...")
@@ -134,6 +272,32 @@ def test_result_formatter():
     print("✓ Result formatter tests passed\n")
 
 
+def test_text_parser():
+    """Test single-pass verse tokenization with display spans"""
+    print("Testing text parser...")
+
+    parser = TextParser()
+    verse = " וְאֵלֶּה<S>428</S> שְׁמוֹת<S>8034</S>  לֵאמֹר<S></S> ׃"
+    display, words, spans = parser.parse_verse(verse)
+    print(f"Display: {display}")
+    print(f"Spans: {spans}")
+
+    assert display == parser.clean_verse_text_for_display(verse)
+    assert words == parser.parse_verse_text(verse)
+    assert [w['strong'] for w in words] == ["H428", "H8034", None, None]
+    for word, (start, end) in zip(words, spans):
+        assert display[start:end] == word['text']
+
+    # Separators from spans match the search-based path
+    formatter = ResultFormatter(get_dictionary_loader())
+    words[0]['prefixes'] = ['Hc']
+    with_spans = formatter.add_prefix_separators(display, words, spans)
+    assert with_spans == formatter.add_prefix_separators(display, words)
+    assert with_spans.startswith("וְ/אֵלֶּה")
+
+    print("✓ Text parser tests passed\n")
+
+
 def test_book_processor():
     """Test book processor integration"""
     print("Testing book processor...")
@@ -153,6 +317,162 @@ def test_book_processor():
     print("✓ Book processor tests passed\n")
 
 
+def test_tracer():
+    """Test buffered tracing, level gating and sampling"""
+    print("Testing tracer...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sink = Path(tmp_dir) / "trace.ndjson"
+
+        # Disabled tracer never touches the sink
+        tracer = Tracer(level=TRACE_OFF, sink_path=sink)
+        assert not tracer.enabled
+        tracer.log('test', 'ignored', {'n': 1}, 'A')
+        tracer.flush()
+        assert not sink.exists()
+
+        # Summary level drops debug events; sampling keeps 1 in 4 for 'B'
+        tracer.configure(level=TRACE_SUMMARY, sample_rates={'B': 0.25})
+        tracer.log('test', 'step', {'n': 1}, 'A')
+        tracer.log('test', 'outcome', {'n': 2}, 'A', level=TRACE_SUMMARY)
+        for i in range(8):
+            tracer.log('test', 'sampled', {'n': i}, 'B', level=TRACE_SUMMARY)
+        tracer.flush()
+
+        events = [json.loads(line) for line in sink.read_text(encoding='utf-8').splitlines()]
+        print(f"Trace events: {len(events)}")
+        assert [e['message'] for e in events].count('step') == 0
+        assert [e['message'] for e in events].count('outcome') == 1
+        assert sum(1 for e in events if e['hypothesisId'] == 'B') == 2
+
+        # Debug level records everything
+        tracer.configure(level=TRACE_DEBUG, sample_rates={})
+        tracer.log('test', 'step', {}, 'A')
+        tracer.close()
+        assert sink.read_text(encoding='utf-8').count('"step"') == 1
+
+    print("✓ Tracer tests passed\n")
+
+
+def _trace_book(book_name, dry_run, verbose, unmatched):
+    """Stand-in for run_matcher.process_book that only records trace events"""
+    import run_matcher
+    for i in range(3):
+        run_matcher.tracer.log('test_basic.py:_trace_book', 'worker event',
+                               {'book': book_name, 'n': i}, 'W')
+    return True
+
+
+def test_tracer_pool_workers():
+    """Test that trace events recorded in fork pool workers reach the sink"""
+    print("Testing tracer in pool workers...")
+
+    import multiprocessing
+    import run_matcher
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        print("fork() not available, skipping\n")
+        return
+
+    tracer = run_matcher.tracer
+    saved = (tracer.level, tracer.sink_path, tracer.sample_rates, tracer.flush_interval)
+    process_book = run_matcher.process_book
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sink = Path(tmp_dir) / "trace.ndjson"
+        try:
+            # A long flush interval leaves events in the workers' buffers
+            tracer.configure(level=TRACE_DEBUG, sink_path=sink, sample_rates={})
+            tracer.flush_interval = 3600
+            run_matcher.process_book = _trace_book
+
+            context = multiprocessing.get_context('fork')
+            with context.Pool(processes=2) as pool:
+                tasks = [(book, True, False, False) for book in ('matthew', 'mark', 'luke', 'john')]
+                results = pool.map(run_matcher._process_book_worker, tasks)
+        finally:
+            run_matcher.process_book = process_book
+            tracer.configure(level=saved[0], sink_path=saved[1], sample_rates=saved[2])
+            tracer.flush_interval = saved[3]
+
+        assert all(success for _, success, *_ in results)
+        events = [json.loads(line) for line in sink.read_text(encoding='utf-8').splitlines()]
+        books = sorted({e['data']['book'] for e in events if e['message'] == 'worker event'})
+        print(f"Worker trace events: {len(events)}")
+        assert len(events) == 12
+        assert books == ['john', 'luke', 'mark', 'matthew']
+
+    print("✓ Tracer pool worker tests passed\n")
+
+
+def test_build_manifest():
+    """Test per-chapter staleness decisions of the build manifest"""
+    print("Testing build manifest...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        manifest = BuildManifest(tmp_path / "manifest.json")
+        verses = [{'verse': 1, 'text': 'בְּרֵאשִׁית<S>7225</S>'}]
+
+        # First run: nothing recorded, chapter is rebuilt and recorded
+        build = IncrementalBuild(manifest, tmp_path, dictionary='d1', code='c1')
+        assert build.is_stale('matthew', 1, verses)
+        output_file = build.output_file('matthew', 1)
+        output_file.parent.mkdir()
+        output_file.write_text('[]', encoding='utf-8')
+        build.record('matthew', 1)
+        manifest.update(build.records)
+        manifest.save()
+
+        # Second run: same inputs are up to date
+        reloaded = BuildManifest(tmp_path / "manifest.json")
+        reloaded.load()
+        build = IncrementalBuild(reloaded, tmp_path, dictionary='d1', code='c1')
+        assert not build.is_stale('matthew', 1, verses)
+        assert build.rebuilt == 0 and build.skipped == 1
+
+        # Any changed input, dictionary, code or output makes it stale
+        changed = [{'verse': 1, 'text': 'בְּרֵאשִׁית<S>7226</S>'}]
+        assert build.is_stale('matthew', 1, changed)
+        assert IncrementalBuild(reloaded, tmp_path, dictionary='d2', code='c1').is_stale('matthew', 1, verses)
+        assert IncrementalBuild(reloaded, tmp_path, dictionary='d1', code='c2').is_stale('matthew', 1, verses)
+        assert IncrementalBuild(reloaded, tmp_path, dictionary='d1', code='c1', force=True).is_stale('matthew', 1, verses)
+        output_file.write_text('[ ]', encoding='utf-8')
+        assert build.is_stale('matthew', 1, verses)
+
+    print("✓ Build manifest tests passed\n")
+
+
+def test_unmatched_log_merge():
+    """Test that an incremental run keeps unmatched words of skipped chapters"""
+    print("Testing unmatched words log merge...")
+
+    import run_matcher
+
+    log_path = run_matcher.UNMATCHED_WORDS_LOG
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run_matcher.UNMATCHED_WORDS_LOG = Path(tmp_dir) / "unmatched_words.log"
+        try:
+            def item(word, chapter):
+                return {'word': word, 'stem': word, 'reason': 'no match', 'chapter': chapter}
+
+            run_matcher.log_unmatched_words([item('א', 'matthew/1'), item('ב', 'matthew/2'), item('ג', 'mark/1')])
+
+            # Only matthew/2 was rebuilt: its old entry is replaced, the others are kept
+            merged = run_matcher.merge_unmatched_words([item('ד', 'matthew/2')], {'matthew/2'}, ['matthew', 'mark'])
+            assert [(i['word'], i['chapter']) for i in merged] == [
+                ('א', 'matthew/1'), ('ד', 'matthew/2'), ('ג', 'mark/1')]
+
+            # A rebuilt chapter without unmatched words drops its old entries
+            merged = run_matcher.merge_unmatched_words([], {'matthew/1', 'mark/1'}, ['matthew', 'mark'])
+            run_matcher.log_unmatched_words(merged)
+            assert run_matcher.read_unmatched_log() == [item('ב', 'matthew/2')]
+        finally:
+            run_matcher.UNMATCHED_WORDS_LOG = log_path
+
+    print("✓ Unmatched words log merge tests passed\n")
+
+
 def main():
     """Run all tests"""
     print("Running Delitzsch Strong's Matcher tests...\n")
@@ -160,11 +480,20 @@ def main():
 
     try:
         test_hebrew_utils()
+        test_hebrew_normalize()
         test_dictionary_loading()
+        test_dictionary_snapshot()
         test_prefix_detector()
         test_result_formatter()
+        test_text_parser()
         test_word_matcher()
+        test_analysis_cache()
+        test_decomposer()
         test_book_processor()
+        test_tracer()
+        test_tracer_pool_workers()
+        test_build_manifest()
+        test_unmatched_log_merge()
 
         print("🎉 All tests passed!")
         print("✓ New modular architecture is working correctly")
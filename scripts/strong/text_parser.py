@@ -7,8 +7,6 @@ Parses Hebrew text with embedded <S>NNNN</S> Strong's tags from SQLite database.
 import re
 from typing import Dict, List, Optional, Tuple
 
-from hebrew_utils import strip_nikud
-
 
 class TextParser:
     """
@@ -19,9 +17,107 @@ class TextParser:
     # Captures: (word_without_tags, strong_number) or (word_without_tags, None)
     STRONG_TAG_PATTERN = re.compile(r'([^<\s]+)<S>(\d*)</S>')
 
+    # Bare Strong's tag (removed from display text)
+    TAG_PATTERN = re.compile(r'<S>\d*</S>')
+
+    # Untagged whitespace-delimited word
+    UNTAGGED_WORD_PATTERN = re.compile(r'\S+')
+
     def __init__(self):
         pass
 
+    def parse_verse(self, verse_text: str) -> Tuple[str, List[Dict], Optional[List[Tuple[int, int]]]]:
+        """
+        Tokenize a tagged verse in a single left-to-right pass.
+
+        Produces the display text (tags removed, stripped), the word entries
+        in verse order, and each word's (start, end) span in the display text.
+        For malformed text where tags overlap or sit inside words, spans is
+        None and callers fall back to searching the display text.
+
+        Args:
+            verse_text: Hebrew text with <S>NNNN</S> tags
+
+        Returns:
+            Tuple of (display_text, word entries, spans or None)
+        """
+        words = []
+        spans = []
+        display_parts = []
+        display_len = 0
+        pos = 0
+        malformed = False
+
+        for match in self.STRONG_TAG_PATTERN.finditer(verse_text):
+            # Untagged words (and whitespace) between the previous match and this one
+            if match.start() > pos:
+                display_len = self._scan_untagged(verse_text, pos, match.start(),
+                                                  words, spans, display_parts, display_len)
+
+            # The matched word with its Strong's number
+            hebrew_word = match.group(1)
+            if '>' in hebrew_word:
+                # Malformed tags run into the word; tag removal is not local
+                malformed = True
+
+            strong_num = match.group(2) if match.group(2) else None
+            words.append(self._create_word_entry(hebrew_word, strong_num))
+            spans.append((display_len, display_len + len(hebrew_word)))
+            display_parts.append(hebrew_word)
+            display_len += len(hebrew_word)
+
+            pos = match.end()
+
+        if pos < len(verse_text):
+            self._scan_untagged(verse_text, pos, len(verse_text),
+                                words, spans, display_parts, display_len)
+
+        # Stray tags inside untagged words (None spans) also break positional mapping
+        if malformed or None in spans:
+            return self.clean_verse_text_for_display(verse_text), words, None
+
+        # Strip the display text and shift spans by the removed leading whitespace
+        raw_display = ''.join(display_parts)
+        display_text = raw_display.strip()
+        lead = len(raw_display) - len(raw_display.lstrip())
+        if lead:
+            spans = [(start - lead, end - lead) for start, end in spans]
+
+        return display_text, words, spans
+
+    def _scan_untagged(self, verse_text: str, start: int, end: int, words: List[Dict],
+                       spans: List, display_parts: List[str], display_len: int) -> int:
+        """
+        Add untagged words in verse_text[start:end] and their display text.
+
+        Returns:
+            Updated display text length
+        """
+        pos = start
+        for match in self.UNTAGGED_WORD_PATTERN.finditer(verse_text, start, end):
+            # Whitespace before the word is kept in the display text
+            if match.start() > pos:
+                display_parts.append(verse_text[pos:match.start()])
+                display_len += match.start() - pos
+
+            word = match.group()
+            words.append(self._create_word_entry(word, None))
+            display_word = self.TAG_PATTERN.sub('', word) if '<' in word else word
+            if display_word == word:
+                spans.append((display_len, display_len + len(word)))
+            else:
+                # Stray tags are removed from the display text, so the word has no span
+                spans.append(None)
+            display_parts.append(display_word)
+            display_len += len(display_word)
+            pos = match.end()
+
+        if end > pos:
+            display_parts.append(verse_text[pos:end])
+            display_len += end - pos
+
+        return display_len
+
     def parse_verse_text(self, verse_text: str) -> List[Dict]:
         """
         Parse a verse text with Strong's tags into word dictionaries.
@@ -33,42 +129,7 @@ class TextParser:
         Returns:
             List of word dictionaries with text, strong, prefixes
         """
-        words = []
-        remaining = verse_text
-
-        # Process the verse text sequentially to maintain word order
-        while remaining:
-            # Try to match a word with Strong's tag
-            match = self.STRONG_TAG_PATTERN.search(remaining)
-
-            if match:
-                # Check if there's untagged text before the match
-                before_match = remaining[:match.start()].strip()
-                if before_match:
-                    # Process untagged words before this match
-                    for word in before_match.split():
-                        word = word.strip()
-                        if word:
-                            word_entry = self._create_word_entry(word, None)
-                            words.append(word_entry)
-
-                # Add the matched word with Strong's number
-                hebrew_word = match.group(1)
-                strong_num = match.group(2) if match.group(2) else None
-                word_entry = self._create_word_entry(hebrew_word, strong_num)
-                words.append(word_entry)
-
-                # Move past this match
-                remaining = remaining[match.end():].lstrip()
-            else:
-                # No more matches - process remaining untagged text
-                for word in remaining.split():
-                    word = word.strip()
-                    if word:
-                        word_entry = self._create_word_entry(word, None)
-                        words.append(word_entry)
-                break
-
+        _, words, _ = self.parse_verse(verse_text)
         return words
 
     def _create_word_entry(self, hebrew_word: str, strong_num: Optional[str]) -> Dict:
@@ -82,9 +143,6 @@ class TextParser:
         Returns:
             Word entry dictionary
         """
-        # Create text_no_nikud by stripping nikud
-        text_no_nikud = strip_nikud(hebrew_word)
-
         # Format Strong's number
         formatted_strong = None
         if strong_num:
@@ -125,7 +183,7 @@ class TextParser:
             Clean Hebrew text without tags
         """
         # Remove all <S>number</S> tags (including empty ones)
-        clean_text = re.sub(r'<S>\d*</S>', '', verse_text)
+        clean_text = self.TAG_PATTERN.sub('', verse_text)
         return clean_text.strip()
 
 
@@ -3,7 +3,7 @@ Core word matching logic for Hebrew words to Strong's numbers
 Handles fallback chain: whole word → prefix stripping → suffix stripping
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from hebrew_utils import (
     normalize_for_matching, 
@@ -13,13 +13,17 @@ from hebrew_utils import (
 )
 from prefix_detector import PrefixDetector
 from result_formatter import ResultFormatter
+from debug_logger import tracer, TRACE_SUMMARY
+from analysis_cache import AnalysisCache, MISSING
+from morph_trie import Decomposer
 
-try:
-    from debug_logger import debug_log
-except ImportError:
-    # Fallback if debug_logger not available
-    def debug_log(*args, **kwargs):
-        pass
+# Bump when matching logic changes so persisted analyses are invalidated
+MATCHER_VERSION = 1
+
+# Cache key modes
+MODE_LEGACY = 'legacy'        # match_word (dictionary lookup)
+MODE_TRIE = 'trie'            # match_word with the trie decomposer
+MODE_WITH_STRONG = 'strong'   # match_word_with_strong (prefix detection only)
 
 
 class MatchResult:
@@ -51,10 +55,15 @@ class WordMatcher:
     2. Try prefix stripping + lookup
     3. Try prefix + suffix stripping + lookup
     4. Return None if all strategies fail
+
+    With a Decomposer, match_word instead ranks every
+    (prefix chain, stem, suffix) decomposition found in one trie walk.
     """
 
     def __init__(self, dictionary_loader, prefix_detector: PrefixDetector, 
-                 result_formatter: ResultFormatter):
+                 result_formatter: ResultFormatter,
+                 analysis_cache: Optional[AnalysisCache] = None,
+                 decomposer: Optional[Decomposer] = None):
         """
         Initialize word matcher.
         
@@ -62,10 +71,14 @@ class WordMatcher:
             dictionary_loader: Dictionary loader instance
             prefix_detector: Prefix detector instance
             result_formatter: Result formatter instance
+            analysis_cache: Shared analysis cache (a private one is created if omitted)
+            decomposer: Optional trie decomposer used by match_word instead of the fallback chain
         """
         self.loader = dictionary_loader
         self.prefix_detector = prefix_detector
         self.formatter = result_formatter
+        self.analysis_cache = analysis_cache if analysis_cache is not None else AnalysisCache()
+        self.decomposer = decomposer
         self.unmatched_log = []
 
     def match_word(self, word: str) -> Dict:
@@ -83,25 +96,60 @@ class WordMatcher:
             Formatted word dictionary with text, strong, prefixes, suffix
         """
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'Starting word processing', {'original_word': word}, 'A')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'Starting word processing', {'original_word': word}, 'A')
         # #endregion
 
         word = clean_word_for_processing(word)
+
+        if self.decomposer:
+            key = (word, None, MODE_TRIE)
+            analyze = self._analyze_word_trie
+        else:
+            key = (word, None, MODE_LEGACY)
+            analyze = self._analyze_word
+
+        analysis = self.analysis_cache.get(key)
+        if analysis is MISSING:
+            analysis = analyze(word)
+            self.analysis_cache.put(key, analysis)
+        elif tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'Analysis cache hit', {'cleaned_word': word, 'analysis': analysis}, 'A')
+
+        strong_number, prefixes, suffix_id, unmatched = analysis
+        if unmatched:
+            self._log_unmatched(word, *unmatched)
+        return self.formatter.format_word_result(word, strong_number, list(prefixes), suffix_id)
+
+    def _analyze_word(self, word: str) -> Tuple:
+        """
+        Run the fallback chain for a cleaned word.
+
+        Args:
+            word: Cleaned Hebrew word with nikud
+
+        Returns:
+            Immutable analysis tuple (strong_number, prefixes, suffix_id, unmatched),
+            where unmatched is a (stem, reason) tuple or None
+        """
         normalized_word = normalize_for_matching(word)
 
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'After cleaning and normalization', {'cleaned_word': word, 'normalized_word': normalized_word}, 'A')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'After cleaning and normalization', {'cleaned_word': word, 'normalized_word': normalized_word}, 'A')
         # #endregion
 
         # STEP 1: Try whole word first (EXPANDED)
         # Try multiple lookup strategies for compound words
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 1: Whole word lookup', {'normalized_word': normalized_word}, 'A')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 1: Whole word lookup', {'normalized_word': normalized_word}, 'A')
         # #endregion
 
         strong_number = self.loader.get_strong_number(normalized_word)
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 1: Normalized lookup result', {'normalized_word': normalized_word, 'strong_number': strong_number}, 'A')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 1: Normalized lookup result', {'normalized_word': normalized_word, 'strong_number': strong_number}, 'A')
         # #endregion
 
         if not strong_number:
@@ -114,38 +162,44 @@ class WordMatcher:
                     if strong_number:
                         # Found it! Return with single prefix
                         # #region agent log
-                        debug_log('word_matcher.py:match_word', 'STEP 1: Found with prefix stripped', {'without_prefix': without_prefix, 'strong_number': strong_number}, 'A')
+                        if tracer.enabled:
+                            tracer.log('word_matcher.py:match_word', 'STEP 1: Found with prefix stripped', {'without_prefix': without_prefix, 'strong_number': strong_number}, 'A', level=TRACE_SUMMARY)
                         # #endregion
                         prefix_id = self.prefix_detector.COMMON_PREFIX_CHARS[prefix_char]
-                        return self.formatter.format_word_result(word, strong_number, [prefix_id], None)
+                        return strong_number, (prefix_id,), None, None
 
         if not strong_number:
             # Try preserving final forms (dictionary might have them)
             preserved_finals = strip_nikud(word)  # strip nikud only, keep finals
             # #region agent log
-            debug_log('word_matcher.py:match_word', 'STEP 1: Trying preserved finals', {'preserved_finals': preserved_finals}, 'A')
+            if tracer.enabled:
+                tracer.log('word_matcher.py:match_word', 'STEP 1: Trying preserved finals', {'preserved_finals': preserved_finals}, 'A')
             # #endregion
 
             strong_number = self.loader.get_strong_number(preserved_finals)
             # #region agent log
-            debug_log('word_matcher.py:match_word', 'STEP 1: Preserved finals lookup result', {'preserved_finals': preserved_finals, 'strong_number': strong_number}, 'A')
+            if tracer.enabled:
+                tracer.log('word_matcher.py:match_word', 'STEP 1: Preserved finals lookup result', {'preserved_finals': preserved_finals, 'strong_number': strong_number}, 'A')
             # #endregion
 
         if strong_number:
             # #region agent log
-            debug_log('word_matcher.py:match_word', 'STEP 1: Whole word match found', {'strong_number': strong_number}, 'A')
+            if tracer.enabled:
+                tracer.log('word_matcher.py:match_word', 'STEP 1: Whole word match found', {'strong_number': strong_number}, 'A', level=TRACE_SUMMARY)
             # #endregion
-            return self.formatter.format_word_result(word, strong_number, [], None)
+            return strong_number, (), None, None
 
         # STEP 2: Try prefix stripping
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 2: Starting prefix stripping', {}, 'B')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 2: Starting prefix stripping', {}, 'B')
         # #endregion
 
         prefixes, stem = self.prefix_detector.identify_prefixes(word)
 
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 2: Prefix stripping result', {'prefixes': prefixes, 'stem': stem}, 'B')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 2: Prefix stripping result', {'prefixes': prefixes, 'stem': stem}, 'B')
         # #endregion
 
         # STEP 4: Check for composite preposition (prefix + suffix only, no stem)
@@ -157,50 +211,57 @@ class WordMatcher:
                 # For empty stem_clean, the suffix is the original stem (just nikud)
                 suffix = stem_clean if stem_clean else stem
                 # #region agent log
-                debug_log('word_matcher.py:match_word', 'STEP 4: Composite preposition match found', {'prefixes': prefixes, 'suffix': suffix}, 'D')
+                if tracer.enabled:
+                    tracer.log('word_matcher.py:match_word', 'STEP 4: Composite preposition match found', {'prefixes': prefixes, 'suffix': suffix}, 'D', level=TRACE_SUMMARY)
                 # #endregion
-                return self.formatter.format_word_result(word, None, prefixes, suffix)
+                return None, tuple(prefixes), suffix, None
 
         # Validate stem after prefix removal
         stem_valid = self._validate_stem(stem)
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 2: Stem validation', {'stem': stem, 'stem_valid': stem_valid}, 'B')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 2: Stem validation', {'stem': stem, 'stem_valid': stem_valid}, 'B')
         # #endregion
 
         if not stem_valid:
             # Prefix detection was likely wrong, log and return null
             # #region agent log
-            debug_log('word_matcher.py:match_word', 'STEP 2: Invalid stem, returning null', {'stem': stem}, 'B')
+            if tracer.enabled:
+                tracer.log('word_matcher.py:match_word', 'STEP 2: Invalid stem, returning null', {'stem': stem}, 'B', level=TRACE_SUMMARY)
             # #endregion
-            self._log_unmatched(word, stem, "invalid stem after prefix removal")
-            return self.formatter.format_word_result(word, None, [], None)
+            return None, (), None, (stem, "invalid stem after prefix removal")
 
         normalized_stem = normalize_for_matching(stem)
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 2: Normalized stem for lookup', {'normalized_stem': normalized_stem}, 'B')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 2: Normalized stem for lookup', {'normalized_stem': normalized_stem}, 'B')
         # #endregion
 
         strong_number = self.loader.get_strong_number(normalized_stem)
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 2: Stem lookup result', {'normalized_stem': normalized_stem, 'strong_number': strong_number}, 'B')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 2: Stem lookup result', {'normalized_stem': normalized_stem, 'strong_number': strong_number}, 'B')
         # #endregion
 
         if strong_number:
             # #region agent log
-            debug_log('word_matcher.py:match_word', 'STEP 2: Prefix stripping match found', {'strong_number': strong_number, 'prefixes': prefixes}, 'B')
+            if tracer.enabled:
+                tracer.log('word_matcher.py:match_word', 'STEP 2: Prefix stripping match found', {'strong_number': strong_number, 'prefixes': prefixes}, 'B', level=TRACE_SUMMARY)
             # #endregion
-            return self.formatter.format_word_result(word, strong_number, prefixes, None)
+            return strong_number, tuple(prefixes), None, None
 
         # STEP 3: Try suffix stripping (BEFORE final form normalization)
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 3: Starting suffix stripping', {'normalized_stem': normalized_stem}, 'C')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 3: Starting suffix stripping', {'normalized_stem': normalized_stem}, 'C')
         # #endregion
 
         # Strip suffix on text with nikud removed but finals preserved
         stem_with_finals = strip_nikud(stem)
         stem_no_suffix, suffix_id = strip_suffix(stem_with_finals)
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'STEP 3: Suffix stripping result', {'stem_with_finals': stem_with_finals, 'stem_no_suffix': stem_no_suffix, 'suffix_id': suffix_id}, 'C')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'STEP 3: Suffix stripping result', {'stem_with_finals': stem_with_finals, 'stem_no_suffix': stem_no_suffix, 'suffix_id': suffix_id}, 'C')
         # #endregion
 
         if suffix_id:
@@ -208,23 +269,48 @@ class WordMatcher:
             stem_normalized = normalize_for_matching(stem_no_suffix)
             strong_number = self.loader.get_strong_number(stem_normalized)
             # #region agent log
-            debug_log('word_matcher.py:match_word', 'STEP 3: Normalized stem lookup result', {'stem_normalized': stem_normalized, 'strong_number': strong_number}, 'C')
+            if tracer.enabled:
+                tracer.log('word_matcher.py:match_word', 'STEP 3: Normalized stem lookup result', {'stem_normalized': stem_normalized, 'strong_number': strong_number}, 'C')
             # #endregion
             if strong_number:
                 # #region agent log
-                debug_log('word_matcher.py:match_word', 'STEP 3: Suffix stripping match found', {'strong_number': strong_number, 'prefixes': prefixes, 'suffix_id': suffix_id}, 'C')
+                if tracer.enabled:
+                    tracer.log('word_matcher.py:match_word', 'STEP 3: Suffix stripping match found', {'strong_number': strong_number, 'prefixes': prefixes, 'suffix_id': suffix_id}, 'C', level=TRACE_SUMMARY)
                 # #endregion
-                return self.formatter.format_word_result(word, strong_number, prefixes, suffix_id)
+                return strong_number, tuple(prefixes), suffix_id, None
 
 
         # All strategies failed
         # #region agent log
-        debug_log('word_matcher.py:match_word', 'All strategies failed', {'word': word, 'stem': stem, 'normalized_stem': normalized_stem, 'stem_no_suffix': stem_no_suffix}, 'E')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word', 'All strategies failed', {'word': word, 'stem': stem, 'normalized_stem': normalized_stem, 'stem_no_suffix': stem_no_suffix}, 'E', level=TRACE_SUMMARY)
         # #endregion
-        self._log_unmatched(word, stem, "no dictionary match")
         # FIX: Don't return prefixes if we couldn't verify the stem
         # If we can't match the stem to a dictionary entry, the prefix detection was likely wrong
-        return self.formatter.format_word_result(word, None, [], None)
+        return None, (), None, (stem, "no dictionary match")
+
+    def _analyze_word_trie(self, word: str) -> Tuple:
+        """
+        Analyze a cleaned word with the trie decomposer.
+
+        Args:
+            word: Cleaned Hebrew word with nikud
+
+        Returns:
+            Immutable analysis tuple (strong_number, prefixes, suffix_id, unmatched)
+        """
+        best = self.decomposer.best(word)
+
+        # #region agent log
+        if tracer.enabled:
+            tracer.log('word_matcher.py:_analyze_word_trie', 'Trie decomposition', {'word': word, 'best': best and best._asdict()}, 'T', level=TRACE_SUMMARY)
+        # #endregion
+
+        if best is None:
+            return None, (), None, (word, "no trie decomposition")
+        if best.composite:
+            return None, best.prefixes, best.suffix, None
+        return best.strong_number, best.prefixes, best.suffix_id, None
 
     def match_word_with_strong(self, word_data: Dict) -> Dict:
         """
@@ -241,23 +327,32 @@ class WordMatcher:
         strong_number = word_data.get('strong')
 
         # #region agent log
-        debug_log('word_matcher.py:match_word_with_strong', 'Processing word with pre-existing Strong number', {'word': original_word, 'strong': strong_number}, 'SQLITE')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word_with_strong', 'Processing word with pre-existing Strong number', {'word': original_word, 'strong': strong_number}, 'SQLITE')
         # #endregion
 
         # Clean word for prefix detection only
         cleaned_word = clean_word_for_processing(original_word)
 
-        # Identify prefixes on the cleaned word
-        # Use conservative mode for words without Strong's numbers (less reliable)
-        has_strong = strong_number is not None
-        prefixes, stem = self.prefix_detector.identify_prefixes(cleaned_word, conservative=not has_strong)
+        key = (cleaned_word, strong_number, MODE_WITH_STRONG)
+        analysis = self.analysis_cache.get(key)
+        if analysis is MISSING:
+            # Identify prefixes on the cleaned word
+            # Use conservative mode for words without Strong's numbers (less reliable)
+            has_strong = strong_number is not None
+            prefixes, stem = self.prefix_detector.identify_prefixes(cleaned_word, conservative=not has_strong)
+            analysis = (tuple(prefixes), stem)
+            self.analysis_cache.put(key, analysis)
+
+        prefixes, stem = analysis
 
         # #region agent log
-        debug_log('word_matcher.py:match_word_with_strong', 'Prefix detection result', {'prefixes': prefixes, 'stem': stem}, 'SQLITE')
+        if tracer.enabled:
+            tracer.log('word_matcher.py:match_word_with_strong', 'Prefix detection result', {'prefixes': prefixes, 'stem': stem}, 'SQLITE')
         # #endregion
 
         # Format the result using the ORIGINAL word text and provided Strong's number
-        return self.formatter.format_word_result_with_strong(original_word, strong_number, prefixes, stem)
+        return self.formatter.format_word_result_with_strong(original_word, strong_number, list(prefixes), stem)
 
     def _validate_stem(self, stem: str) -> bool:
         """
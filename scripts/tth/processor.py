@@ -16,9 +16,9 @@ Features:
 Author: Davar Project
 """
 
-import json
 import re
 import os
+import sys
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional, Union
 from pathlib import Path
@@ -27,6 +27,12 @@ try:
 except ImportError:
     from text_cleaner import TTHTextCleaner
 
+# Streaming JSON writer shared with the dict pipeline (scripts/dict/json_stream.py)
+DICT_SCRIPTS_DIR = Path(__file__).resolve().parent.parent / 'dict'
+if str(DICT_SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(DICT_SCRIPTS_DIR))
+from json_stream import StreamList, write_json_atomic
+
 
 class BookProcessorStrategy:
     """
@@ -2067,26 +2073,23 @@ class TTHProcessor:
         filename = f"{self.book_key}.json"
         filepath = os.path.join(self.output_dir, filename)
 
-        # Group verses by chapter
+        # Group verses by chapter (references only; entries are built as they are written)
         chapters_dict = {}
         for verse in json_data:
-            chapter_num = verse['chapter']
-            if chapter_num not in chapters_dict:
-                chapters_dict[chapter_num] = []
-            # Create verse entry without the chapter field (it's in the parent)
-            verse_entry = {k: v for k, v in verse.items() if k != 'chapter'}
-            chapters_dict[chapter_num].append(verse_entry)
-
-        # Build chapters array sorted by chapter number
-        chapters_array = []
-        for chapter_num in sorted(chapters_dict.keys()):
-            chapters_array.append({
-                'chapter': chapter_num,
-                'verses': chapters_dict[chapter_num]
-            })
+            chapters_dict.setdefault(verse['chapter'], []).append(verse)
+
+        def chapters_array():
+            """Chapters sorted by number, produced one at a time for the streaming writer."""
+            for chapter_num in sorted(chapters_dict.keys()):
+                yield {
+                    'chapter': chapter_num,
+                    # Verse entries without the chapter field (it's in the parent)
+                    'verses': [{k: v for k, v in verse.items() if k != 'chapter'}
+                               for verse in chapters_dict[chapter_num]]
+                }
 
         # Calculate statistics
-        total_chapters = len(chapters_array)
+        total_chapters = len(chapters_dict)
         total_verses = len(json_data)
 
         # Add book metadata with lowercase keys and values
@@ -2111,11 +2114,11 @@ class TTHProcessor:
                 'processed_date': datetime.now().isoformat(),
                 'processor_version': '2.2.0'
             },
-            'chapters': chapters_array
+            'chapters': StreamList(chapters_array())
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(book_data, f, ensure_ascii=False, indent=2)
+        # Stream chapters to a temp file, then rename it into place
+        write_json_atomic(filepath, book_data, ensure_ascii=False, indent=2)
 
         print(f"Saved: {filepath} ({total_verses} verses in {total_chapters} chapters)")
 